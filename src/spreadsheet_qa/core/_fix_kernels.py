@@ -0,0 +1,80 @@
+"""Compiled kernel for the whitespace part of the hygiene fix pack.
+
+Covers the fixes that need neither ``re`` nor ``unicodedata`` — trim,
+collapse_spaces, replace_nbsp and normalize_newlines — in one loop per cell,
+with the same semantics as ``web.app._apply_fixes``.  Compiled with Numba
+when it is installed; callers check ``NUMBA_AVAILABLE`` and otherwise keep
+using the pandas ``.str`` path.
+"""
+
+from __future__ import annotations
+
+try:
+    from numba import njit, prange
+    from numba.typed import List as _TypedList
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Option names handled by the kernel.
+KERNEL_FIXES = frozenset({"trim", "collapse_spaces", "replace_nbsp", "normalize_newlines"})
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def _fix_one(value, do_strip, do_collapse, do_nbsp, do_newlines):  # pragma: no cover - requires numba
+        if do_strip:
+            value = value.strip()
+        parts = []
+        prev_space = False
+        prev_cr = False
+        for ch in value:
+            if do_newlines and prev_cr and ch == "\n":
+                # "\r\n" → "\n": the "\r" was already emitted as "\n"
+                prev_cr = False
+                continue
+            prev_cr = ch == "\r"
+            if do_collapse and ch == " ":
+                # Only literal spaces collapse; NBSP replaced below does not
+                if prev_space:
+                    continue
+                prev_space = True
+                parts.append(ch)
+                continue
+            prev_space = False
+            if do_nbsp and ch == "\u00a0":
+                parts.append(" ")
+            elif do_newlines and ch == "\r":
+                parts.append("\n")
+            else:
+                parts.append(ch)
+        return "".join(parts)
+
+    @njit(parallel=True, cache=True)
+    def _fix_all(values, out, do_strip, do_collapse, do_nbsp, do_newlines):  # pragma: no cover - requires numba
+        for i in prange(len(values)):
+            out[i] = _fix_one(values[i], do_strip, do_collapse, do_nbsp, do_newlines)
+
+
+def apply_whitespace_fixes(values: list[str], opts: dict[str, bool]) -> list[str]:
+    """Apply the kernel-supported fixes enabled in *opts* to every string of *values*.
+
+    Requires Numba (see ``NUMBA_AVAILABLE``).  Options outside
+    ``KERNEL_FIXES`` are ignored.
+    """
+    if not NUMBA_AVAILABLE:
+        raise RuntimeError("numba n'est pas installé")
+    if not values:
+        return []
+    typed = _TypedList(values)
+    out = _TypedList(values)
+    _fix_all(
+        typed,
+        out,
+        bool(opts.get("trim") or opts.get("collapse_spaces")),
+        bool(opts.get("collapse_spaces")),
+        bool(opts.get("replace_nbsp")),
+        bool(opts.get("normalize_newlines")),
+    )
+    return list(out)
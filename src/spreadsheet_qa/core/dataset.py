@@ -1,8 +1,9 @@
 """DatasetLoader: import CSV and XLSX files into a pandas DataFrame.
 
 Handles:
-- Encoding detection via chardet (first 32 KB)
-- Delimiter detection via csv.Sniffer (fallback: ; then ,)
+- Encoding detection: UTF-8 check, then chardet (first 32 KB)
+- Delimiter detection via csv.Sniffer on the first 8 KB (fallback: most frequent candidate)
+- CSV parsing with pandas' C engine, or csv.reader for ragged/unusual files
 - Header row selection (0-based index; rows above it are skipped)
 - Sheet selection for XLSX
 - Returns (DataFrame, DatasetMeta)
@@ -14,6 +15,7 @@ import codecs
 import csv
 import hashlib
 import io
+import itertools
 import os
 from datetime import datetime, timezone
 from pathlib import Path
@@ -25,10 +27,23 @@ import pandas as pd
 from spreadsheet_qa.core.models import DatasetMeta
 
 
+# The fingerprint covers the first 64 KiB; encoding and delimiter detection
+# look at the first 32 KiB and the CSV column count is taken from it. Nothing
+# else needs the raw bytes in memory.
+_HEAD_BYTES = 65536
+# Sample handed to csv.Sniffer for delimiter detection
+_SNIFF_BYTES = 8192
+
 # Suffixes reconnus comme classeurs multi-feuilles (alignés sur ``DatasetLoader.load``).
 _WORKBOOK_SUFFIXES = frozenset({".xlsx", ".xls", ".xlsm", ".ods"})
 
 
+def _read_head(path: Path) -> bytes:
+    """Return the first _HEAD_BYTES bytes of *path* (the whole file if shorter)."""
+    with path.open("rb") as f:
+        return f.read(_HEAD_BYTES)
+
+
 def list_workbook_sheet_names_from_bytes(content: bytes, filename: str) -> list[str]:
     """Liste les noms de feuilles d'un classeur à partir du contenu en mémoire.
 
@@ -89,19 +104,19 @@ class DatasetLoader:
         path = Path(path)
         suffix = path.suffix.lower()
 
-        raw_bytes = path.read_bytes()
-        fingerprint = hashlib.sha256(raw_bytes[:65536]).hexdigest()
+        head = _read_head(path)
+        fingerprint = hashlib.sha256(head).hexdigest()
 
         if suffix in {".xlsx", ".xls", ".xlsm", ".ods"}:
-            df, meta = self._load_xlsx(path, raw_bytes, fingerprint, header_row, sheet_name)
+            df, meta = self._load_xlsx(path, fingerprint, header_row, sheet_name)
         elif suffix in {".csv", ".tsv", ".txt"}:
             df, meta = self._load_csv(
-                path, raw_bytes, fingerprint, header_row, encoding_hint, delimiter_hint
+                path, head, fingerprint, header_row, encoding_hint, delimiter_hint
             )
         else:
             # Try CSV as fallback
             df, meta = self._load_csv(
-                path, raw_bytes, fingerprint, header_row, encoding_hint, delimiter_hint
+                path, head, fingerprint, header_row, encoding_hint, delimiter_hint
             )
 
         return df, meta
@@ -113,7 +128,6 @@ class DatasetLoader:
     def _load_xlsx(
         self,
         path: Path,
-        raw_bytes: bytes,
         fingerprint: str,
         header_row: int,
         sheet_name: str | int | None,
@@ -159,26 +173,28 @@ class DatasetLoader:
     def _load_csv(
         self,
         path: Path,
-        raw_bytes: bytes,
+        head: bytes,
         fingerprint: str,
         header_row: int,
         encoding_hint: str | None,
         delimiter_hint: str | None,
     ) -> tuple[pd.DataFrame, DatasetMeta]:
-        encoding = encoding_hint or self._detect_encoding(raw_bytes)
-        delimiter = delimiter_hint or self._detect_delimiter(raw_bytes, encoding)
-
-        # Use csv.reader directly so ragged rows (e.g. a metadata line that uses
-        # a different delimiter) don't cause pandas to infer the wrong column count
-        # and drop subsequent rows.
-        all_rows = self._read_csv_raw(path, delimiter, encoding)
-        if not all_rows:
-            df_raw = pd.DataFrame(dtype=str)
-        else:
-            max_cols = max(len(r) for r in all_rows)
-            # Pad short rows (e.g. metadata lines) to uniform width
-            padded = [r + [""] * (max_cols - len(r)) for r in all_rows]
-            df_raw = pd.DataFrame(padded, dtype=str)
+        encoding = encoding_hint or self._detect_encoding(head)
+        delimiter = delimiter_hint or self._detect_delimiter(head, encoding)
+
+        df_raw = self._read_csv_fast(path, head, delimiter, encoding)
+        if df_raw is None:
+            # Use csv.reader directly so ragged rows (e.g. a metadata line that uses
+            # a different delimiter) don't cause pandas to infer the wrong column count
+            # and drop subsequent rows.
+            all_rows = self._read_csv_raw(path, delimiter, encoding)
+            if not all_rows:
+                df_raw = pd.DataFrame(dtype=str)
+            else:
+                max_cols = max(len(r) for r in all_rows)
+                # Pad short rows (e.g. metadata lines) to uniform width
+                padded = [r + [""] * (max_cols - len(r)) for r in all_rows]
+                df_raw = pd.DataFrame(padded, dtype=str)
 
         df = self._apply_header_row(df_raw, header_row)
         shape = (len(df), len(df.columns))
@@ -230,6 +246,48 @@ class DatasetLoader:
         # Keep everything as str | NaN for consistency
         return df
 
+    @staticmethod
+    def _read_csv_fast(
+        path: Path, head: bytes, delimiter: str, encoding: str
+    ) -> pd.DataFrame | None:
+        """Read a CSV file with pandas' C parser, or return None.
+
+        The parser is given as many columns as the widest row of *head*, so
+        short rows are padded with "" just like ``_read_csv_raw`` does. When a
+        later row turns out to be wider, pandas raises and the caller falls
+        back to csv.reader.
+        """
+        sample = head.decode(encoding, errors="replace")
+        # The C parser cuts cells at NUL bytes and drops a leading U+FEFF that
+        # the decoder kept: leave those files to csv.reader
+        if "\x00" in sample or sample.startswith("\ufeff"):
+            return None
+        if len(head) == _HEAD_BYTES:
+            # A cut-off last line may be narrower, never wider, than in full
+            sample = sample[: sample.rfind("\n") + 1]
+        try:
+            rows = csv.reader(io.StringIO(sample, newline=""), delimiter=delimiter)
+            width = max((len(row) for row in rows), default=0)
+        except csv.Error:
+            return None
+        if width == 0:
+            return None
+        try:
+            return pd.read_csv(
+                path,
+                sep=delimiter,
+                header=None,
+                names=range(width),
+                dtype=str,
+                engine="c",
+                encoding=encoding,
+                encoding_errors="replace",
+                na_filter=False,
+                skip_blank_lines=False,
+            )
+        except (pd.errors.ParserError, pd.errors.EmptyDataError, UnicodeError):
+            return None
+
     @staticmethod
     def _read_csv_raw(path: Path, delimiter: str, encoding: str) -> list[list[str]]:
         """Read a CSV file into a list of string lists using csv.reader.
@@ -247,6 +305,18 @@ class DatasetLoader:
     @staticmethod
     def _detect_encoding(raw_bytes: bytes) -> str:
         sample = raw_bytes[:32768]
+        # Valid UTF-8 (plain ASCII included) needs no statistical guess; a
+        # sample cut in the middle of a character still counts. NUL bytes
+        # hint at BOM-less UTF-16, which is left to chardet.
+        if sample.startswith(codecs.BOM_UTF8):
+            return "utf-8-sig"
+        if b"\x00" not in sample:
+            try:
+                codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+            except UnicodeDecodeError:
+                pass
+            else:
+                return "utf-8"
         result = chardet.detect(sample)
         encoding = result.get("encoding") or "utf-8"
         confidence = result.get("confidence", 0.0)
@@ -273,7 +343,13 @@ class DatasetLoader:
 
     @staticmethod
     def _detect_delimiter(raw_bytes: bytes, encoding: str) -> str:
-        sample = raw_bytes[:32768].decode(encoding, errors="replace")
+        # csv.Sniffer's regexes get slow on long quoted input: give it a few
+        # KiB of complete lines (a cut-off last line skews its counts)
+        sample = raw_bytes[:_SNIFF_BYTES].decode(encoding, errors="replace")
+        if len(raw_bytes) > _SNIFF_BYTES:
+            last_newline = sample.rfind("\n")
+            if last_newline > 0:
+                sample = sample[: last_newline + 1]
         try:
             dialect = csv.Sniffer().sniff(sample, delimiters=",;\t|")
             return dialect.delimiter
@@ -302,23 +378,20 @@ def preview_header_rows(
             path, header=None, nrows=n, dtype=str, engine="openpyxl"
         )
     else:
-        raw_bytes = path.read_bytes()
-        encoding = encoding_hint or DatasetLoader._detect_encoding(raw_bytes)
-        delimiter = delimiter_hint or DatasetLoader._detect_delimiter(raw_bytes, encoding)
+        head = _read_head(path)
+        encoding = encoding_hint or DatasetLoader._detect_encoding(head)
+        delimiter = delimiter_hint or DatasetLoader._detect_delimiter(head, encoding)
         # Use csv.reader so ragged rows (metadata lines) don't cause parse errors
-        result: list[list[str]] = []
         with path.open(newline="", encoding=encoding, errors="replace") as f:
             reader = csv.reader(f, delimiter=delimiter)
-            for i, row in enumerate(reader):
-                if i >= n:
-                    break
-                result.append([cell if cell is not None else "" for cell in row])
-        return result
-
-    result: list[list[str]] = []
-    for _, row in df_raw.iterrows():
-        result.append([str(v) if pd.notna(v) else "" for v in row])
-    return result
+            return list(itertools.islice(reader, n))
+
+    # pandas (openpyxl in read-only mode, stopping after n rows) formats the
+    # cells exactly as DatasetLoader will
+    return [
+        [str(v) if pd.notna(v) else "" for v in row]
+        for row in df_raw.itertuples(index=False, name=None)
+    ]
 
 
 def get_xlsx_sheet_names(path: str | Path) -> list[str]:
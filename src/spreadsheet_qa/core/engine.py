@@ -98,6 +98,8 @@ class ValidationEngine:
 
         all_issues: list[Issue] = []
         rule_failures: list[RuleFailure] = []
+        # Shared by every per-column rule of this run (see non_blank_cells)
+        non_blank_cache: dict[str, pd.Series] = {}
 
         for rule_cls in self._registry.all_rules():
             rule_inst = rule_cls()
@@ -124,6 +126,7 @@ class ValidationEngine:
                     # A rule_override may disable a specific rule for this column.
                     if not merged_cfg.pop("enabled", True):
                         continue
+                    merged_cfg["_non_blank_cells"] = non_blank_cache
                     try:
                         issues = rule_inst.check(df, col, merged_cfg)
                     except Exception as exc:
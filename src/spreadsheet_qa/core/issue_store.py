@@ -7,10 +7,19 @@ by column for incremental re-validation.
 from __future__ import annotations
 
 from collections import defaultdict
-from typing import Callable, Iterable
+from typing import Callable, Iterable, Sequence
+
+import numpy as np
 
 from spreadsheet_qa.core.models import Issue, IssueStatus, Severity
 
+# Severity → compact rank used by severity_grid() (lower = worse).
+SEVERITY_CODES: dict[Severity, int] = {
+    Severity.ERROR: 0,
+    Severity.WARNING: 1,
+    Severity.SUSPICION: 2,
+}
+
 
 class IssueStore:
     """Thread-unsafe in-memory store for Issue objects.
@@ -23,6 +32,8 @@ class IssueStore:
         # secondary indexes
         self._by_col: dict[str, list[str]] = defaultdict(list)  # col → [issue_id]
         self._by_cell: dict[tuple[int, str], list[str]] = defaultdict(list)  # (row,col) → [ids]
+        # (row,col) → tooltip text; filled on first read, dropped when the cell's issues change
+        self._tooltip_cache: dict[tuple[int, str], str] = {}
 
     # ------------------------------------------------------------------
     # Write
@@ -33,6 +44,7 @@ class IssueStore:
         self._by_id.clear()
         self._by_col.clear()
         self._by_cell.clear()
+        self._tooltip_cache.clear()
         for issue in issues:
             self._insert(issue)
 
@@ -44,6 +56,7 @@ class IssueStore:
                 issue = self._by_id.pop(issue_id, None)
                 if issue is not None:
                     cell_key = (issue.row, issue.col)
+                    self._tooltip_cache.pop(cell_key, None)
                     cell_list = self._by_cell.get(cell_key)
                     if cell_list is not None and issue_id in cell_list:
                         cell_list.remove(issue_id)
@@ -65,16 +78,37 @@ class IssueStore:
         self._by_id[issue.id] = issue
         self._by_col[issue.col].append(issue.id)
         self._by_cell[(issue.row, issue.col)].append(issue.id)
+        self._tooltip_cache.pop((issue.row, issue.col), None)
 
     # ------------------------------------------------------------------
     # Read
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def cell_has_issue(bits: np.ndarray, row: int, col_idx: int) -> bool:
+        """Test one cell of a mask returned by ``has_issue_bits``."""
+        return bool(bits[row, col_idx >> 3] & (0x80 >> (col_idx & 7)))
+
     def by_cell(self, row: int, col: str) -> list[Issue]:
         """Return all issues for a specific cell. O(k) where k is count."""
         ids = self._by_cell.get((row, col), [])
         return [self._by_id[i] for i in ids if i in self._by_id]
 
+    def tooltip_for_cell(self, row: int, col: str) -> str | None:
+        """Return the cell tooltip (first 5 issue messages), or None if no issues.
+
+        The joined string is cached until the cell's issues change, so repeated
+        hovers do not rebuild it.
+        """
+        key = (row, col)
+        text = self._tooltip_cache.get(key)
+        if text is None:
+            issues = self.by_cell(row, col)
+            if not issues:
+                return None
+            text = self._tooltip_cache[key] = "\n".join(i.message for i in issues[:5])
+        return text
+
     def by_column(self, col: str) -> list[Issue]:
         ids = self._by_col.get(col, [])
         return [self._by_id[i] for i in ids if i in self._by_id]
@@ -105,5 +139,54 @@ class IssueStore:
             return None
         return min(i.severity for i in open_issues)
 
+    def severity_grid(self, n_rows: int, columns: Sequence[str]) -> np.ndarray:
+        """Return an ``int8`` grid of the worst OPEN severity per cell.
+
+        Shape is ``(n_rows, len(columns))``; cells without open issues hold
+        ``-1``, others the rank from ``SEVERITY_CODES``.  Row-level issues and
+        issues outside the grid are ignored.
+        """
+        rows, cols, codes = self._cell_positions(n_rows, columns, open_only=True)
+        no_issue = np.int8(len(SEVERITY_CODES))
+        grid = np.full((n_rows, len(columns)), no_issue, dtype=np.int8)
+        if rows.size:
+            np.minimum.at(grid, (rows, cols), codes)
+        grid[grid == no_issue] = -1
+        return grid
+
+    def has_issue_bits(self, n_rows: int, columns: Sequence[str]) -> np.ndarray:
+        """Return a bit-packed ``(n_rows, ceil(len(columns) / 8))`` ``uint8`` mask.
+
+        Bit ``7 - (j & 7)`` of byte ``[row, j >> 3]`` is set when the cell holds
+        any issue, whatever its status (see ``cell_has_issue``).
+        """
+        rows, cols, _ = self._cell_positions(n_rows, columns, open_only=False)
+        mask = np.zeros((n_rows, len(columns)), dtype=bool)
+        mask[rows, cols] = True
+        return np.packbits(mask, axis=1)
+
+    def _cell_positions(
+        self, n_rows: int, columns: Sequence[str], open_only: bool
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return (rows, col positions, severity codes) of cell issues inside the grid."""
+        col_pos = {c: j for j, c in enumerate(columns)}
+        rows: list[int] = []
+        cols: list[int] = []
+        codes: list[int] = []
+        for issue in self._by_id.values():
+            if open_only and issue.status != IssueStatus.OPEN:
+                continue
+            j = col_pos.get(issue.col)
+            if j is None or not 0 <= issue.row < n_rows:
+                continue
+            rows.append(issue.row)
+            cols.append(j)
+            codes.append(SEVERITY_CODES[issue.severity])
+        return (
+            np.asarray(rows, dtype=np.intp),
+            np.asarray(cols, dtype=np.intp),
+            np.asarray(codes, dtype=np.int8),
+        )
+
     def __len__(self) -> int:
         return len(self._by_id)
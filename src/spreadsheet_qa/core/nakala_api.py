@@ -16,12 +16,10 @@ API response formats (verified 2026-02):
 
 from __future__ import annotations
 
-import logging
-
-_log = logging.getLogger(__name__)
-
 import json
+import logging
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Callable
 
@@ -31,6 +29,14 @@ try:
 except ImportError:
     _HTTPX_AVAILABLE = False
 
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
+_log = logging.getLogger(__name__)
+
 
 _BASE_URL = "https://api.nakala.fr"
 
@@ -49,25 +55,35 @@ class NakalaClient:
         self._timeout = timeout
         self._cache: dict = self._load_cache()
         self._lock = threading.Lock()
+        # Parsed vocabularies, kept once the raw response is available.
+        # Rules ask for them for every column they check.
+        self._parsed: dict[str, list[str]] = {}
 
     def _load_cache(self) -> dict:
         if self._cache_path.exists():
             try:
-                return json.loads(self._cache_path.read_text(encoding="utf-8"))
+                raw = self._cache_path.read_bytes()
+                return orjson.loads(raw) if _ORJSON_AVAILABLE else json.loads(raw)
             except Exception:
                 return {}
         return {}
 
     def _save_cache(self) -> None:
         try:
-            self._cache_path.write_text(
-                json.dumps(self._cache, ensure_ascii=False, indent=2), encoding="utf-8"
-            )
+            if _ORJSON_AVAILABLE:
+                raw = orjson.dumps(self._cache, option=orjson.OPT_INDENT_2)
+            else:
+                raw = json.dumps(self._cache, ensure_ascii=False, indent=2).encode("utf-8")
+            self._cache_path.write_bytes(raw)
         except Exception:
             pass
 
-    def _fetch_sync(self, endpoint: str) -> list:
-        """Synchronous fetch with disk caching."""
+    def _fetch_sync(self, endpoint: str, http: httpx.Client | None = None) -> list:
+        """Synchronous fetch with disk caching.
+
+        *http* is an open client to reuse; a short-lived one is created
+        otherwise.
+        """
         with self._lock:
             if endpoint in self._cache:
                 return self._cache[endpoint]
@@ -76,10 +92,11 @@ class NakalaClient:
             return []
 
         try:
-            with httpx.Client(timeout=self._timeout) as client:
-                r = client.get(f"{_BASE_URL}{endpoint}")
-                r.raise_for_status()
-                data = r.json()
+            if http is None:
+                with httpx.Client(timeout=self._timeout) as client:
+                    data = self._get_json(client, endpoint)
+            else:
+                data = self._get_json(http, endpoint)
         except Exception as exc:
             _log.warning("Failed to fetch NAKALA vocab %s: %s", endpoint, exc)
             return []
@@ -89,34 +106,77 @@ class NakalaClient:
             self._save_cache()
         return data
 
+    @staticmethod
+    def _get_json(http: httpx.Client, endpoint: str) -> list:
+        r = http.get(f"{_BASE_URL}{endpoint}")
+        r.raise_for_status()
+        return r.json()
+
+    def _prefetch(self) -> None:
+        """Fetch every uncached endpoint concurrently over one connection pool."""
+        with self._lock:
+            missing = [ep for ep in _ENDPOINTS.values() if ep not in self._cache]
+        if not missing or not _HTTPX_AVAILABLE:
+            return
+        with httpx.Client(timeout=self._timeout) as http, ThreadPoolExecutor(
+            max_workers=len(missing)
+        ) as pool:
+            list(pool.map(lambda ep: self._fetch_sync(ep, http), missing))
+
+    def _vocabulary(self, name: str, parse: Callable[[list], list[str]]) -> list[str]:
+        """Return vocabulary *name* parsed from its endpoint, memoized.
+
+        Empty results (offline, fetch error) are not memoized so that a later
+        call can still pick up the data. The returned list is shared: callers
+        must not modify it.
+        """
+        values = self._parsed.get(name)
+        if values is not None:
+            return values
+        data = self._fetch_sync(_ENDPOINTS[name])
+        values = parse(data)
+        if data:
+            self._parsed[name] = values
+        return values
+
     def fetch_deposit_types(self) -> list[str]:
         """Return COAR resource type URIs.
 
         The API returns a flat list of URI strings, e.g.:
         ["http://purl.org/coar/resource_type/c_ddb1", ...]
         """
-        data = self._fetch_sync(_ENDPOINTS["deposit_types"])
-        return [item for item in data if isinstance(item, str)]
+        return self._vocabulary(
+            "deposit_types", lambda data: [item for item in data if isinstance(item, str)]
+        )
 
     def fetch_licenses(self) -> list[str]:
         """Return SPDX license codes.
 
         The API returns [{"code": "CC-BY-4.0", "name": "..."}, ...].
         """
-        data = self._fetch_sync(_ENDPOINTS["licenses"])
-        return [item["code"] for item in data if isinstance(item, dict) and "code" in item]
+        return self._vocabulary(
+            "licenses",
+            lambda data: [item["code"] for item in data if isinstance(item, dict) and "code" in item],
+        )
 
     def fetch_languages(self) -> list[str]:
         """Return ISO 639-3 language codes.
 
         The API returns [{"id": "fra", "label": "..."}, ...].
         """
-        data = self._fetch_sync(_ENDPOINTS["languages"])
-        return [item["id"] for item in data if isinstance(item, dict) and "id" in item]
+        return self._vocabulary(
+            "languages",
+            lambda data: [item["id"] for item in data if isinstance(item, dict) and "id" in item],
+        )
 
     def fetch_all_async(self, on_done: Callable[[], None] | None = None) -> None:
-        """Fetch all vocabularies in a background thread."""
+        """Fetch all vocabularies in a background thread.
+
+        Uncached endpoints are requested concurrently through one shared
+        httpx client.
+        """
         def _worker():
+            self._prefetch()
             self.fetch_deposit_types()
             self.fetch_licenses()
             self.fetch_languages()
@@ -4,12 +4,53 @@ from __future__ import annotations
 
 import json
 import logging
+import math
+import numbers
 from pathlib import Path
 
 _log = logging.getLogger(__name__)
 
 from spreadsheet_qa.core.models import Patch
 
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
+
+def _json_default(value):
+    # NumPy scalars (np.int64, np.float32…) expose .item() for the builtin
+    if hasattr(value, "item"):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _dumps(data: dict) -> bytes:
+    # orjson writes NaN/inf as null, so an empty cell's NaN old_value would
+    # read back as None; keep the stdlib encoder for those payloads.
+    if _ORJSON_AVAILABLE and not any(
+        isinstance(v, numbers.Real) and not math.isfinite(v) for v in data.values()
+    ):
+        try:
+            return orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            )
+        except TypeError:
+            pass  # value orjson cannot encode; let the stdlib try
+    return json.dumps(
+        data, ensure_ascii=False, indent=2, default=_json_default
+    ).encode("utf-8")
+
+
+def _loads(raw: bytes) -> dict:
+    if _ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN written by the stdlib encoder
+    return json.loads(raw)
+
 
 class PatchWriter:
     """Write and delete patch files in a project's work/patches/ directory."""
@@ -20,7 +61,7 @@ class PatchWriter:
 
     def write(self, patch: Patch) -> Path | None:
         path = self._dir / f"{patch.patch_id}.json"
-        path.write_text(json.dumps(patch.to_dict(), ensure_ascii=False, indent=2), encoding="utf-8")
+        path.write_bytes(_dumps(patch.to_dict()))
         return path
 
     def delete(self, patch_id: str) -> None:
@@ -35,14 +76,13 @@ class PatchWriter:
         path = self._dir / f"{patch_id}.json"
         if not path.exists():
             return None
-        data = json.loads(path.read_text(encoding="utf-8"))
-        return Patch.from_dict(data)
+        return Patch.from_dict(_loads(path.read_bytes()))
 
     def all_patches(self) -> list[Patch]:
         patches = []
         for p in sorted(self._dir.glob("*.json")):
             try:
-                patches.append(Patch.from_dict(json.loads(p.read_text(encoding="utf-8"))))
+                patches.append(Patch.from_dict(_loads(p.read_bytes())))
             except Exception as exc:
                 _log.warning("Could not load patch file %s: %s", p, exc)
         return patches
@@ -43,6 +43,24 @@ class Rule(ABC):
         """
 
 
+def non_blank_cells(df: pd.DataFrame, col: str, config: dict[str, Any]) -> pd.Series:
+    """Return the stripped, non-blank cells of *col* as strings, keyed by row.
+
+    The engine hands every per-column rule the same ``config["_non_blank_cells"]``
+    dict for a validation run, so the column is only filtered once however many
+    rules ask for it. Callers must not modify the returned Series.
+    """
+    cache: dict[str, pd.Series] | None = config.get("_non_blank_cells")
+    if cache is not None and col in cache:
+        return cache[col]
+    series = df[col]
+    cells = series[series.notna()].astype(str).str.strip()
+    cells = cells[cells != ""]
+    if cache is not None:
+        cache[col] = cells
+    return cells
+
+
 class RuleRegistry:
     """Singleton registry mapping rule_id → Rule class."""
 
@@ -43,13 +43,23 @@ _ISBN10_RE = re.compile(r"^[\dX\- ]{10,13}$", re.IGNORECASE)
 _HANDLE_RE = re.compile(r"^(?!10\.\d{4,9}/)(?:\d{4,9}|\d{2,}\.\d+(?:\.\d+)*)/\S+$", re.IGNORECASE)
 _BCP47_RE = re.compile(r"^[a-z]{2,3}(-[a-z0-9]{2,8})*$", re.IGNORECASE)
 _COUNTRY_RE = re.compile(r"^[a-z]{2}$", re.IGNORECASE)
+_IDENTIFIER_SEPARATORS_RE = re.compile(r"[\s\-]")
+_YEAR_RE = re.compile(r"\d{4}")
+# All-digit date forms accepted by _is_date, in one pass:
+# YYYY-MM[-DD] | DD/MM/YYYY or DD-MM-YYYY | MM/YYYY | YYYY
+_NUMERIC_DATE_RE = re.compile(
+    r"\d{4}-(?P<iso_m>\d{2})(?:-(?P<iso_d>\d{2}))?"
+    r"|(?P<fr_d>\d{2})[/\-](?P<fr_m>\d{2})[/\-]\d{4}"
+    r"|(?P<my_m>\d{2})/\d{4}"
+    r"|(?P<year>\d{4})"
+)
 
 _BOOLEAN_TRUE_DEFAULT = "oui, o, vrai, true, yes, y, 1, actif, active, enabled"
 _BOOLEAN_FALSE_DEFAULT = "non, n, faux, false, no, 0, inactif, inactive, disabled"
 
 
 def _normalize_identifier_token(value: str) -> str:
-    return re.sub(r"[\s\-]", "", value.strip()).upper()
+    return _IDENTIFIER_SEPARATORS_RE.sub("", value.strip()).upper()
 
 
 def _is_isbn13_token(value: str) -> bool:
@@ -147,11 +157,10 @@ def _is_month_name_date(value: str) -> bool:
     raw = value.strip()
     if not raw:
         return False
-    collapsed = re.sub(r"\s+", " ", raw)
-    parts = collapsed.split()
+    parts = raw.split()
     if len(parts) < 2:
         return False
-    if not re.fullmatch(r"\d{4}", parts[-1]):
+    if not _YEAR_RE.fullmatch(parts[-1]):
         return False
     year = int(parts[-1])
     if not 1000 <= year <= 2099:
@@ -186,37 +195,26 @@ def _is_date(value: str, config: dict[str, Any] | None = None) -> bool:
     """
     v = value.strip()
 
-    if _is_month_name_date(v):
-        return True
-
-    # ISO: YYYY-MM-DD
-    m = re.fullmatch(r"(\d{4})-(\d{2})-(\d{2})", v)
-    if m:
-        mo, d = int(m.group(2)), int(m.group(3))
-        return 1 <= mo <= 12 and 1 <= d <= 31
+    m = _NUMERIC_DATE_RE.fullmatch(v)
+    if m is None:
+        return _is_month_name_date(v)
 
-    # W3C-DTF partial date: YYYY-MM
-    m = re.fullmatch(r"(\d{4})-(\d{2})", v)
-    if m:
-        return 1 <= int(m.group(2)) <= 12
+    # ISO: YYYY-MM-DD, or W3C-DTF partial date YYYY-MM
+    if m["iso_m"] is not None:
+        if not 1 <= int(m["iso_m"]) <= 12:
+            return False
+        return m["iso_d"] is None or 1 <= int(m["iso_d"]) <= 31
 
     # FR: DD/MM/YYYY or DD-MM-YYYY
-    m = re.fullmatch(r"(\d{2})[/\-](\d{2})[/\-](\d{4})", v)
-    if m:
-        d, mo = int(m.group(1)), int(m.group(2))
-        return 1 <= mo <= 12 and 1 <= d <= 31
+    if m["fr_m"] is not None:
+        return 1 <= int(m["fr_m"]) <= 12 and 1 <= int(m["fr_d"]) <= 31
 
     # Month/year: MM/YYYY
-    m = re.fullmatch(r"(\d{2})/(\d{4})", v)
-    if m:
-        return 1 <= int(m.group(1)) <= 12
+    if m["my_m"] is not None:
+        return 1 <= int(m["my_m"]) <= 12
 
     # Year only: YYYY (restricted to plausible range)
-    m = re.fullmatch(r"(\d{4})", v)
-    if m:
-        return 1000 <= int(m.group(1)) <= 2099
-
-    return False
+    return 1000 <= int(m["year"]) <= 2099
 
 
 def _is_email(value: str, config: dict[str, Any] | None = None) -> bool:
@@ -358,6 +356,11 @@ class ContentTypeRule(Rule):
     def check(self, df: pd.DataFrame, col: str | None, config: dict[str, Any]) -> list[Issue]:
         if col is None or col not in df.columns:
             return []
+        return self.check_series(df[col], config)
+
+    def check_series(self, series: pd.Series, config: dict[str, Any]) -> list[Issue]:
+        """Check one column given as a Series; ``series.name`` is the column name."""
+        col = series.name
 
         content_type: str | None = config.get("content_type", None)
         if not content_type:
@@ -377,8 +380,10 @@ class ContentTypeRule(Rule):
         special: list[str] = config.get("special_values") or []
         special_lower = [sv.lower() for sv in special]
         issues: list[Issue] = []
+        # Columns repeat values a lot: validate each distinct cell once
+        verdicts: dict[str, bool] = {}
 
-        for row_idx, val in df[col].items():
+        for row_idx, val in series.items():
             if pd.isna(val):
                 continue
             cell = str(val)
@@ -386,7 +391,10 @@ class ContentTypeRule(Rule):
                 continue
             if special_lower and cell.strip().lower() in special_lower:
                 continue  # valeur spéciale acceptée inconditionnellement
-            if not validator(cell, config):
+            valid = verdicts.get(cell)
+            if valid is None:
+                valid = verdicts[cell] = validator(cell, config)
+            if not valid:
                 issues.append(
                     Issue.create(
                         rule_id=self.rule_id,
@@ -21,7 +21,7 @@ import pandas as pd
 
 from spreadsheet_qa.core.coar_mapping import coar_uri_to_label, suggest_coar_uri
 from spreadsheet_qa.core.models import Issue, Severity
-from spreadsheet_qa.core.rule_base import Rule, registry
+from spreadsheet_qa.core.rule_base import Rule, non_blank_cells, registry
 
 _log = logging.getLogger(__name__)
 
@@ -29,6 +29,11 @@ _log = logging.getLogger(__name__)
 _CREATED_RE = re.compile(r"^\d{4}(-\d{2}(-\d{2})?)?$")
 
 
+def _outside_vocabulary(cells: pd.Series, vocab: list[str]) -> pd.Series:
+    """Return the *cells* absent from *vocab*."""
+    return cells[~cells.isin(frozenset(vocab))]
+
+
 # ---------------------------------------------------------------------------
 # NakalaCreatedFormatRule
 # ---------------------------------------------------------------------------
@@ -52,28 +57,30 @@ class NakalaCreatedFormatRule(Rule):
         special: list[str] = config.get("special_values") or []
         special_lower = [sv.lower() for sv in special]
 
+        # Object dtype keeps Python ``re`` semantics (Unicode \d, compiled
+        # custom patterns) instead of the Arrow regex engine.
+        cells = non_blank_cells(df, col, config).astype(object)
+        if special_lower:
+            # valeurs spéciales acceptées inconditionnellement
+            cells = cells[~cells.str.lower().isin(special_lower)]
+        invalid = cells[~cells.str.match(pattern, na=False).astype(bool)]
+
         issues: list[Issue] = []
-        for row_idx, val in df[col].items():
-            if pd.isna(val) or str(val).strip() == "":
-                continue
-            cell = str(val).strip()
-            if special_lower and cell.lower() in special_lower:
-                continue  # valeur spéciale acceptée inconditionnellement
-            if not pattern.match(cell):
-                issues.append(
-                    Issue.create(
-                        rule_id=self.rule_id,
-                        severity=severity,
-                        row=int(row_idx),
-                        col=col,
-                        original=cell,
-                        message=(
-                            f"Format de date non conforme au W3C-DTF pour la valeur « {cell} » "
-                            "(attendu : AAAA, AAAA-MM ou AAAA-MM-JJ)."
-                        ),
-                        suggestion="Utilisez le format W3C-DTF, ex. : 2024 ou 2024-01-15.",
-                    )
+        for row_idx, cell in invalid.items():
+            issues.append(
+                Issue.create(
+                    rule_id=self.rule_id,
+                    severity=severity,
+                    row=int(row_idx),
+                    col=col,
+                    original=cell,
+                    message=(
+                        f"Format de date non conforme au W3C-DTF pour la valeur « {cell} » "
+                        "(attendu : AAAA, AAAA-MM ou AAAA-MM-JJ)."
+                    ),
+                    suggestion="Utilisez le format W3C-DTF, ex. : 2024 ou 2024-01-15.",
                 )
+            )
         return issues
 
 
@@ -111,13 +118,7 @@ class NakalaDepositTypeRule(Rule):
 
         severity = Severity(config.get("severity", self.default_severity))
         issues: list[Issue] = []
-        for row_idx, val in df[col].items():
-            if pd.isna(val) or str(val).strip() == "":
-                continue
-            cell = str(val).strip()
-            if cell in vocab:
-                continue
-
+        for row_idx, cell in _outside_vocabulary(non_blank_cells(df, col, config), vocab).items():
             # Tenter de reconnaître la valeur comme un libellé connu
             suggested_uri = suggest_coar_uri(cell)
             if suggested_uri:
@@ -177,22 +178,18 @@ class NakalaLicenseRule(Rule):
 
         severity = Severity(config.get("severity", self.default_severity))
         issues: list[Issue] = []
-        for row_idx, val in df[col].items():
-            if pd.isna(val) or str(val).strip() == "":
-                continue
-            cell = str(val).strip()
-            if cell not in vocab:
-                issues.append(
-                    Issue.create(
-                        rule_id=self.rule_id,
-                        severity=severity,
-                        row=int(row_idx),
-                        col=col,
-                        original=cell,
-                        message=f"Licence « {cell} » non reconnue dans le vocabulaire NAKALA.",
-                        suggestion="Utilisez une licence depuis api.nakala.fr/vocabularies/licenses.",
-                    )
+        for row_idx, cell in _outside_vocabulary(non_blank_cells(df, col, config), vocab).items():
+            issues.append(
+                Issue.create(
+                    rule_id=self.rule_id,
+                    severity=severity,
+                    row=int(row_idx),
+                    col=col,
+                    original=cell,
+                    message=f"Licence « {cell} » non reconnue dans le vocabulaire NAKALA.",
+                    suggestion="Utilisez une licence depuis api.nakala.fr/vocabularies/licenses.",
                 )
+            )
         return issues
 
 
@@ -228,23 +225,19 @@ class NakalaLanguageRule(Rule):
 
         severity = Severity(config.get("severity", self.default_severity))
         issues: list[Issue] = []
-        for row_idx, val in df[col].items():
-            if pd.isna(val) or str(val).strip() == "":
-                continue
-            cell = str(val).strip()
-            if cell not in vocab:
-                issues.append(
-                    Issue.create(
-                        rule_id=self.rule_id,
-                        severity=severity,
-                        row=int(row_idx),
-                        col=col,
-                        original=cell,
-                        message=(
-                            f"Langue « {cell} » non reconnue "
-                            "(code ISO 639-3 attendu, ex. : fra, eng, deu)."
-                        ),
-                        suggestion="Utilisez un code depuis api.nakala.fr/vocabularies/languages.",
-                    )
+        for row_idx, cell in _outside_vocabulary(non_blank_cells(df, col, config), vocab).items():
+            issues.append(
+                Issue.create(
+                    rule_id=self.rule_id,
+                    severity=severity,
+                    row=int(row_idx),
+                    col=col,
+                    original=cell,
+                    message=(
+                        f"Langue « {cell} » non reconnue "
+                        "(code ISO 639-3 attendu, ex. : fra, eng, deu)."
+                    ),
+                    suggestion="Utilisez un code depuis api.nakala.fr/vocabularies/languages.",
                 )
+            )
         return issues
@@ -179,6 +179,21 @@ class TemplateManager:
 
         return None
 
+    def source_stamp(self, template_id: str) -> tuple[str, int, int] | None:
+        """Return ``(path, mtime_ns, size)`` of the file *template_id* resolves to.
+
+        Lets callers that cache compiled configs notice a template edited,
+        added or removed on disk.  None when the template does not resolve.
+        """
+        path = self._resolve_path(template_id)
+        if path is None:
+            return None
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        return (str(path), st.st_mtime_ns, st.st_size)
+
     # ------------------------------------------------------------------
     # Config compilation
     # ------------------------------------------------------------------
@@ -93,7 +93,7 @@ class ValidationController:
             self._issue_store.replace_for_columns(replace_cols, issues)
 
         self._signals.issues_updated.emit()
-        self._table_model.refresh_all()
+        self._table_model.refresh_backgrounds()
         self._signals.validation_finished.emit(len(self._issue_store))
 
         counts = self._issue_store.count_by_severity()
@@ -0,0 +1,38 @@
+"""Severity grid → background color index kernel.
+
+Maps an ``int8`` severity grid (``-1`` = no open issue, otherwise the severity
+rank from ``IssueStore.severity_grid``) to a ``uint8`` index into the model's
+color table (``0`` = no background).  Compiled with Numba when it is installed;
+otherwise a NumPy fallback with identical results is used.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+
+if _NUMBA_AVAILABLE:
+
+    @njit(parallel=True, cache=True)
+    def _resolve_bg_numba(severities, out):  # pragma: no cover - requires numba
+        for i in prange(severities.shape[0]):
+            for j in range(severities.shape[1]):
+                s = severities[i, j]
+                out[i, j] = 0 if s < 0 else s + 1
+
+
+def resolve_bg(severities: np.ndarray, out: np.ndarray) -> None:
+    """Fill *out* (same shape, ``uint8``) with color-table indexes for *severities*."""
+    if severities.size == 0:
+        return
+    if _NUMBA_AVAILABLE:
+        _resolve_bg_numba(severities, out)
+        return
+    np.add(severities, 1, out=out, where=severities >= 0, casting="unsafe")
+    out[severities < 0] = 0
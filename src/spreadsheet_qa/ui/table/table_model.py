@@ -3,20 +3,32 @@
 Critical design rules:
 - Holds a DIRECT REFERENCE to the DataFrame — no copies.
 - setData() does NOT mutate df directly; emits cell_edit_requested signal.
-- data() accesses df.iloc for O(1) cell lookup.
-- Background color computed from IssueStore on BackgroundRole.
+- DisplayRole goes through a per-column display function specialised for the
+  column dtype (missing-value check + str conversion), built lazily from a
+  NumPy snapshot of the column and dropped whenever the column may have
+  changed (refresh_cell / refresh_all / replace_dataframe). Arrow-backed
+  string columns are read from their pa.ChunkedArray without a pandas hop.
+- UserRole still accesses df.iloc for O(1) cell lookup.
+- Background colors come from a color-index grid rebuilt from IssueStore on
+  refresh_all(); BackgroundRole is a single array read.
 """
 
 from __future__ import annotations
 
-from typing import Any
+import weakref
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Any, Callable
 
+import numpy as np
 import pandas as pd
-from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
-from PySide6.QtGui import QColor
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt, QTimer
+from PySide6.QtGui import QBrush, QColor
 
+from spreadsheet_qa.core.issue_store import SEVERITY_CODES, IssueStore
 from spreadsheet_qa.core.models import Severity
 from spreadsheet_qa.ui.signals import AppSignals
+from spreadsheet_qa.ui.table._bg_kernel import resolve_bg
 
 # Severity → subtle background color
 _SEVERITY_COLORS = {
@@ -25,6 +37,172 @@ _SEVERITY_COLORS = {
     Severity.SUSPICION: QColor(230, 230, 255),   # soft blue/lavender
 }
 
+# Color-index grid value → background brush (index 0 = no open issue).
+# The same implicitly-shared QBrush instances are returned for every cell.
+_SEVERITY_BRUSH_TABLE: list[QBrush | None] = [None] + [
+    QBrush(_SEVERITY_COLORS[sev])
+    for sev, _ in sorted(SEVERITY_CODES.items(), key=lambda kv: kv[1])
+]
+
+
+def _isna_float(val: Any) -> bool:
+    return val != val  # NaN is the only value not equal to itself
+
+
+def _isna_object(val: Any) -> bool:
+    # pd.NA must be tested by identity first: ``pd.NA != pd.NA`` is not a bool
+    return val is None or val is pd.NA or (isinstance(val, float) and val != val)
+
+
+def _isna_datetime(val: Any) -> bool:
+    return val is pd.NaT
+
+
+def _isna_never(val: Any) -> bool:
+    return False
+
+
+@lru_cache(maxsize=8192)
+def _row_label(section: int) -> str:
+    """1-based vertical header label; cached because Qt re-queries it on every paint."""
+    return str(section + 1)
+
+
+def _changed_blocks(changed: np.ndarray) -> list[tuple[int, int, int, int]]:
+    """Group a boolean change mask into (top, bottom, left, right) blocks.
+
+    One block per run of consecutive changed rows, spanning the changed columns
+    of that run.
+    """
+    rows = np.flatnonzero(changed.any(axis=1))
+    if rows.size == 0:
+        return []
+    blocks = []
+    for run in np.split(rows, np.flatnonzero(np.diff(rows) > 1) + 1):
+        top, bottom = int(run[0]), int(run[-1])
+        cols = np.flatnonzero(changed[top : bottom + 1].any(axis=0))
+        blocks.append((top, bottom, int(cols[0]), int(cols[-1])))
+    return blocks
+
+
+def _make_display_fn(values: np.ndarray, isna: Callable[[Any], bool]) -> Callable[[int], str]:
+    """Build the DisplayRole function for one column snapshot."""
+    kind = values.dtype.kind
+    if kind == "f":
+
+        def display_float(row: int) -> str:
+            v = values[row]
+            return "" if v != v else str(v)
+
+        return display_float
+    if kind in "iub":
+
+        def display_plain(row: int) -> str:
+            return str(values[row])
+
+        return display_plain
+
+    def display_object(row: int) -> str:
+        v = values[row]
+        return "" if isna(v) else str(v)
+
+    return display_object
+
+
+def _make_batch_fn(
+    values: np.ndarray, display: Callable[[int], str]
+) -> Callable[[int, int], list[str]]:
+    """Build the batch counterpart of a display function: rows [start, stop) → texts."""
+    kind = values.dtype.kind
+    if kind == "f":
+
+        def batch_float(start: int, stop: int) -> list[str]:
+            block = values[start:stop]
+            texts = block.astype(str).astype(object)
+            texts[block != block] = ""
+            return texts.tolist()
+
+        return batch_float
+    if kind in "iub":
+
+        def batch_plain(start: int, stop: int) -> list[str]:
+            return values[start:stop].astype(str).tolist()
+
+        return batch_plain
+
+    def batch_object(start: int, stop: int) -> list[str]:
+        return [display(r) for r in range(start, stop)]
+
+    return batch_object
+
+
+def _make_arrow_batch_fn(chunked: Any) -> Callable[[int, int], list[str]]:
+    """Batch counterpart of _make_arrow_display_fn (one slice + to_pylist)."""
+
+    def batch_arrow(start: int, stop: int) -> list[str]:
+        return ["" if v is None else v for v in chunked.slice(start, stop - start).to_pylist()]
+
+    return batch_arrow
+
+
+def _arrow_string_chunks(col: pd.Series) -> Any | None:
+    """Return the ``pa.ChunkedArray`` behind an Arrow-backed string column, else None."""
+    dtype = col.dtype
+    if isinstance(dtype, pd.StringDtype):
+        if dtype.storage != "pyarrow":
+            return None
+    elif not isinstance(dtype, pd.ArrowDtype):
+        return None
+    import pyarrow as pa  # available whenever an Arrow-backed dtype exists
+
+    chunked = getattr(col.array, "_pa_array", None)
+    if chunked is None:
+        return None
+    if not (pa.types.is_string(chunked.type) or pa.types.is_large_string(chunked.type)):
+        return None
+    return chunked
+
+
+def _make_arrow_display_fn(chunked: Any) -> Callable[[int], str]:
+    """Build the DisplayRole function reading straight from Arrow string chunks."""
+    chunks = chunked.chunks
+    if len(chunks) == 1:
+        chunk = chunks[0]
+
+        def display_arrow_single(row: int) -> str:
+            scalar = chunk[row]
+            return scalar.as_py() if scalar.is_valid else ""
+
+        return display_arrow_single
+
+    # Start offset of each chunk: one binary search + subtraction per lookup.
+    starts = [0]
+    for c in chunks[:-1]:
+        starts.append(starts[-1] + len(c))
+
+    def display_arrow(row: int) -> str:
+        k = bisect_right(starts, row) - 1
+        scalar = chunks[k][row - starts[k]]
+        return scalar.as_py() if scalar.is_valid else ""
+
+    return display_arrow
+
+
+def _isna_checker_for(dtype: Any) -> Callable[[Any], bool]:
+    """Return the cheapest missing-value check valid for cells of *dtype*."""
+    if pd.api.types.is_float_dtype(dtype):
+        return _isna_float
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return _isna_datetime
+    if isinstance(dtype, pd.api.extensions.ExtensionDtype) and not isinstance(
+        dtype, pd.StringDtype
+    ):
+        # Nullable extension arrays (Int64, boolean, …) may hold pd.NA.
+        return pd.isna
+    if pd.api.types.is_integer_dtype(dtype) or pd.api.types.is_bool_dtype(dtype):
+        return _isna_never
+    return _isna_object
+
 
 class SpreadsheetTableModel(QAbstractTableModel):
     """Thin Qt model wrapping a pandas DataFrame.
@@ -33,11 +211,34 @@ class SpreadsheetTableModel(QAbstractTableModel):
     It reads from them on every paint event (Qt handles virtualization).
     """
 
+    # Coalescing window for refresh_all() (one frame at 60 Hz)
+    REFRESH_INTERVAL_MS = 16
+    # Rows above/below the viewport still treated as visible by refresh_*()
+    VIEWPORT_BUFFER_ROWS = 50
+
     def __init__(self, df: pd.DataFrame, issue_store: Any, signals: AppSignals, parent=None) -> None:
         super().__init__(parent)
         self._df = df
         self._issue_store = issue_store
         self._signals = signals
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(self.REFRESH_INTERVAL_MS)
+        self._refresh_timer.timeout.connect(self._do_refresh_all)
+        self._isna_checkers: list[Callable[[Any], bool]] = []
+        self._col_labels: list[str] = []
+        self._columns_tuple: tuple[str, ...] = ()
+        self._display_fns: list[Callable[[int], str] | None] = []
+        self._batch_fns: list[Callable[[int, int], list[str]] | None] = []
+        # (row, col_idx) → display text for the last prewarmed viewport
+        self._display_cache: dict[tuple[int, int], str] = {}
+        # Attached view (see attach_view) and off-screen cells awaiting a dataChanged
+        self._view_ref: weakref.ref | None = None
+        self._deferred_refresh: set[tuple[int, int]] = set()
+        self._bg_index_grid = np.zeros((0, 0), dtype=np.uint8)
+        self._has_issue_bits = np.zeros((0, 0), dtype=np.uint8)
+        self._rebuild_column_caches()
+        self._rebuild_bg_grid()
 
     # ------------------------------------------------------------------
     # Qt required overrides
@@ -74,25 +275,24 @@ class SpreadsheetTableModel(QAbstractTableModel):
             return None
 
         if role == Qt.ItemDataRole.DisplayRole or role == Qt.ItemDataRole.EditRole:
-            val = self._df.iloc[row, col_idx]
-            if pd.isna(val):
-                return ""
-            return str(val)
+            text = self._display_cache.get((row, col_idx))
+            if text is not None:
+                return text
+            display = self._display_fns[col_idx]
+            if display is None:
+                display = self._build_display_fn(col_idx)
+            return display(row)
 
         if role == Qt.ItemDataRole.UserRole:
             return self._df.iloc[row, col_idx]
 
         if role == Qt.ItemDataRole.BackgroundRole:
-            col_name = self._df.columns[col_idx]
-            severity = self._issue_store.worst_severity_for_cell(row, col_name)
-            if severity is not None:
-                return _SEVERITY_COLORS.get(severity)
+            return _SEVERITY_BRUSH_TABLE[self._bg_index_grid[row, col_idx]]
 
         if role == Qt.ItemDataRole.ToolTipRole:
-            col_name = self._df.columns[col_idx]
-            issues = self._issue_store.by_cell(row, col_name)
-            if issues:
-                return "\n".join(i.message for i in issues[:5])
+            if not IssueStore.cell_has_issue(self._has_issue_bits, row, col_idx):
+                return None
+            return self._issue_store.tooltip_for_cell(row, self._columns_tuple[col_idx])
 
         return None
 
@@ -102,12 +302,12 @@ class SpreadsheetTableModel(QAbstractTableModel):
         if role != Qt.ItemDataRole.DisplayRole:
             return None
         if orientation == Qt.Orientation.Horizontal:
-            if section < 0 or section >= len(self._df.columns):
+            if section < 0 or section >= len(self._col_labels):
                 return None
-            return self._df.columns[section]
+            return self._col_labels[section]
         if section < 0 or section >= len(self._df):
             return None
-        return str(section + 1)  # 1-based row numbers
+        return _row_label(section)  # 1-based row numbers
 
     def flags(self, index: QModelIndex) -> Qt.ItemFlag:
         if not index.isValid():
@@ -133,18 +333,132 @@ class SpreadsheetTableModel(QAbstractTableModel):
     # ------------------------------------------------------------------
 
     def refresh_cell(self, row: int, col_idx: int) -> None:
-        """Notify Qt that a single cell has changed."""
+        """Notify Qt that a single cell has changed.
+
+        Caches are always updated; the dataChanged emit is deferred (see
+        flush_deferred_refresh) when the row is outside the attached view's
+        visible rows.
+        """
         idx = self.index(row, col_idx)
+        if not idx.isValid():
+            return
+        self._display_fns[col_idx] = None
+        self._batch_fns[col_idx] = None
+        self._display_cache.pop((row, col_idx), None)
+        col_name = self._df.columns[col_idx]
+        severity = self._issue_store.worst_severity_for_cell(row, col_name)
+        self._bg_index_grid[row, col_idx] = (
+            0 if severity is None else SEVERITY_CODES[severity] + 1
+        )
+        bit = np.uint8(0x80 >> (col_idx & 7))
+        if self._issue_store.has_issues_for_cell(row, col_name):
+            self._has_issue_bits[row, col_idx >> 3] |= bit
+        else:
+            self._has_issue_bits[row, col_idx >> 3] &= ~bit
+
+        visible = self._visible_rows()
+        if visible is not None and not visible[0] <= row <= visible[1]:
+            self._deferred_refresh.add((row, col_idx))
+            return
         self.dataChanged.emit(idx, idx, [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.BackgroundRole])
 
+    def flush_deferred_refresh(self, top: int, bottom: int) -> None:
+        """Emit the deferred refresh_cell() notifications for rows now in [top, bottom]."""
+        if not self._deferred_refresh:
+            return
+        n_rows, n_cols = len(self._df), len(self._df.columns)
+        top, bottom = max(top, 0), min(bottom, n_rows - 1)
+        due = {
+            (r, c) for r, c in self._deferred_refresh if top <= r <= bottom and c < n_cols
+        }
+        if not due:
+            return
+        self._deferred_refresh -= due
+        mask = np.zeros((bottom - top + 1, n_cols), dtype=bool)
+        for r, c in due:
+            mask[r - top, c] = True
+        for b_top, b_bottom, left, right in _changed_blocks(mask):
+            self.dataChanged.emit(
+                self.index(top + b_top, left),
+                self.index(top + b_bottom, right),
+                [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.BackgroundRole],
+            )
+
+    def attach_view(self, view: Any) -> None:
+        """Remember *view* (weakly) so refreshes can skip rows it does not show.
+
+        The view must provide ``visible_row_range() -> (first, last)``.
+        """
+        self._view_ref = weakref.ref(view)
+
+    def _visible_rows(self) -> tuple[int, int] | None:
+        """Visible row span of the attached view, widened by VIEWPORT_BUFFER_ROWS.
+
+        None when no view is attached (callers then notify everything).
+        """
+        view = self._view_ref() if self._view_ref is not None else None
+        if view is None:
+            return None
+        first, last = view.visible_row_range()
+        if first < 0:
+            return None
+        return (
+            max(first - self.VIEWPORT_BUFFER_ROWS, 0),
+            min(last + self.VIEWPORT_BUFFER_ROWS, len(self._df) - 1),
+        )
+
+    def refresh_backgrounds(self) -> None:
+        """Re-read issue colors and notify Qt only for cells whose color changed.
+
+        Use after a validation pass, when cell values are untouched. Falls back
+        to refresh_all() when the grid shape changed.
+        """
+        prev = self._bg_index_grid
+        self._rebuild_bg_grid()
+        if prev.shape != self._bg_index_grid.shape:
+            self._do_refresh_all()
+            return
+        changed = prev != self._bg_index_grid
+        # Off-screen rows need no notification: Qt re-reads them when they scroll in.
+        visible = self._visible_rows()
+        offset = 0
+        if visible is not None:
+            offset = visible[0]
+            changed = changed[visible[0] : visible[1] + 1]
+        for top, bottom, left, right in _changed_blocks(changed):
+            top, bottom = top + offset, bottom + offset
+            self.dataChanged.emit(
+                self.index(top, left),
+                self.index(bottom, right),
+                [Qt.ItemDataRole.BackgroundRole],
+            )
+
     def refresh_all(self) -> None:
-        """Notify Qt that all data has changed (after full validation update)."""
+        """Notify Qt that all data has changed (after bulk fixes, undo/redo).
+
+        Calls made within REFRESH_INTERVAL_MS of each other are coalesced into
+        a single repaint (restarting a running single-shot timer).
+        """
+        # Cell values may already have changed: drop display snapshots now,
+        # only the repaint itself is deferred.
+        self._display_fns = [None] * len(self._display_fns)
+        self._batch_fns = [None] * len(self._batch_fns)
+        self._display_cache = {}
+        self._refresh_timer.start()
+
+    def _do_refresh_all(self) -> None:
+        self._refresh_timer.stop()
+        self._rebuild_bg_grid()
         # Guard: do not emit dataChanged for invalid indexes on empty tables.
         if self.rowCount() == 0 or self.columnCount() == 0:
             return
+        # Everything is re-read anyway: pending per-cell notifications are moot,
+        # and off-screen rows are re-queried by Qt when they scroll in.
+        self._deferred_refresh.clear()
+        top, bottom = self._visible_rows() or (0, self.rowCount() - 1)
         self.dataChanged.emit(
-            self.index(0, 0),
-            self.index(self.rowCount() - 1, self.columnCount() - 1),
+            self.index(top, 0),
+            self.index(bottom, self.columnCount() - 1),
             [Qt.ItemDataRole.BackgroundRole],
         )
 
@@ -152,12 +466,74 @@ class SpreadsheetTableModel(QAbstractTableModel):
         """Swap the underlying DataFrame (e.g., after file reload)."""
         self.beginResetModel()
         self._df = df
+        self._deferred_refresh.clear()
+        self._rebuild_column_caches()
+        self._rebuild_bg_grid()
         self.endResetModel()
 
+    def _rebuild_column_caches(self) -> None:
+        """Precompute per-column helpers that only depend on the DataFrame shape/dtypes."""
+        self._isna_checkers = [_isna_checker_for(dtype) for dtype in self._df.dtypes]
+        self._col_labels = [str(c) for c in self._df.columns]
+        self._columns_tuple = tuple(self._df.columns)
+        self._display_fns = [None] * len(self._df.columns)
+        self._batch_fns = [None] * len(self._df.columns)
+        self._display_cache = {}
+
+    def _build_display_fn(self, col_idx: int) -> Callable[[int], str]:
+        """Snapshot column *col_idx* and cache its DisplayRole functions (cell + batch)."""
+        col = self._df.iloc[:, col_idx]
+        chunked = _arrow_string_chunks(col)
+        if chunked is not None:
+            # Zero-copy: Python str built directly from Arrow's UTF-8 buffers.
+            display = _make_arrow_display_fn(chunked)
+            batch = _make_arrow_batch_fn(chunked)
+        else:
+            if isinstance(col.dtype, np.dtype) and col.dtype.kind in "fiub":
+                values = col.to_numpy()
+            else:
+                # Boxed scalars (Timestamp, pd.NA, str) keep the same str() as df.iloc.
+                values = col.astype(object).to_numpy()
+            display = _make_display_fn(values, self._isna_checkers[col_idx])
+            batch = _make_batch_fn(values, display)
+        self._display_fns[col_idx] = display
+        self._batch_fns[col_idx] = batch
+        return display
+
+    def prewarm_viewport(self, top: int, bottom: int, left: int, right: int) -> None:
+        """Precompute display texts for the visible block, one batch per column.
+
+        Called by the view when it scrolls or resizes, before Qt repaints; the
+        following per-cell data() calls are then plain dict hits. Only the
+        latest viewport is kept. Background colors need no prewarming: they are
+        already a single read from the color-index grid.
+        """
+        top, left = max(top, 0), max(left, 0)
+        bottom = min(bottom, len(self._df) - 1)
+        right = min(right, len(self._df.columns) - 1)
+        cache: dict[tuple[int, int], str] = {}
+        for col_idx in range(left, right + 1):
+            batch = self._batch_fns[col_idx]
+            if batch is None:
+                self._build_display_fn(col_idx)
+                batch = self._batch_fns[col_idx]
+            for row, text in enumerate(batch(top, bottom + 1), start=top):
+                cache[(row, col_idx)] = text
+        self._display_cache = cache
+
+    def _rebuild_bg_grid(self) -> None:
+        """Recompute the per-cell color indexes and has-issue bits from the IssueStore."""
+        n_rows, columns = len(self._df), list(self._df.columns)
+        severities = self._issue_store.severity_grid(n_rows, columns)
+        self._bg_index_grid = np.empty(severities.shape, dtype=np.uint8)
+        resolve_bg(severities, self._bg_index_grid)
+        self._has_issue_bits = self._issue_store.has_issue_bits(n_rows, columns)
+
     @property
     def df(self) -> pd.DataFrame:
         return self._df
 
     @property
-    def column_names(self) -> list[str]:
-        return list(self._df.columns)
+    def column_names(self) -> tuple[str, ...]:
+        """Column names, cached per DataFrame (immutable, safe to share)."""
+        return self._columns_tuple
@@ -46,6 +46,50 @@ class SpreadsheetTableView(QTableView):
         self.setWordWrap(False)
         self.setTextElideMode(Qt.TextElideMode.ElideRight)
 
+        # Batch-compute display texts for the visible block before Qt repaints,
+        # and deliver refreshes the model deferred for rows that were off-screen
+        self.verticalScrollBar().valueChanged.connect(self._on_viewport_changed)
+        self.horizontalScrollBar().valueChanged.connect(self._on_viewport_changed)
+
+    def setModel(self, model) -> None:  # noqa: N802 - Qt override
+        super().setModel(model)
+        if model is not None and hasattr(model, "attach_view"):
+            model.attach_view(self)
+        self._on_viewport_changed()
+
+    def resizeEvent(self, event) -> None:  # noqa: N802 - Qt override
+        super().resizeEvent(event)
+        self._on_viewport_changed()
+
+    def visible_row_range(self) -> tuple[int, int]:
+        """Return (first, last) visible row indexes, or (-1, -1) when empty."""
+        model = self.model()
+        if model is None or model.rowCount() == 0:
+            return -1, -1
+        first = self.rowAt(0)
+        last = self.rowAt(self.viewport().height() - 1)
+        return max(first, 0), (model.rowCount() - 1 if last < 0 else last)
+
+    def visible_column_range(self) -> tuple[int, int]:
+        """Return (first, last) visible column indexes, or (-1, -1) when empty."""
+        model = self.model()
+        if model is None or model.columnCount() == 0:
+            return -1, -1
+        first = self.columnAt(0)
+        last = self.columnAt(self.viewport().width() - 1)
+        return max(first, 0), (model.columnCount() - 1 if last < 0 else last)
+
+    def _on_viewport_changed(self, *_args) -> None:
+        model = self.model()
+        if model is None or not hasattr(model, "prewarm_viewport"):
+            return
+        top, bottom = self.visible_row_range()
+        left, right = self.visible_column_range()
+        if top < 0 or left < 0:
+            return
+        model.flush_deferred_refresh(top, bottom)
+        model.prewarm_viewport(top, bottom, left, right)
+
     def _on_header_right_click(self, pos) -> None:
         section = self.horizontalHeader().logicalIndexAt(pos)
         if section >= 0:
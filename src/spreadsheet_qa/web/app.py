@@ -15,7 +15,10 @@ Run with:
 
 from __future__ import annotations
 
+import hashlib
+import heapq
 import io
+import json
 import logging
 import os
 import sys
@@ -23,20 +26,26 @@ import pickle
 import re
 import tempfile
 import unicodedata
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from datetime import datetime
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Hashable, Iterable
 
 import yaml
 
+import numpy as np
 import pandas as pd
 from fastapi import FastAPI, File, Form, HTTPException, Request, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 
+from spreadsheet_qa.core import _fix_kernels
 from spreadsheet_qa.core.commands import Command
 from spreadsheet_qa.core.dataset import DatasetLoader, list_workbook_sheet_names_from_bytes
 from spreadsheet_qa.core.engine import RuleFailure, ValidationEngine
@@ -49,11 +58,36 @@ from spreadsheet_qa.core.exporters import (
     build_annotated_dataframe,
 )
 from spreadsheet_qa.core.format_detection import detect_column_format
-from spreadsheet_qa.core.models import IssueStatus, Severity
+from spreadsheet_qa.core.models import DatasetMeta, IssueStatus, Severity
 from spreadsheet_qa.core.nakala_api import NakalaClient
 from spreadsheet_qa.core.template_manager import TemplateManager
 from spreadsheet_qa.core.text_utils import INVISIBLE_RE, UNICODE_SUSPECTS
-from spreadsheet_qa.web.jobs import Job, JobState, ProblemRow, ValidationSummary, job_manager
+from spreadsheet_qa.web.jobs import (
+    PREVIEW_ROWS,
+    Job,
+    JobState,
+    ProblemIndex,
+    ProblemRow,
+    ValidationSummary,
+    job_manager,
+    read_job_df,
+    read_job_preview,
+    save_job_df,
+    write_job_df,
+)
+
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
+try:
+    from yaml import CSafeDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper
+    from yaml import SafeLoader as _YamlLoader
 
 # ---------------------------------------------------------------------------
 # Configuration via variables d'environnement
@@ -113,10 +147,14 @@ def _rule_failures_payload(rule_failures: list[RuleFailure]) -> list[dict[str, s
 class WebBulkFixCommand(Command):
     """Wraps a batch of cell edits (hygiene fixes) as an undoable/redoable command.
 
-    Rather than holding a live DataFrame reference, it stores the pickle path
+    Rather than holding a live DataFrame reference, it stores the persisted df path
     and applies / reverses each ``(row_idx, col, old_val, new_val)`` change by
-    reloading and re-saving the pickle on every execute/undo call.
+    reloading and re-saving that file on every execute/undo call.
     This keeps the command serialisable-friendly and avoids stale df references.
+
+    With *job_id*, the job's cached DataFrame (see ``_load_df``) stands in for
+    the reload when it is current, and the edited frame replaces it afterwards,
+    so the next request does not read the file back.
     """
 
     def __init__(
@@ -124,23 +162,31 @@ class WebBulkFixCommand(Command):
         df_path: Path,
         changes: list[tuple],
         label: str = "Correctifs d'hygiène",
+        job_id: str | None = None,
     ) -> None:
         self._df_path = df_path
         # list of (row_idx, col, old_val, new_val)
         self._changes = changes
         self._label = label
+        self._job_id = job_id
 
     def execute(self) -> None:
-        df = pd.read_pickle(str(self._df_path))
-        for row_idx, col, _, new_val in self._changes:
-            df.at[row_idx, col] = new_val
-        df.to_pickle(str(self._df_path))
+        self._write_cells((row_idx, col, new_val) for row_idx, col, _, new_val in self._changes)
 
     def undo(self) -> None:
-        df = pd.read_pickle(str(self._df_path))
-        for row_idx, col, old_val, _ in self._changes:
-            df.at[row_idx, col] = old_val
-        df.to_pickle(str(self._df_path))
+        self._write_cells((row_idx, col, old_val) for row_idx, col, old_val, _ in self._changes)
+
+    def _write_cells(self, cells: Iterable[tuple]) -> None:
+        cached = None
+        if self._job_id is not None:
+            cached = job_manager.get_cached_df(self._job_id, _df_stamp(self._df_path))
+        # The cached frame is shared with concurrent readers: edit a copy
+        df = cached.copy() if cached is not None else read_job_df(self._df_path)
+        for row_idx, col, val in cells:
+            df.at[row_idx, col] = val
+        write_job_df(df, self._df_path)
+        if self._job_id is not None:
+            job_manager.cache_df(self._job_id, _df_stamp(self._df_path), df)
 
     @property
     def description(self) -> str:
@@ -178,10 +224,45 @@ _nakala_client = NakalaClient(cache_path=_nakala_cache_path)
 # Application FastAPI
 # ---------------------------------------------------------------------------
 
+class _ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson (much faster on large problem lists)."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
+def _cached_json_response(index: ProblemIndex, key: tuple, build: Callable[[], Any]) -> Any:
+    """Return the payload cached on *index* under *key*.
+
+    With orjson the cache holds the encoded body, so a repeated request is
+    answered without serializing the payload again.
+    """
+    if not _ORJSON_AVAILABLE:
+        return index.cached_response(key, build)
+    body = index.cached_response(key, lambda: _ORJSONResponse(build()).body)
+    return Response(content=body, media_type="application/json")
+
+
+def _not_modified(request: Request, response: Response, *parts: Any) -> Response | None:
+    """Tag *response* with an ETag derived from *parts*.
+
+    Returns a 304 response when the client's ``If-None-Match`` already holds
+    that tag, so the caller can skip building the body.  ``no-cache`` makes
+    browsers revalidate instead of reusing the entry heuristically.
+    """
+    etag = '"%s"' % hashlib.blake2b(repr(parts).encode(), digest_size=8).hexdigest()
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
+
+
 app = FastAPI(
     title="Tablerreur API",
     description="API de contrôle qualité pour tableurs CSV/XLSX",
     version="0.1.0",
+    default_response_class=_ORJSONResponse if _ORJSON_AVAILABLE else JSONResponse,
 )
 
 app.add_middleware(
@@ -244,25 +325,38 @@ async def health():
     return {"status": "ok", "version": __version__}
 
 
+@app.head("/health")
+async def health_head():
+    """Readiness probe without a body (used by the launcher)."""
+    return Response()
+
+
 # ---------------------------------------------------------------------------
 # Dataset preview (used by the configure step)
 # ---------------------------------------------------------------------------
 
 
 @app.get("/api/jobs/{job_id}/preview")
-async def preview_job(job_id: str, rows: int = 30):
+async def preview_job(job_id: str, request: Request, response: Response, rows: int = 30):
     """Return the first *rows* rows of the DataFrame as a JSON-serialisable list."""
     job = _get_job(job_id)
-    df = _load_df(job)
-    n = min(max(1, rows), len(df))
-    data_rows = [
-        [("" if pd.isna(v) else str(v)) for v in df.iloc[i]]
-        for i in range(n)
-    ]
+    rows = max(1, rows)
+    if job._df_path is not None and job._df_path.exists():
+        not_modified = _not_modified(request, response, "preview", job.id, _df_stamp(job._df_path), rows)
+        if not_modified is not None:
+            return not_modified
+    sidecar = read_job_preview(job.work_dir) if rows <= PREVIEW_ROWS else None
+    if sidecar is not None:
+        head, total = sidecar
+    else:
+        df = await run_in_threadpool(_load_df, job)
+        head, total = df, len(df)
+    head = head.iloc[: min(rows, total)]
+    data_rows = head.astype(str).where(head.notna(), "").to_numpy(dtype=object).tolist()
     return {
-        "columns": list(df.columns),
+        "columns": list(head.columns),
         "rows": data_rows,
-        "total_rows": len(df),
+        "total_rows": total,
     }
 
 
@@ -510,19 +604,27 @@ def _has_manual_format_override(user_cfg: dict[str, Any], template_cfg: dict[str
 
 
 @app.get("/api/jobs/{job_id}/column-config")
-async def get_column_config(job_id: str):
+async def get_column_config(job_id: str, request: Request, response: Response):
     """Return per-column config merging template defaults with user overrides."""
     job = _get_job(job_id)
-    df = _load_df(job)
+    # column_config and the template choice only change through endpoints
+    # that call job_manager.update(), which bumps the revision; the template
+    # files themselves can be edited on disk at any time
+    not_modified = _not_modified(
+        request,
+        response,
+        "column-config",
+        job.id,
+        job.revision,
+        _template_stamp(job.template_id, job.overlay_id),
+    )
+    if not_modified is not None:
+        return not_modified
+    df = await run_in_threadpool(_load_df, job)
 
     # Get template-derived defaults
     try:
-        mgr = TemplateManager()
-        tpl_config = mgr.compile_config(
-            generic_id=job.template_id,
-            overlay_id=job.overlay_id,
-            column_names=list(df.columns),
-        )
+        tpl_config = _shared_template_config(job.template_id, job.overlay_id, tuple(df.columns))
         tpl_columns: dict = tpl_config.get("columns", {})
     except Exception:
         tpl_columns = {}
@@ -537,44 +639,15 @@ async def get_column_config(job_id: str):
         user_format_overrides[col] = _has_manual_format_override(user, tpl)
         allowed_layers = _resolve_allowed_values_layers(tpl, user)
 
-        def _pick(key: str, default):
-            # User override wins if set, else template, else default
-            if key in user and user[key] is not None:
-                return user[key]
-            v = tpl.get(key)
-            if v is not None and v != [] and v != "":
-                return v
-            return default
-
-        result[col] = _canonicalize_format_config_dict({
-            "required": _pick("required", False),
-            "content_type": _pick("content_type", None),
-            "unique": _pick("unique", False),
-            "multiline_ok": _pick("multiline_ok", False),
-            "allowed_values": allowed_layers["effective_allowed_values"],
-            "allowed_values_domain": allowed_layers["domain_allowed_values"],
-            "allowed_values_selection": allowed_layers["selected_allowed_values"],
-            "allowed_values_locked": _pick("allowed_values_locked", False),
-            "regex": _pick("regex", None),
-            "format_preset": _pick("format_preset", None),
-            "min_length": _pick("min_length", None),
-            "max_length": _pick("max_length", None),
-            "forbidden_chars": _pick("forbidden_chars", None),
-            "expected_case": _pick("expected_case", None),
-            "yes_no_true_values": _pick("yes_no_true_values", None),
-            "yes_no_false_values": _pick("yes_no_false_values", None),
-            "list_separator": _pick("list_separator", None),
-            "list_unique": _pick("list_unique", False),
-            "list_no_empty": _pick("list_no_empty", True),
-            "list_min_items": _pick("list_min_items", None),
-            "list_max_items": _pick("list_max_items", None),
-            "nakala_vocabulary": _pick("nakala_vocabulary", None),
-            "detect_rare_values": _pick("detect_rare_values", False),
-            "rare_threshold": _pick("rare_threshold", 1),
-            "rare_min_total": _pick("rare_min_total", 10),
-            "detect_similar_values": _pick("detect_similar_values", False),
-            "similar_threshold": _pick("similar_threshold", 85),
-        })
+        # Defaults, then non-empty template values, then user overrides
+        merged = dict(_COLUMN_DEFAULTS)
+        merged.update({k: v for k, v in tpl.items() if v is not None and v != [] and v != ""})
+        merged.update({k: v for k, v in user.items() if v is not None})
+        merged["allowed_values"] = allowed_layers["effective_allowed_values"]
+        merged["allowed_values_domain"] = allowed_layers["domain_allowed_values"]
+        merged["allowed_values_selection"] = allowed_layers["selected_allowed_values"]
+
+        result[col] = _canonicalize_format_config_dict({k: merged[k] for k in _COLUMN_DEFAULTS})
 
     return {
         "columns": result,
@@ -586,12 +659,7 @@ async def get_column_config(job_id: str):
 def _compile_template_metadata(template_id: str, overlay_id: str | None) -> dict[str, Any]:
     """Return the exact column definitions carried by the active template."""
     try:
-        mgr = TemplateManager()
-        tpl_config = mgr.compile_config(
-            generic_id=template_id,
-            overlay_id=overlay_id,
-            column_names=None,
-        )
+        tpl_config = _shared_template_config(template_id, overlay_id, None)
     except Exception:
         tpl_config = {}
 
@@ -650,10 +718,7 @@ async def update_column_config(job_id: str, request: Request):
     columns_updates: dict = body.get("columns", {})
 
     for col, cfg in columns_updates.items():
-        if col not in job.column_config:
-            job.column_config[col] = {}
-        for key, val in cfg.items():
-            job.column_config[col][key] = val
+        job.column_config.setdefault(col, {}).update(cfg)
         if any(key in _FORMAT_OVERRIDE_KEYS for key in cfg):
             job.column_config[col] = _apply_canonical_format_keys(job.column_config[col])
 
@@ -698,6 +763,22 @@ async def update_job_template(job_id: str, body: JobTemplateUpdate):
 # ---------------------------------------------------------------------------
 
 
+# Rows stripped per vectorized step when looking for OK samples in preview_rule
+_PREVIEW_SAMPLE_CHUNK = 1024
+
+
+def _run_preview_rules(rules: list, df: pd.DataFrame, column: str, config: dict) -> list:
+    """Run *rules* on *column* and return their issues; a failing rule is skipped."""
+    all_issues = []
+    for rule in rules:
+        try:
+            col_arg = column if rule.per_column else None
+            all_issues.extend(rule.check(df, col_arg, config))
+        except Exception:
+            pass
+    return all_issues
+
+
 @app.post("/api/jobs/{job_id}/preview-rule")
 async def preview_rule(job_id: str, request: Request):
     """Preview the impact of a column config on actual column data.
@@ -706,7 +787,7 @@ async def preview_rule(job_id: str, request: Request):
     plus total counts of passing / failing rows.
     """
     job = _get_job(job_id)
-    df = _load_df(job)
+    df = await run_in_threadpool(_load_df, job)
     body = await request.json()
     column: str = body.get("column", "")
     config: dict = _apply_effective_allowed_values(
@@ -750,43 +831,46 @@ async def preview_rule(job_id: str, request: Request):
         SoftTypingRule(),
     ]
 
-    all_issues = []
-    for rule in rules:
-        try:
-            col_arg = column if rule.per_column else None
-            issues = rule.check(df, col_arg, preview_config)
-            all_issues.extend(issues)
-        except Exception:
-            pass
-
-    fail_rows: set[int] = {i.row for i in all_issues}
+    all_issues = await run_in_threadpool(_run_preview_rules, rules, df, column, preview_config)
 
-    # 3 distinct OK samples (non-empty, non-failing)
-    sample_ok: list[str] = []
-    seen_ok: set[str] = set()
-    for row_idx in df.index:
-        if row_idx not in fail_rows:
-            val = df.at[row_idx, column]
-            if not pd.isna(val) and str(val).strip():
-                v = str(val).strip()
-                if v not in seen_ok:
-                    seen_ok.add(v)
-                    sample_ok.append(v)
-            if len(sample_ok) >= 3:
-                break
-
-    # 3 distinct fail samples (row → first issue)
+    # Failing rows and their first issue, in one pass
     row_first_issue: dict[int, Any] = {}
     for issue in all_issues:
-        if issue.row not in row_first_issue:
-            row_first_issue[issue.row] = issue
+        row_first_issue.setdefault(issue.row, issue)
+    fail_rows = row_first_issue.keys()
+
+    # Issue.row is the 0-based position into df: index the column arrays directly
+    values = df[column].astype(object).to_numpy()
+    missing = df[column].isna().to_numpy()
+
+    # 3 distinct OK samples (non-empty, non-failing).  Stripping and dedup run
+    # vectorized over chunks, so a column repeating the same value is not
+    # walked row by row in Python.
+    ok_mask = ~missing
+    if fail_rows:
+        ok_mask[np.fromiter(fail_rows, dtype=np.int64, count=len(fail_rows))] = False
+    ok_values = pd.Series(values[ok_mask], dtype=object)
+    sample_ok: list[str] = []
+    for start in range(0, len(ok_values), _PREVIEW_SAMPLE_CHUNK):
+        chunk = ok_values.iloc[start:start + _PREVIEW_SAMPLE_CHUNK].map(str).str.strip()
+        for v in pd.unique(chunk[chunk != ""]):
+            if v not in sample_ok:
+                sample_ok.append(v)
+                if len(sample_ok) >= 3:
+                    break
+        if len(sample_ok) >= 3:
+            break
 
+    # 3 distinct fail samples (row → first issue), taken in row order: pop
+    # rows from a heap instead of sorting every failing row
     sample_fail: list[dict] = []
     seen_fail: set[tuple] = set()
-    for row_idx in sorted(row_first_issue):
+    pending_rows = list(row_first_issue)
+    heapq.heapify(pending_rows)
+    while pending_rows:
+        row_idx = heapq.heappop(pending_rows)
         issue = row_first_issue[row_idx]
-        raw = df.at[row_idx, column]
-        val = "" if pd.isna(raw) else str(raw)
+        val = "" if missing[row_idx] else str(values[row_idx])
         key = (val[:60], issue.message[:120])
         if key not in seen_fail:
             seen_fail.add(key)
@@ -810,14 +894,14 @@ async def preview_rule(job_id: str, request: Request):
 async def detect_format(job_id: str, request: Request):
     """Suggest a content type / format preset for one column."""
     job = _get_job(job_id)
-    df = _load_df(job)
+    df = await run_in_threadpool(_load_df, job)
     body = await request.json()
     column: str = body.get("column", "")
 
     if not column or column not in df.columns:
         raise HTTPException(status_code=400, detail="Colonne introuvable")
 
-    return detect_column_format(df[column], column_name=column)
+    return await run_in_threadpool(detect_column_format, df[column], column_name=column)
 
 
 # ---------------------------------------------------------------------------
@@ -825,6 +909,47 @@ async def detect_format(job_id: str, request: Request):
 # ---------------------------------------------------------------------------
 
 
+_UPLOAD_CHUNK_BYTES = 1024 * 1024
+
+
+async def _stream_upload_to(upload: UploadFile, dest: Path, max_bytes: int) -> bool:
+    """Copy *upload* to *dest* chunk by chunk.
+
+    Returns False (and removes the partial file) as soon as more than
+    *max_bytes* have been received.
+    """
+    total = 0
+    with open(dest, "wb") as fh:
+        while True:
+            chunk = await upload.read(_UPLOAD_CHUNK_BYTES)
+            if not chunk:
+                break
+            total += len(chunk)
+            if total > max_bytes:
+                break
+            fh.write(chunk)
+    if total > max_bytes:
+        dest.unlink(missing_ok=True)
+        return False
+    return True
+
+
+async def _read_upload_capped(upload: UploadFile, max_bytes: int) -> bytes | None:
+    """Read *upload* chunk by chunk, or return None once it exceeds *max_bytes*.
+
+    Oversized uploads are rejected after at most one chunk past the limit
+    instead of being buffered whole.
+    """
+    buf = bytearray()
+    while True:
+        chunk = await upload.read(_UPLOAD_CHUNK_BYTES)
+        if not chunk:
+            return bytes(buf)
+        buf += chunk
+        if len(buf) > max_bytes:
+            return None
+
+
 @app.post("/api/inspect-workbook-sheets")
 async def inspect_workbook_sheets(file: UploadFile = File(...)):
     """Liste les feuilles d'un classeur Excel (sélection avant téléversement du job)."""
@@ -840,8 +965,8 @@ async def inspect_workbook_sheets(file: UploadFile = File(...)):
             status_code=415,
             detail="Type de fichier non pris en charge. Formats acceptés : CSV, XLSX, XLS, XLSM.",
         )
-    content = await file.read()
-    if len(content) > _MAX_UPLOAD_BYTES:
+    content = await _read_upload_capped(file, _MAX_UPLOAD_BYTES)
+    if content is None:
         raise HTTPException(
             status_code=413,
             detail=f"Le fichier dépasse la taille maximale autorisée ({_MAX_UPLOAD_MB} Mo).",
@@ -875,23 +1000,20 @@ async def create_job(
             detail="Type de fichier non pris en charge. Formats acceptés : CSV, XLSX, XLS, XLSM.",
         )
 
-    # --- Lecture et vérification de la taille ---
-    content = await file.read()
-    if len(content) > _MAX_UPLOAD_BYTES:
-        raise HTTPException(
-            status_code=413,
-            detail=f"Le fichier dépasse la taille maximale autorisée ({_MAX_UPLOAD_MB} Mo).",
-        )
-
     job = job_manager.create()
     job.state = JobState.LOADING
     job.filename = file.filename or "fichier"
     job.template_id = template_id
     job.overlay_id = overlay_id or None
 
-    # Save upload
+    # --- Écriture par blocs et vérification de la taille ---
     upload_path = job.work_dir / f"input{suffix}"
-    upload_path.write_bytes(content)
+    if not await _stream_upload_to(file, upload_path, _MAX_UPLOAD_BYTES):
+        job_manager.delete(job.id)
+        raise HTTPException(
+            status_code=413,
+            detail=f"Le fichier dépasse la taille maximale autorisée ({_MAX_UPLOAD_MB} Mo).",
+        )
     job.upload_path = upload_path
 
     # Load with DatasetLoader
@@ -906,7 +1028,7 @@ async def create_job(
         if suffix in _WORKBOOK_EXTENSIONS:
             sn = (sheet_name or "").strip()
             load_kw["sheet_name"] = sn if sn else 0
-        df, meta = loader.load(**load_kw)
+        df, meta = await run_in_threadpool(loader.load, **load_kw)
     except Exception as exc:
         job.state = JobState.ERROR
         job.error_msg = str(exc)
@@ -918,10 +1040,10 @@ async def create_job(
     job.columns = list(df.columns)
     job.state = JobState.PENDING
 
-    # Pickle the DataFrame for downstream steps
-    df_path = job.work_dir / "df.pkl"
-    df.to_pickle(str(df_path))
+    # Persist the DataFrame for downstream steps
+    df_path = await run_in_threadpool(save_job_df, df, job.work_dir)
     job._df_path = df_path
+    job_manager.cache_df(job.id, _df_stamp(df_path), df)
 
     job_manager.update(job)
     return {
@@ -952,10 +1074,10 @@ async def apply_fixes(
 ):
     """Apply selected hygiene fixes to the dataset."""
     job = _get_job(job_id)
-    df = _load_df(job)
+    df = await run_in_threadpool(_load_df, job)
     job.state = JobState.FIXING
 
-    target_cols = [c.strip() for c in columns.split(",") if c.strip()] if columns else list(df.columns)
+    target_cols = _fix_target_columns(df, columns)
 
     fixes_applied = {
         "trim": trim,
@@ -968,23 +1090,12 @@ async def apply_fixes(
     job.fixes_applied = fixes_applied
 
     # Compute changes (before/after) without modifying df in-place
-    changes: list[tuple] = []
-    for col in target_cols:
-        if col not in df.columns:
-            continue
-        for row_idx in df.index:
-            val = df.at[row_idx, col]
-            if pd.isna(val):
-                continue
-            orig = str(val)
-            fixed = _apply_fixes(orig, fixes_applied)
-            if fixed != orig:
-                changes.append((row_idx, col, orig, fixed))
+    changes = await run_in_threadpool(_collect_fix_changes, df, target_cols, fixes_applied)
 
     if changes:
-        # CommandHistory.push() calls execute() → applies changes + saves pickle
-        cmd = WebBulkFixCommand(job._df_path, changes)
-        job.command_history.push(cmd)
+        # CommandHistory.push() calls execute() → applies changes + saves the df file
+        cmd = WebBulkFixCommand(job._df_path, changes, job_id=job.id)
+        await run_in_threadpool(job.command_history.push, cmd)
 
     job.cells_fixed = len(changes)
     job.state = JobState.PENDING
@@ -993,22 +1104,173 @@ async def apply_fixes(
     return {"cells_fixed": len(changes), "state": job.state.value}
 
 
+_FIX_OPTIONS = (
+    "trim",
+    "collapse_spaces",
+    "replace_nbsp",
+    "strip_invisible",
+    "normalize_unicode",
+    "normalize_newlines",
+)
+_COLLAPSE_RE = re.compile(r" {2,}")
+
+
+@lru_cache(maxsize=64)
+def _make_fixer(enabled: tuple[str, ...]) -> Callable[[str], str]:
+    """Return a function applying exactly the *enabled* fixes to one string.
+
+    The body is generated once per option set so the per-cell path carries no
+    option checks.  Fixes run in the order of the fix pack: strip (trim, and
+    collapse_spaces' trailing strip, which is equivalent when done first),
+    space collapse, NBSP, invisible characters, Unicode substitutions + NFC,
+    newlines.  The non-ASCII fixes are skipped for pure ASCII values.
+    """
+    on = set(enabled)
+    lines = ["def _fix(v):"]
+    if on & {"trim", "collapse_spaces"}:
+        lines.append("    v = v.strip()")
+    if "collapse_spaces" in on:
+        lines.append("    if '  ' in v: v = _COLLAPSE_RE.sub(' ', v)")
+    if on & {"replace_nbsp", "strip_invisible", "normalize_unicode"}:
+        lines.append("    if not v.isascii():")
+        if "replace_nbsp" in on:
+            lines.append("        v = v.replace('\\u00a0', ' ')")
+        if "strip_invisible" in on:
+            lines.append("        v = INVISIBLE_RE.sub('', v)")
+        if "normalize_unicode" in on:
+            lines.extend(f"        v = v.replace({ch!r}, {rep!r})" for ch, rep in UNICODE_SUSPECTS.items())
+            lines.append("        v = unicodedata.normalize('NFC', v)")
+    if "normalize_newlines" in on:
+        lines.append("    if '\\r' in v: v = v.replace('\\r\\n', '\\n').replace('\\r', '\\n')")
+    lines.append("    return v")
+    namespace = {"_COLLAPSE_RE": _COLLAPSE_RE, "INVISIBLE_RE": INVISIBLE_RE, "unicodedata": unicodedata}
+    exec("\n".join(lines), namespace)
+    return namespace["_fix"]
+
+
+def _fixer_for(opts: dict[str, bool]) -> Callable[[str], str]:
+    return _make_fixer(tuple(k for k in _FIX_OPTIONS if opts.get(k)))
+
+
 def _apply_fixes(value: str, opts: dict[str, bool]) -> str:
-    if opts.get("trim"):
-        value = value.strip()
+    return _fixer_for(opts)(value)
+
+
+def _apply_fixes_series(values: pd.Series, opts: dict[str, bool]) -> pd.Series:
+    """:func:`_apply_fixes` over a Series of ``str`` values.
+
+    One pass of the specialized fixer per cell; this beats a chain of ``.str``
+    calls on object data, where each call is its own Python-level loop.
+    """
+    fixer = _fixer_for(opts)
+    return pd.Series([fixer(v) for v in values], index=values.index, dtype=object)
+
+
+def _fix_target_columns(df: pd.DataFrame, columns: str) -> list[str]:
+    """Parse the comma-separated *columns* form field (empty = all) into existing columns.
+
+    Numeric and boolean columns are left out: their string form never holds
+    anything the hygiene fixes could change.
+    """
+    if not columns:
+        names = list(df.columns)
+    else:
+        existing = set(df.columns)
+        names = [c for c in (part.strip() for part in columns.split(",")) if c and c in existing]
+    return [c for c in names if _is_text_column(df[c])]
+
+
+def _is_text_column(series: pd.Series) -> bool:
+    return not (
+        pd.api.types.is_numeric_dtype(series.dtype) or pd.api.types.is_bool_dtype(series.dtype)
+    )
+
+
+def _collect_fix_changes(
+    df: pd.DataFrame, target_cols: list[str], opts: dict[str, bool]
+) -> list[tuple]:
+    """Return ``(row_idx, col, old, new)`` for every cell of *target_cols* the fixes change.
+
+    *target_cols* must be existing columns (see :func:`_fix_target_columns`).
+    """
+    changes: list[tuple] = []
+    for col in target_cols:
+        orig, fixed = _column_fix_changes(df[col], opts)
+        changes.extend(zip(orig.index, repeat(col), orig, fixed))
+    return changes
+
+
+# Above this many cells per column, whitespace-only fix packs on object
+# columns go through the compiled kernel (when numba is installed) instead of
+# the per-cell fixer.
+_FIX_KERNEL_MIN_ROWS = 10_000
+
+
+# Fixes _apply_fixes_arrow covers (normalize_unicode needs per-cell NFC)
+_ARROW_FIXES = _fix_kernels.KERNEL_FIXES | {"strip_invisible"}
+# INVISIBLE_RE's character class in RE2 syntax (\x{...} instead of \u....)
+_INVISIBLE_RE2 = re.sub(r"\\u([0-9a-fA-F]{4})", r"\\x{\1}", INVISIBLE_RE.pattern)
+
+
+def _apply_fixes_arrow(values: pd.Series, opts: dict[str, bool]) -> pd.Series:
+    """The fix pack minus normalize_unicode on an Arrow-backed string Series.
+
+    Each step is one Arrow compute kernel over the whole column; regex steps
+    get their pattern as a string so they run in RE2, not ``re``.  Arrow's
+    whitespace trim strips the same code points as ``str.strip``.
+    """
+    if opts.get("trim") or opts.get("collapse_spaces"):
+        values = values.str.strip()
     if opts.get("collapse_spaces"):
-        value = re.sub(r"  +", " ", value).strip()
+        values = values.str.replace(_COLLAPSE_RE.pattern, " ", regex=True)
     if opts.get("replace_nbsp"):
-        value = value.replace("\u00a0", " ")
+        values = values.str.replace("\u00a0", " ", regex=False)
     if opts.get("strip_invisible"):
-        value = INVISIBLE_RE.sub("", value)
-    if opts.get("normalize_unicode"):
-        for ch, rep in UNICODE_SUSPECTS.items():
-            value = value.replace(ch, rep)
-        value = unicodedata.normalize("NFC", value)
+        values = values.str.replace(_INVISIBLE_RE2, "", regex=True)
     if opts.get("normalize_newlines"):
-        value = value.replace("\r\n", "\n").replace("\r", "\n")
-    return value
+        values = values.str.replace("\r\n", "\n", regex=False).str.replace("\r", "\n", regex=False)
+    return values
+
+
+def _column_fix_changes(
+    series: pd.Series, opts: dict[str, bool]
+) -> tuple[pd.Series, pd.Series]:
+    """Return ``(before, after)`` for the cells of *series* the fixes would change.
+
+    Missing values are skipped; both Series keep the DataFrame index.
+    """
+    orig, fixed, changed = _column_fix_pass(series, opts)
+    return orig[changed].astype(object), fixed[changed].astype(object)
+
+
+def _column_fix_pass(
+    series: pd.Series, opts: dict[str, bool]
+) -> tuple[pd.Series, pd.Series, np.ndarray]:
+    """Run the fixes over the non-missing cells of *series*.
+
+    Returns ``(before, after, changed)`` where *changed* is the boolean mask of
+    the cells the fixes modify; callers that only need a count sum the mask.
+    """
+    enabled = {k for k, v in opts.items() if v}
+    if isinstance(series.array, pd.arrays.ArrowStringArray) and enabled <= _ARROW_FIXES:
+        orig = series[series.notna()]
+        fixed = _apply_fixes_arrow(orig, opts)
+        return orig, fixed, (fixed != orig).to_numpy(dtype=bool)
+
+    orig = series[series.notna()].map(str).astype(object)
+    if (
+        _fix_kernels.NUMBA_AVAILABLE
+        and len(orig) > _FIX_KERNEL_MIN_ROWS
+        and enabled <= _fix_kernels.KERNEL_FIXES
+    ):
+        fixed = pd.Series(
+            _fix_kernels.apply_whitespace_fixes(orig.tolist(), opts),
+            index=orig.index,
+            dtype=object,
+        )
+    else:
+        fixed = _apply_fixes_series(orig, opts)
+    return orig, fixed, (fixed != orig).to_numpy(dtype=bool)
 
 
 @app.get("/api/jobs/{job_id}/history")
@@ -1030,7 +1292,7 @@ async def undo_fix(job_id: str):
         }
         payload.update(_history_payload(job))
         return payload
-    h.undo()
+    await run_in_threadpool(h.undo)
     job_manager.update(job)
     payload = {
         "success": True,
@@ -1053,7 +1315,7 @@ async def redo_fix(job_id: str):
         }
         payload.update(_history_payload(job))
         return payload
-    h.redo()
+    await run_in_threadpool(h.redo)
     job_manager.update(job)
     payload = {
         "success": True,
@@ -1081,7 +1343,7 @@ async def edit_cell(job_id: str, request: Request):
     if row is None or column is None or value is None:
         raise HTTPException(status_code=422, detail="Paramètres manquants : row, column, value")
 
-    df = _load_df(job)
+    df = await run_in_threadpool(_load_df, job)
     if column not in df.columns:
         raise HTTPException(status_code=422, detail=f"Colonne inconnue : {column!r}")
     if not (isinstance(row, int) and 0 <= row < len(df)):
@@ -1095,8 +1357,9 @@ async def edit_cell(job_id: str, request: Request):
         job._df_path,
         [(row, column, old_value, new_value)],
         label=f"Édition manuelle — {column}[{row + 1}]",
+        job_id=job.id,
     )
-    job.command_history.push(cmd)
+    await run_in_threadpool(job.command_history.push, cmd)
     job.exports_dirty = True
     job_manager.update(job)
 
@@ -1119,7 +1382,7 @@ async def edit_cells(job_id: str, request: Request):
     if not edits:
         raise HTTPException(status_code=422, detail="La liste d'éditions est vide")
 
-    df = _load_df(job)
+    df = await run_in_threadpool(_load_df, job)
     changes: list[tuple] = []
     results: list[dict] = []
 
@@ -1146,8 +1409,9 @@ async def edit_cells(job_id: str, request: Request):
         job._df_path,
         changes,
         label=f"Éditions manuelles en masse ({n} cellule{'s' if n != 1 else ''})",
+        job_id=job.id,
     )
-    job.command_history.push(cmd)
+    await run_in_threadpool(job.command_history.push, cmd)
     job.exports_dirty = True
     job_manager.update(job)
 
@@ -1168,7 +1432,7 @@ async def preview_fixes(
 ):
     """Return a preview of which cells would be modified (without applying)."""
     job = _get_job(job_id)
-    df = _load_df(job)
+    df = await run_in_threadpool(_load_df, job)
 
     opts = {
         "trim": trim,
@@ -1178,34 +1442,34 @@ async def preview_fixes(
         "normalize_unicode": normalize_unicode,
         "normalize_newlines": normalize_newlines,
     }
-    target_cols = [c.strip() for c in columns.split(",") if c.strip()] if columns else list(df.columns)
+    target_cols = _fix_target_columns(df, columns)
+    total, preview = await run_in_threadpool(_preview_fix_changes, df, target_cols, opts, limit)
+    return {"total": total, "aperçu": preview}
 
-    preview: list[dict] = []
-    for col in target_cols:
-        if col not in df.columns:
-            continue
-        for row_idx in df.index:
-            val = df.at[row_idx, col]
-            if pd.isna(val):
-                continue
-            orig = str(val)
-            fixed = _apply_fixes(orig, opts)
-            if fixed != orig:
-                preview.append({"colonne": col, "ligne": int(row_idx) + 1, "avant": orig, "après": fixed})
-                if len(preview) >= limit:
-                    break
-        if len(preview) >= limit:
-            break
 
-    total = sum(
-        1
-        for col in target_cols
-        if col in df.columns
-        for row_idx in df.index
-        if not pd.isna(df.at[row_idx, col]) and _apply_fixes(str(df.at[row_idx, col]), opts) != str(df.at[row_idx, col])
-    )
+def _preview_fix_changes(
+    df: pd.DataFrame, target_cols: list[str], opts: dict[str, bool], limit: int
+) -> tuple[int, list[dict]]:
+    """Count the cells the fixes would change and describe the first *limit* of them.
 
-    return {"total": total, "aperçu": preview}
+    Once the sample is full, the remaining columns only contribute the sum of
+    their change mask.
+    """
+    preview: list[dict] = []
+    total = 0
+    for col in target_cols:
+        orig, fixed, changed = _column_fix_pass(df[col], opts)
+        total += int(changed.sum())
+        room = limit - len(preview)
+        if room > 0:
+            positions = np.flatnonzero(changed)[:room]
+            preview.extend(
+                {"colonne": col, "ligne": int(row_idx) + 1, "avant": before, "après": after}
+                for row_idx, before, after in zip(
+                    orig.index[positions], orig.iloc[positions], fixed.iloc[positions]
+                )
+            )
+    return total, preview
 
 
 _VALID_EXPORT_SCOPES = {"all", "issues", "blocking", "touched"}
@@ -1213,22 +1477,79 @@ _VALID_ANNOTATED_EXPORT_FORMATS = {"xlsx", "csv"}
 _VALID_ISSUES_REPORT_FORMATS = {"csv", "txt"}
 
 
-def _compile_validation_config(job: Job, df: pd.DataFrame) -> dict[str, Any]:
-    mgr = TemplateManager()
-    config = mgr.compile_config(
-        generic_id=job.template_id,
-        overlay_id=job.overlay_id,
-        column_names=list(df.columns),
-        nakala_client=_nakala_client,
+def _template_stamp(template_id: str, overlay_id: str | None) -> tuple:
+    """Identify the template and overlay files a compilation would read.
+
+    Templates live in user-editable directories, so the stamp keys the compiled
+    config cache and the column-config ETag: an edit on disk is picked up
+    without restarting the server.
+    """
+    manager = TemplateManager()
+    return (
+        manager.source_stamp(template_id),
+        manager.source_stamp(overlay_id) if overlay_id else None,
     )
+
+
+@lru_cache(maxsize=64)
+def _cached_template_config(
+    template_id: str,
+    overlay_id: str | None,
+    columns: tuple[str, ...] | None,
+    stamp: tuple,
+) -> dict[str, Any]:
+    # *stamp* only takes part in the cache key
+    return TemplateManager().compile_config(
+        generic_id=template_id,
+        overlay_id=overlay_id,
+        column_names=list(columns) if columns is not None else None,
+    )
+
+
+def _compiled_template_config(
+    template_id: str, overlay_id: str | None, columns: tuple[str, ...] | None
+) -> dict[str, Any]:
+    """Return a private copy of the compiled template config.
+
+    Compilation (YAML load, merge, wildcard expansion) is cached per
+    template, overlay, column list and template file stamp; callers are free
+    to mutate the result.
+    """
+    return deepcopy(_shared_template_config(template_id, overlay_id, columns))
+
+
+def _shared_template_config(
+    template_id: str, overlay_id: str | None, columns: tuple[str, ...] | None
+) -> dict[str, Any]:
+    """Return the cached compiled template config itself, for read-only callers.
+
+    The dict is shared between requests: anything that needs to change it must
+    use :func:`_compiled_template_config` instead.
+    """
+    overlay_id = overlay_id or None
+    return _cached_template_config(
+        template_id, overlay_id, columns, _template_stamp(template_id, overlay_id)
+    )
+
+
+def _compile_validation_config(job: Job, df: pd.DataFrame) -> dict[str, Any]:
+    config = _compiled_template_config(job.template_id, job.overlay_id, tuple(df.columns))
+    # Injected after the copy: the client must be shared, not deep-copied
+    config["_nakala_client"] = _nakala_client
     if job.column_config:
         config_cols = config.setdefault("columns", {})
         for col, user_overrides in job.column_config.items():
-            template_col_cfg = deepcopy(config_cols.get(col, {}))
-            merged_col_cfg = deepcopy(template_col_cfg)
-            for key, val in _materialize_format_constraints(user_overrides).items():
-                if val is not None:
-                    merged_col_cfg[key] = val
+            # config is a private copy: the template entry needs no copy, and
+            # _apply_effective_allowed_values deep-copies the merged dict
+            template_col_cfg = config_cols.get(col, {})
+            merged_col_cfg = {
+                **template_col_cfg,
+                **{
+                    key: val
+                    for key, val in _materialize_format_constraints(user_overrides).items()
+                    if val is not None
+                },
+            }
 
             merged_col_cfg = _apply_effective_allowed_values(merged_col_cfg, template_col_cfg)
 
@@ -1310,8 +1631,6 @@ def _save_issues_snapshot(job: Job, issues: list) -> None:
 
 def _build_dataset_meta(job: Job):
     try:
-        from spreadsheet_qa.core.models import DatasetMeta
-
         return DatasetMeta(
             file_path=str(job.upload_path),
             encoding="utf-8",
@@ -1461,12 +1780,12 @@ def _work_export_path(job: Job, prefix: str, ext: str) -> Path:
 async def validate_job(job_id: str):
     """Run the validation engine on the current DataFrame."""
     job = _get_job(job_id)
-    df = _load_df(job)
+    df = await run_in_threadpool(_load_df, job)
     job.state = JobState.VALIDATING
     job_manager.update(job)
 
     try:
-        issues, rule_failures = _run_validation_for_job(job, df)
+        issues, rule_failures = await run_in_threadpool(_run_validation_for_job, job, df)
     except Exception as exc:
         job.state = JobState.ERROR
         job.error_msg = str(exc)
@@ -1474,13 +1793,13 @@ async def validate_job(job_id: str):
         raise HTTPException(status_code=500, detail=str(exc))
 
     job.summary = _build_summary_from_issues(issues)
-    job.problems = _build_problem_rows(df, issues)
-    _save_issues_snapshot(job, issues)
+    job.problems = await run_in_threadpool(_build_problem_rows, df, issues)
+    await run_in_threadpool(_save_issues_snapshot, job, issues)
     job.issue_statuses = {}
     job.exports_dirty = False
     job.validation_baseline_undo_count = job.command_history.undo_count
 
-    _generate_outputs(job, df, issues)
+    await run_in_threadpool(_generate_outputs, job, df, issues)
 
     job.error_msg = ""
     job.state = JobState.DONE
@@ -1503,21 +1822,21 @@ async def validate_job(job_id: str):
 async def revalidate_job(job_id: str):
     """Re-run validation on the current DataFrame (after manual edits)."""
     job = _get_job(job_id)
-    df = _load_df(job)
+    df = await run_in_threadpool(_load_df, job)
 
     try:
-        issues, rule_failures = _run_validation_for_job(job, df)
+        issues, rule_failures = await run_in_threadpool(_run_validation_for_job, job, df)
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc))
 
     job.summary = _build_summary_from_issues(issues)
-    job.problems = _build_problem_rows(df, issues)
-    _save_issues_snapshot(job, issues)
+    job.problems = await run_in_threadpool(_build_problem_rows, df, issues)
+    await run_in_threadpool(_save_issues_snapshot, job, issues)
     job.issue_statuses = {}
     job.exports_dirty = False
     job.validation_baseline_undo_count = job.command_history.undo_count
 
-    _generate_outputs(job, df, issues)
+    await run_in_threadpool(_generate_outputs, job, df, issues)
 
     job.error_msg = ""
     job.state = JobState.DONE
@@ -1545,26 +1864,26 @@ def _generate_outputs(job: Job, df: pd.DataFrame, issues: list) -> None:
 
     meta = _build_dataset_meta(job)
 
-    try:
-        XLSXExporter().export(df, out / "nettoyé.xlsx")
-    except Exception as exc:
-        _logger.warning("Export XLSX : %s", exc)
-        export_errors.append("Export Excel (nettoyé.xlsx) indisponible.")
-    try:
-        CSVExporter().export(df, out / "nettoyé.csv")
-    except Exception as exc:
-        _logger.warning("Export CSV : %s", exc)
-        export_errors.append("Export CSV (nettoyé.csv) indisponible.")
-    try:
-        TXTReporter().export(issues, out / "rapport.txt", meta=meta)
-    except Exception as exc:
-        _logger.warning("Export rapport TXT : %s", exc)
-        export_errors.append("Export du rapport texte indisponible.")
-    try:
-        IssuesCSVExporter().export(issues, out / "problèmes.csv", meta=meta)
-    except Exception as exc:
-        _logger.warning("Export problèmes CSV : %s", exc)
-        export_errors.append("Export de la liste des problèmes (CSV) indisponible.")
+    # The four exports are independent: run them concurrently, then report
+    # failures in a fixed order.
+    exports = [
+        ("Export XLSX", "Export Excel (nettoyé.xlsx) indisponible.",
+         XLSXExporter().export, (df, out / "nettoyé.xlsx"), {}),
+        ("Export CSV", "Export CSV (nettoyé.csv) indisponible.",
+         CSVExporter().export, (df, out / "nettoyé.csv"), {}),
+        ("Export rapport TXT", "Export du rapport texte indisponible.",
+         TXTReporter().export, (issues, out / "rapport.txt"), {"meta": meta}),
+        ("Export problèmes CSV", "Export de la liste des problèmes (CSV) indisponible.",
+         IssuesCSVExporter().export, (issues, out / "problèmes.csv"), {"meta": meta}),
+    ]
+    with ThreadPoolExecutor(max_workers=len(exports)) as pool:
+        futures = [pool.submit(fn, *args, **kwargs) for _, _, fn, args, kwargs in exports]
+        for (log_label, user_msg, _, _, _), future in zip(exports, futures):
+            try:
+                future.result()
+            except Exception as exc:
+                _logger.warning("%s : %s", log_label, exc)
+                export_errors.append(user_msg)
 
     job.export_errors = export_errors
 
@@ -1575,9 +1894,9 @@ def _generate_outputs(job: Job, df: pd.DataFrame, issues: list) -> None:
 
 
 @app.get("/api/jobs/{job_id}")
-async def get_job(job_id: str):
+async def get_job(job_id: str, request: Request, response: Response):
     job = _get_job(job_id)
-    return {
+    payload = {
         "job_id": job.id,
         "state": job.state.value,
         "filename": job.filename,
@@ -1595,6 +1914,7 @@ async def get_job(job_id: str):
         "error": job.error_msg or None,
         "avertissements_export": job.export_errors if job.state == JobState.DONE else [],
     }
+    return _not_modified(request, response, payload) or payload
 
 
 # ---------------------------------------------------------------------------
@@ -1612,36 +1932,48 @@ async def get_problems(
     status: str = "",
 ):
     """Return a paginated, filtered list of problems for a job."""
-    from collections import Counter
-
     job = _get_job(job_id)
+    index = job.problem_index()
 
-    # Apply issue_statuses overrides to effective status
     overrides = job.issue_statuses
-    effective: list[ProblemRow] = []
-    for p in job.problems:
-        eff_status = overrides.get(p.issue_id, p.status) if p.issue_id else p.status
-        if eff_status != p.status:
-            from dataclasses import replace as _dc_replace
-            p = _dc_replace(p, status=eff_status)
-        effective.append(p)
-
-    # Status breakdown (before further filters)
-    status_counts = Counter(p.status for p in effective)
-
-    # Filters
-    problems = effective
-    if severity:
-        problems = [p for p in problems if p.severity == severity]
-    if column:
-        problems = [p for p in problems if p.column == column]
-    if status:
-        problems = [p for p in problems if p.status == status]
+    overrides_key = tuple(sorted(overrides.items()))
+    key = ("problems", page, per_page, severity, column, status, overrides_key)
+    return _cached_json_response(
+        index,
+        key,
+        lambda: _problems_page(
+            job, index, overrides, overrides_key, page, per_page, severity, column, status
+        ),
+    )
+
 
-    total = len(problems)
+def _problems_page(
+    job: Job,
+    index: ProblemIndex,
+    overrides: dict[str, str],
+    overrides_key: tuple,
+    page: int,
+    per_page: int,
+    severity: str,
+    column: str,
+    status: str,
+) -> dict[str, Any]:
+    # Effective statuses and the filtered positions are shared by every page
+    # of the same view, so paging through it only slices
+    statuses, status_counts = index.cached_response(
+        ("statuses", overrides_key), lambda: index.effective_statuses(overrides)
+    )
+    positions = index.cached_response(
+        ("positions", severity, column, status, overrides_key),
+        lambda: _filter_problem_positions(index, statuses, severity, column, status),
+    )
+
+    total = len(positions)
     start = (page - 1) * per_page
     end = start + per_page
-    page_items = problems[start:end]
+    page_items = [
+        (job.problems[i], statuses[i]) for i in positions[max(0, start):max(0, end)].tolist()
+    ]
 
     return {
         "total": total,
@@ -1658,18 +1990,33 @@ async def get_problems(
             {
                 "issue_id": p.issue_id,
                 "sévérité": p.severity,
-                "statut": p.status,
+                "statut": eff_status,
                 "colonne": p.column,
                 "ligne": p.row,
                 "valeur": p.valeur,
                 "message": p.message,
                 "suggestion": p.suggestion,
             }
-            for p in page_items
+            for p, eff_status in page_items
         ],
     }
 
 
+def _filter_problem_positions(
+    index: ProblemIndex, statuses: np.ndarray, severity: str, column: str, status: str
+) -> np.ndarray:
+    """Positions into ``job.problems`` matching the filters, in list order."""
+    empty = np.empty(0, dtype=np.int64)
+    positions = index.all_positions
+    if severity:
+        positions = index.by_severity.get(severity, empty)
+    if column:
+        positions = np.intersect1d(positions, index.by_column.get(column, empty), assume_unique=True)
+    if status:
+        positions = positions[statuses[positions] == status]
+    return positions
+
+
 # ---------------------------------------------------------------------------
 # Issue status management
 # ---------------------------------------------------------------------------
@@ -1750,14 +2097,18 @@ def _regenerate_status_exports(job: "Job") -> None:
     out = job.work_dir / "exports"
     meta = _build_dataset_meta(job)
 
-    try:
-        TXTReporter().export(modified, out / "rapport.txt", meta=meta)
-    except Exception as exc:
-        _logger.warning("Régénération rapport.txt : %s", exc)
-    try:
-        IssuesCSVExporter().export(modified, out / "problèmes.csv", meta=meta)
-    except Exception as exc:
-        _logger.warning("Régénération problèmes.csv : %s", exc)
+    # Independent files, written concurrently as in _generate_outputs
+    exports = [
+        ("Régénération rapport.txt", TXTReporter().export, out / "rapport.txt"),
+        ("Régénération problèmes.csv", IssuesCSVExporter().export, out / "problèmes.csv"),
+    ]
+    with ThreadPoolExecutor(max_workers=len(exports)) as pool:
+        futures = [pool.submit(fn, modified, path, meta=meta) for _, fn, path in exports]
+        for (log_label, _, _), future in zip(exports, futures):
+            try:
+                future.result()
+            except Exception as exc:
+                _logger.warning("%s : %s", log_label, exc)
 
     job.exports_dirty = False
     job_manager.update(job)
@@ -1792,10 +2143,14 @@ async def download_file(job_id: str, filename: str):
 
     # Regenerate status-dependent exports when statuses have changed
     if job.exports_dirty and resolved in ("rapport.txt", "problèmes.csv"):
-        _regenerate_status_exports(job)
+        await run_in_threadpool(_regenerate_status_exports, job)
 
     file_path = exports_dir / resolved
-    if not file_path.exists():
+    try:
+        # Stat once: FileResponse reuses it for Content-Length, ETag and
+        # Range handling instead of statting again before sending
+        stat_result = file_path.stat()
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Fichier non encore généré")
 
     media_types = {
@@ -1804,14 +2159,16 @@ async def download_file(job_id: str, filename: str):
         ".xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
     }
     media_type = media_types.get(file_path.suffix, "application/octet-stream")
-    return FileResponse(str(file_path), media_type=media_type, filename=resolved)
+    return FileResponse(
+        str(file_path), media_type=media_type, filename=resolved, stat_result=stat_result
+    )
 
 
 @app.post("/api/jobs/{job_id}/exports/annotated")
 async def export_annotated_workbook(job_id: str, body: AnnotatedExportRequest):
     """Generate an annotated work export from the current dataset state."""
     job = _get_job(job_id)
-    df = _load_df(job)
+    df = await run_in_threadpool(_load_df, job)
     scope = _normalize_export_scope(body.scope)
     export_format = (body.format or "xlsx").strip().lower()
     if export_format not in _VALID_ANNOTATED_EXPORT_FORMATS:
@@ -1821,7 +2178,7 @@ async def export_annotated_workbook(job_id: str, body: AnnotatedExportRequest):
         )
 
     try:
-        issues, _ = _run_validation_for_job(job, df)
+        issues, _ = await run_in_threadpool(_run_validation_for_job, job, df)
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc))
 
@@ -1871,7 +2228,7 @@ async def export_annotated_workbook(job_id: str, body: AnnotatedExportRequest):
 async def export_issues_report(job_id: str, body: IssuesReportExportRequest):
     """Generate an issues report from the current dataset state."""
     job = _get_job(job_id)
-    df = _load_df(job)
+    df = await run_in_threadpool(_load_df, job)
     scope = _normalize_export_scope(body.scope)
     export_format = (body.format or "csv").strip().lower()
     if export_format not in _VALID_ISSUES_REPORT_FORMATS:
@@ -1881,7 +2238,7 @@ async def export_issues_report(job_id: str, body: IssuesReportExportRequest):
         )
 
     try:
-        issues, _ = _run_validation_for_job(job, df)
+        issues, _ = await run_in_threadpool(_run_validation_for_job, job, df)
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc))
 
@@ -1924,22 +2281,33 @@ async def get_preview_issues(job_id: str, rows: int = 30):
     if not job.problems:
         return {"cell_issues": []}
 
-    cell_issues: list[dict] = []
+    index = job.problem_index()
+    return _cached_json_response(
+        index, ("preview_issues", rows), lambda: _preview_cell_issues(job, index, rows)
+    )
+
+
+def _preview_cell_issues(job: Job, index: ProblemIndex, rows: int) -> dict[str, Any]:
+    keep: list[int] = []
     seen: set[tuple] = set()
-    for p in job.problems:
-        row_0based = p.row - 1  # ProblemRow.row is 1-based
-        if row_0based < rows:
-            key = (row_0based, p.column)
-            if key not in seen:
-                seen.add(key)
-                cell_issues.append({
-                    "row": row_0based,
-                    "col": p.column,
-                    "severity": p.severity.lower(),
-                    "message": p.message,
-                })
-
-    cell_issues.sort(key=lambda x: (x["row"], x["col"]))
+    for i in np.flatnonzero(index.rows0 < rows).tolist():
+        key = (index.rows0[i], index.columns[i])
+        if key not in seen:
+            seen.add(key)
+            keep.append(i)
+
+    keep_arr = np.array(keep, dtype=np.int64)
+    order = keep_arr[np.lexsort((index.columns[keep_arr], index.rows0[keep_arr]))]
+    problems = job.problems
+    cell_issues = [
+        {
+            "row": problems[i].row - 1,  # ProblemRow.row is 1-based
+            "col": problems[i].column,
+            "severity": problems[i].severity.lower(),
+            "message": problems[i].message,
+        }
+        for i in order.tolist()
+    ]
     return {"cell_issues": cell_issues}
 
 
@@ -1995,7 +2363,8 @@ async def get_nakala_vocabulary(vocab_name: str):
 # Template export / import
 # ---------------------------------------------------------------------------
 
-# Default values for each column config key (used to strip noise from exports)
+# Default values for each column config key (used to strip noise from exports
+# and as the base layer of get_column_config)
 _COLUMN_DEFAULTS: dict[str, Any] = {
     "required": False,
     "unique": False,
@@ -2025,6 +2394,11 @@ _COLUMN_DEFAULTS: dict[str, Any] = {
     "detect_similar_values": False,
     "similar_threshold": 85,
 }
+# (key, value) pairs of the hashable defaults, for a set difference in
+# _filter_column_defaults
+_DEFAULT_ITEMS = frozenset(
+    item for item in _COLUMN_DEFAULTS.items() if isinstance(item[1], Hashable)
+)
 
 # Max size for imported template YAML files
 _MAX_TEMPLATE_BYTES = 1 * 1024 * 1024  # 1 Mo
@@ -2032,21 +2406,93 @@ _MAX_TEMPLATE_BYTES = 1 * 1024 * 1024  # 1 Mo
 
 def _filter_column_defaults(cfg: dict) -> dict:
     """Return a copy of *cfg* with all default/empty values stripped out."""
+    hashable = {key: val for key, val in cfg.items() if isinstance(val, Hashable)}
+    defaults = {key for key, _ in hashable.items() & _DEFAULT_ITEMS}
     result: dict = {}
     for key, val in cfg.items():
-        if val is None:
-            continue
-        if isinstance(val, list) and len(val) == 0:
-            continue
-        if isinstance(val, str) and val == "":
+        if val is None or val == "" or key in defaults:
             continue
-        default = _COLUMN_DEFAULTS.get(key)
-        if val == default:
+        if key not in hashable and (val == [] or val == _COLUMN_DEFAULTS.get(key)):
             continue
         result[key] = val
     return result
 
 
+# Strings emitted unquoted by _template_yaml: letters first, then only
+# characters without YAML meaning, no trailing space
+_YAML_PLAIN_RE = re.compile(r"[A-Za-z](?:[A-Za-z0-9_./ -]*[A-Za-z0-9_./-])?")
+# Plain scalars PyYAML (YAML 1.1) would not read back as strings
+_YAML_RESERVED = frozenset({"y", "n", "yes", "no", "on", "off", "true", "false", "null"})
+# Characters YAML does not accept raw (or reads as line breaks) in quotes
+_YAML_ESCAPE_RE = re.compile(r"[\x7f-\x9f\u2028\u2029\ufeff\ufffe\uffff\ud800-\udfff]")
+_YAML_FLOAT_RE = re.compile(r"-?[0-9]+\.[0-9]+")
+
+
+class _YamlFallback(Exception):
+    """A value _template_yaml does not handle; the caller uses PyYAML."""
+
+
+def _yaml_scalar(value: Any) -> str:
+    if value is None:
+        return "null"
+    if value is True or value is False:
+        return "true" if value else "false"
+    if type(value) is int:
+        return str(value)
+    if type(value) is float and _YAML_FLOAT_RE.fullmatch(repr(value)):
+        return repr(value)
+    if type(value) is not str:
+        raise _YamlFallback
+    if _YAML_PLAIN_RE.fullmatch(value) and value.lower() not in _YAML_RESERVED:
+        return value
+    # A JSON string is a valid YAML double-quoted scalar
+    quoted = json.dumps(value, ensure_ascii=False)
+    return _YAML_ESCAPE_RE.sub(lambda m: f"\\u{ord(m.group()):04x}", quoted)
+
+
+def _yaml_block(obj: dict | list, pad: str, out: list[str]) -> None:
+    items = obj.items() if isinstance(obj, dict) else ((None, v) for v in obj)
+    for key, value in items:
+        head = f"{pad}{_yaml_scalar(key)}:" if isinstance(obj, dict) else f"{pad}-"
+        if isinstance(value, (dict, list)) and value:
+            if isinstance(obj, list):
+                # "- " then the nested block's first line on the same line
+                nested: list[str] = []
+                _yaml_block(value, pad + "  ", nested)
+                nested[0] = f"{head} {nested[0][len(pad) + 2:]}"
+                out.extend(nested)
+            else:
+                out.append(head)
+                # Block sequences under a key are not indented (PyYAML style)
+                _yaml_block(value, pad if isinstance(value, list) else pad + "  ", out)
+        elif isinstance(value, dict):
+            out.append(f"{head} {{}}")
+        elif isinstance(value, list):
+            out.append(f"{head} []")
+        else:
+            out.append(f"{head} {_yaml_scalar(value)}")
+
+
+def _template_yaml(template: dict) -> str:
+    """Render *template* as block YAML, like ``yaml.dump(..., sort_keys=False)``.
+
+    Exported templates only hold dicts, lists, strings, numbers, booleans and
+    None, which this writes directly; anything else falls back to PyYAML.
+    """
+    out: list[str] = []
+    try:
+        _yaml_block(template, "", out)
+    except _YamlFallback:
+        return yaml.dump(
+            template,
+            Dumper=_YamlDumper,
+            default_flow_style=False,
+            allow_unicode=True,
+            sort_keys=False,
+        )
+    return "\n".join(out) + "\n" if out else "{}\n"
+
+
 @app.get("/api/jobs/{job_id}/export-template")
 async def export_template(job_id: str):
     """Export the current job column configuration as a reusable YAML template.
@@ -2057,19 +2503,14 @@ async def export_template(job_id: str):
     from fastapi.responses import Response
 
     job = _get_job(job_id)
-    df = _load_df(job)
+    df = await run_in_threadpool(_load_df, job)
 
     date_str = datetime.now().strftime("%Y-%m-%d")
     filename_base = Path(job.filename).stem if job.filename else "tableur"
 
     # Compile active template rules for the rules section
     try:
-        mgr = TemplateManager()
-        tpl_config = mgr.compile_config(
-            generic_id=job.template_id,
-            overlay_id=job.overlay_id,
-            column_names=list(df.columns),
-        )
+        tpl_config = _shared_template_config(job.template_id, job.overlay_id, tuple(df.columns))
         template_rules: dict = tpl_config.get("rules", {})
     except Exception:
         template_rules = {}
@@ -2101,12 +2542,7 @@ async def export_template(job_id: str):
         f"# Source : {job.filename or 'inconnu'}\n"
         f"# Pour réimporter : utilisez « Importer un modèle » à l'étape Configurer.\n\n"
     )
-    yaml_content = header + yaml.dump(
-        template,
-        default_flow_style=False,
-        allow_unicode=True,
-        sort_keys=False,
-    )
+    yaml_content = header + _template_yaml(template)
 
     export_filename = f"template_{filename_base}_{date_str}.yml"
     return Response(
@@ -2133,8 +2569,8 @@ async def import_vocabulary(job_id: str, file: UploadFile = File(...)):
     """
     _get_job(job_id)  # validate job exists
 
-    content = await file.read()
-    if len(content) > _MAX_VOCABULARY_BYTES:
+    content = await _read_upload_capped(file, _MAX_VOCABULARY_BYTES)
+    if content is None:
         raise HTTPException(
             status_code=413,
             detail="Le fichier dépasse la taille maximale autorisée (5 Mo).",
@@ -2156,7 +2592,7 @@ async def import_vocabulary(job_id: str, file: UploadFile = File(...)):
 
     # YAML
     try:
-        data = yaml.safe_load(text)
+        data = yaml.load(text, Loader=_YamlLoader)
     except yaml.YAMLError:
         raise HTTPException(
             status_code=422,
@@ -2194,16 +2630,16 @@ async def import_template(job_id: str, file: UploadFile = File(...)):
     job = _get_job(job_id)
 
     # Read with size guard
-    content = await file.read()
-    if len(content) > _MAX_TEMPLATE_BYTES:
+    content = await _read_upload_capped(file, _MAX_TEMPLATE_BYTES)
+    if content is None:
         raise HTTPException(
             status_code=413,
             detail="Le fichier YAML dépasse la taille maximale autorisée (1 Mo).",
         )
 
-    # Parse — safe_load only, never yaml.load
+    # Parse — safe loader only, never the full yaml.Loader
     try:
-        template = yaml.safe_load(content.decode("utf-8", errors="replace"))
+        template = yaml.load(content.decode("utf-8", errors="replace"), Loader=_YamlLoader)
     except yaml.YAMLError:
         raise HTTPException(
             status_code=422,
@@ -2234,11 +2670,7 @@ async def import_template(job_id: str, file: UploadFile = File(...)):
         if not isinstance(col_cfg, dict):
             continue
         if col in job.columns:
-            if col not in job.column_config:
-                job.column_config[col] = {}
-            canonical_cfg = _canonicalize_format_config_dict(col_cfg)
-            for key, val in canonical_cfg.items():
-                job.column_config[col][key] = val
+            job.column_config.setdefault(col, {}).update(_canonicalize_format_config_dict(col_cfg))
             applied.append(col)
         else:
             skipped.append(col)
@@ -2275,7 +2707,22 @@ def _get_job(job_id: str) -> Job:
     return job
 
 
+def _df_stamp(path: Path) -> tuple[int, int]:
+    st = path.stat()
+    return (st.st_mtime_ns, st.st_size)
+
+
 def _load_df(job: Job) -> pd.DataFrame:
+    """Return the job's current DataFrame.
+
+    The result is cached per job and shared between requests: callers must not
+    modify it in place (changes go through ``WebBulkFixCommand``).
+    """
     if job._df_path is None or not job._df_path.exists():
         raise HTTPException(status_code=422, detail="Données non disponibles")
-    return pd.read_pickle(str(job._df_path))
+    stamp = _df_stamp(job._df_path)
+    df = job_manager.get_cached_df(job.id, stamp)
+    if df is None:
+        df = read_job_df(job._df_path)
+        job_manager.cache_df(job.id, stamp, df)
+    return df
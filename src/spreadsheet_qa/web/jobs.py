@@ -7,20 +7,41 @@ their associated files live in a system temp directory. Jobs expire after
 
 from __future__ import annotations
 
+import heapq
+import os
+import queue
 import shutil
 import tempfile
 import threading
 import time
 import uuid
+from collections import Counter, OrderedDict
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
+
+import numpy as np
 
 from spreadsheet_qa.core.history import CommandHistory
 
+try:
+    import pyarrow as pa
+    import pyarrow.feather as pa_feather
+    _FEATHER_AVAILABLE = True
+except ImportError:
+    _FEATHER_AVAILABLE = False
+
 
 TTL_SECONDS = 3600  # 1 hour
+DF_CACHE_SIZE = 8  # DataFrames kept in memory (most recently used jobs)
+RESPONSE_CACHE_SIZE = 128  # built problem pages kept per validation
+PREVIEW_ROWS = 200  # rows kept in the preview.feather sidecar
+# Job frames are short-lived temp files rewritten after every fix: skipping
+# LZ4 makes both the write and the read markedly cheaper.
+FEATHER_COMPRESSION = "uncompressed"
+# Parent directory of job work dirs (e.g. a tmpfs mount); system temp if unset
+JOBS_DIR = os.environ.get("TABLERREUR_JOBS_DIR") or None
 
 
 class JobState(str, Enum):
@@ -40,8 +61,14 @@ class ValidationSummary:
     total: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ProblemRow:
+    """One issue as listed by the problems endpoints.
+
+    Slotted: a validation can hold ~100k of these, and the filterable
+    columns are mirrored as arrays by :class:`ProblemIndex`.
+    """
+
     severity: str
     status: str
     column: str
@@ -52,6 +79,64 @@ class ProblemRow:
     valeur: str = ""
 
 
+class ProblemIndex:
+    """Column arrays over a job's ``problems`` list, built once per validation.
+
+    Lets the problems endpoints filter by row without walking every
+    ``ProblemRow`` in Python.
+    """
+
+    def __init__(self, problems: list[ProblemRow]) -> None:
+        n = len(problems)
+        self.rows0 = np.fromiter((p.row - 1 for p in problems), dtype=np.int64, count=n)
+        self.columns = np.array([p.column for p in problems], dtype=object)
+        self.statuses = np.array([p.status for p in problems], dtype=object)
+        self.size = n
+        self.all_positions = np.arange(n, dtype=np.int64)
+        self.by_severity = self._group([p.severity for p in problems])
+        self.by_column = self._group(self.columns.tolist())
+        self.status_counts = Counter(self.statuses.tolist())
+        positions_by_id: dict[str, list[int]] = {}
+        for i, p in enumerate(problems):
+            if p.issue_id:
+                positions_by_id.setdefault(p.issue_id, []).append(i)
+        self.positions_by_id = positions_by_id
+        # Built response payloads (problem pages, preview cell issues); the
+        # index is replaced whenever ``problems`` changes, which drops them.
+        self._responses: dict[tuple, Any] = {}
+
+    def cached_response(self, key: tuple, build: Callable[[], Any]) -> Any:
+        """Return the payload stored under *key*, building it on first use."""
+        try:
+            return self._responses[key]
+        except KeyError:
+            pass
+        if len(self._responses) >= RESPONSE_CACHE_SIZE:
+            self._responses.clear()
+        value = self._responses[key] = build()
+        return value
+
+    @staticmethod
+    def _group(keys: list[str]) -> dict[str, np.ndarray]:
+        groups: dict[str, list[int]] = {}
+        for i, key in enumerate(keys):
+            groups.setdefault(key, []).append(i)
+        return {key: np.array(pos, dtype=np.int64) for key, pos in groups.items()}
+
+    def effective_statuses(self, overrides: dict[str, str]) -> tuple[np.ndarray, Counter]:
+        """Return per-problem statuses and their counts with *overrides* applied."""
+        if not overrides:
+            return self.statuses, self.status_counts
+        statuses = self.statuses.copy()
+        counts = self.status_counts.copy()
+        for issue_id, status in overrides.items():
+            for i in self.positions_by_id.get(issue_id, ()):
+                counts[statuses[i]] -= 1
+                counts[status] += 1
+                statuses[i] = status
+        return statuses, counts
+
+
 @dataclass
 class Job:
     id: str
@@ -78,7 +163,7 @@ class Job:
     problems: list[ProblemRow] = field(default_factory=list)
     # Expiry
     created_at: float = field(default_factory=time.time)
-    # DataFrame stored as pickle for downstream steps
+    # DataFrame stored as Feather (or pickle fallback) for downstream steps
     _df_path: Path | None = None
     # Issues stored as pickle for export regeneration after status changes
     _issues_path: Path | None = None
@@ -92,6 +177,91 @@ class Job:
     validation_baseline_undo_count: int = 0
     # TTL glissant : toute activité API (get/update) prolonge la session
     last_access_at: float = field(default_factory=time.time)
+    # Bumped by JobManager.update after each change; feeds the HTTP ETags
+    revision: int = 0
+    # (problems list, index) — rebuilt when ``problems`` is reassigned or resized
+    _problem_index: tuple[list, ProblemIndex] | None = field(default=None, repr=False)
+
+    def problem_index(self) -> ProblemIndex:
+        """Return the :class:`ProblemIndex` for the current ``problems`` list."""
+        cached = self._problem_index
+        if cached is None or cached[0] is not self.problems or cached[1].size != len(self.problems):
+            index = ProblemIndex(self.problems)
+            self._problem_index = (self.problems, index)
+            return index
+        return cached[1]
+
+
+def save_job_df(df: Any, work_dir: Path) -> Path:
+    """Persist the job DataFrame in *work_dir* and return its path.
+
+    Uses Feather (Arrow IPC) when pyarrow is installed and the frame is
+    Arrow-compatible; otherwise falls back to pickle.  The suffix of the
+    returned path tells :func:`read_job_df` / :func:`write_job_df` which format
+    the file uses.
+    """
+    if _FEATHER_AVAILABLE:
+        path = work_dir / "df.feather"
+        try:
+            df.to_feather(str(path), compression=FEATHER_COMPRESSION)
+            _write_preview(df, work_dir)
+            return path
+        except Exception:
+            path.unlink(missing_ok=True)
+    path = work_dir / "df.pkl"
+    df.to_pickle(str(path))
+    return path
+
+
+def read_job_df(path: Path) -> Any:
+    """Load a DataFrame written by :func:`save_job_df`."""
+    import pandas as pd
+
+    if path.suffix == ".feather":
+        return pd.read_feather(str(path))
+    return pd.read_pickle(str(path))
+
+
+def write_job_df(df: Any, path: Path) -> None:
+    """Overwrite *path* with *df*, keeping the format chosen by :func:`save_job_df`."""
+    if path.suffix == ".feather":
+        df.to_feather(str(path), compression=FEATHER_COMPRESSION)
+        _write_preview(df, path.parent)
+    else:
+        df.to_pickle(str(path))
+
+
+_PREVIEW_FILE = "preview.feather"
+_PREVIEW_TOTAL_KEY = b"tablerreur_total_rows"
+
+
+def _write_preview(df: Any, work_dir: Path) -> None:
+    """Write the first ``PREVIEW_ROWS`` rows of *df* next to it, with the full row count.
+
+    Any failure removes the sidecar so a stale preview is never served.
+    """
+    path = work_dir / _PREVIEW_FILE
+    try:
+        table = pa.Table.from_pandas(df.head(PREVIEW_ROWS), preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        metadata[_PREVIEW_TOTAL_KEY] = str(len(df)).encode()
+        pa_feather.write_feather(
+            table.replace_schema_metadata(metadata), str(path), compression=FEATHER_COMPRESSION
+        )
+    except Exception:
+        path.unlink(missing_ok=True)
+
+
+def read_job_preview(work_dir: Path) -> tuple[Any, int] | None:
+    """Return ``(head DataFrame, total rows)`` from the preview sidecar, or None if absent."""
+    path = work_dir / _PREVIEW_FILE
+    if not _FEATHER_AVAILABLE or not path.exists():
+        return None
+    table = pa_feather.read_table(str(path))
+    total = int((table.schema.metadata or {}).get(_PREVIEW_TOTAL_KEY, b"-1"))
+    if total < 0:
+        return None
+    return table.to_pandas(), total
 
 
 class JobManager:
@@ -100,15 +270,26 @@ class JobManager:
     def __init__(self) -> None:
         self._jobs: dict[str, Job] = {}
         self._lock = threading.Lock()
+        # job_id → (file stamp, DataFrame) for the persisted df of recent jobs
+        self._df_cache: OrderedDict[str, tuple[Any, Any]] = OrderedDict()
+        # (due time, job_id) min-heap; a job's entry is pushed back when it
+        # was accessed since (sliding TTL), so only due entries are examined
+        self._expiry: list[tuple[float, str]] = []
+        # Work dirs of deleted jobs, removed by a background thread
+        self._trash: queue.SimpleQueue[Path] = queue.SimpleQueue()
         self._start_cleanup_thread()
+        self._start_trash_thread()
 
     def create(self) -> Job:
         job_id = str(uuid.uuid4())
-        work_dir = Path(tempfile.mkdtemp(prefix=f"tablerreur_{job_id}_"))
+        if JOBS_DIR:
+            Path(JOBS_DIR).mkdir(parents=True, exist_ok=True)
+        work_dir = Path(tempfile.mkdtemp(prefix=f"tablerreur_{job_id}_", dir=JOBS_DIR))
         now = time.time()
         job = Job(id=job_id, work_dir=work_dir, created_at=now, last_access_at=now)
         with self._lock:
             self._jobs[job_id] = job
+            heapq.heappush(self._expiry, (now + TTL_SECONDS, job_id))
         return job
 
     def get(self, job_id: str) -> Job | None:
@@ -122,29 +303,73 @@ class JobManager:
     def update(self, job: Job) -> None:
         job.last_access_at = time.time()
         with self._lock:
+            job.revision += 1
+            if job.id not in self._jobs:
+                heapq.heappush(self._expiry, (job.last_access_at + TTL_SECONDS, job.id))
             self._jobs[job.id] = job
 
+    def get_cached_df(self, job_id: str, stamp: Any) -> Any | None:
+        """Return the cached DataFrame of *job_id* if it was stored with *stamp*."""
+        with self._lock:
+            cached = self._df_cache.get(job_id)
+            if cached is None or cached[0] != stamp:
+                return None
+            self._df_cache.move_to_end(job_id)
+            return cached[1]
+
+    def cache_df(self, job_id: str, stamp: Any, df: Any) -> None:
+        """Remember *df* as the content of the job's df file at *stamp*."""
+        with self._lock:
+            self._df_cache[job_id] = (stamp, df)
+            self._df_cache.move_to_end(job_id)
+            while len(self._df_cache) > DF_CACHE_SIZE:
+                self._df_cache.popitem(last=False)
+
     def delete(self, job_id: str) -> None:
         with self._lock:
             job = self._jobs.pop(job_id, None)
-        if job and job.work_dir.exists():
-            shutil.rmtree(job.work_dir, ignore_errors=True)
+            self._df_cache.pop(job_id, None)
+        if job:
+            # rmtree is left to the trash thread so the request does not wait
+            self._trash.put(job.work_dir)
 
-    def _cleanup_expired(self) -> None:
+    def _cleanup_expired(self) -> float:
+        """Delete the jobs idle for more than ``TTL_SECONDS``.
+
+        Returns the number of seconds until the next job may expire.
+        """
         now = time.time()
         expired = []
         with self._lock:
-            for job_id, job in self._jobs.items():
-                if now - job.last_access_at > TTL_SECONDS:
+            while self._expiry and self._expiry[0][0] <= now:
+                _, job_id = heapq.heappop(self._expiry)
+                job = self._jobs.get(job_id)
+                if job is None:
+                    continue
+                due = job.last_access_at + TTL_SECONDS
+                if due <= now:
                     expired.append(job_id)
+                else:
+                    heapq.heappush(self._expiry, (due, job_id))
+            next_due = self._expiry[0][0] - now if self._expiry else TTL_SECONDS
         for job_id in expired:
             self.delete(job_id)
+        return next_due
 
     def _start_cleanup_thread(self) -> None:
+        def _loop() -> None:
+            wait = TTL_SECONDS
+            while True:
+                time.sleep(max(1.0, wait))
+                wait = self._cleanup_expired()
+
+        t = threading.Thread(target=_loop, daemon=True)
+        t.start()
+
+    def _start_trash_thread(self) -> None:
         def _loop() -> None:
             while True:
-                time.sleep(300)  # check every 5 minutes
-                self._cleanup_expired()
+                shutil.rmtree(self._trash.get(), ignore_errors=True)
 
         t = threading.Thread(target=_loop, daemon=True)
         t.start()
@@ -10,56 +10,120 @@ Usage :
 from __future__ import annotations
 
 import argparse
+import functools
+import http.client
+import os
 import signal
 import socket
-import subprocess
 import sys
 import threading
 import time
 import traceback
-import urllib.error
-import urllib.request
+import urllib.parse
 import webbrowser
-from subprocess import DEVNULL
 
-_IMPORT_ERROR: Exception | None = None
+def _probe_socket() -> socket.socket:
+    """Return a TCP socket whose bind() succeeds exactly when uvicorn's would.
 
-try:
-    import uvicorn
-    from spreadsheet_qa.web.app import app as _web_app
-    _UVICORN_AVAILABLE = True
-except Exception as exc:
-    _UVICORN_AVAILABLE = False
-    _IMPORT_ERROR = exc
-
-_LOCAL_NO_PROXY_OPENER = urllib.request.build_opener(urllib.request.ProxyHandler({}))
+    uvicorn (asyncio) binds with SO_REUSEADDR on POSIX, so a port still in
+    TIME_WAIT from a previous run is usable and the probe must accept it too.
+    On Windows SO_REUSEADDR would let the probe bind over a live listener,
+    so it is left unset there.
+    """
+    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    if os.name != "nt":
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    return s
 
 
 def find_free_port(start: int = 8400, end: int = 8500) -> int:
-    """Return the first free TCP port in [start, end)."""
+    """Return the first free TCP port in [start, end).
+
+    The usual case binds once, at *start*. A stable port keeps the browser
+    origin, and with it the preferences stored in localStorage, from one
+    launch to the next. When the whole range is taken, the kernel assigns
+    an ephemeral port (one bind to port 0) instead of failing.
+    """
     for port in range(start, end):
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        with _probe_socket() as s:
             try:
                 s.bind(("127.0.0.1", port))
                 return port
             except OSError:
                 continue
-    raise RuntimeError(f"Aucun port libre trouvé entre {start} et {end}.")
+    with _probe_socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
 
 
 def wait_for_health(url: str, timeout: float = 90.0) -> bool:
-    """Poll *url* every 200 ms until it returns HTTP 200 or *timeout* elapses."""
+    """Wait until *url* returns HTTP 200 or *timeout* elapses.
+
+    Probes are HEAD requests, so no body is sent back. One keep-alive
+    connection is reused across attempts: while nothing listens, each
+    attempt is a refused connect, and the connection that finally
+    succeeds carries the request. http.client ignores
+    HTTP(S)_PROXY, so 127.0.0.1 is always reached directly. The delay
+    between attempts starts at 5 ms and grows to 100 ms.
+    """
+    parts = urllib.parse.urlsplit(url)
+    conn = http.client.HTTPConnection(parts.hostname or "127.0.0.1", parts.port, timeout=1)
+    path = parts.path or "/"
     deadline = time.monotonic() + timeout
-    while time.monotonic() < deadline:
-        try:
-            # Force direct local connection: ignore HTTP(S)_PROXY for 127.0.0.1.
-            with _LOCAL_NO_PROXY_OPENER.open(url, timeout=1) as resp:
+    delay = 0.005
+    try:
+        while time.monotonic() < deadline:
+            try:
+                conn.request("HEAD", path)
+                resp = conn.getresponse()
+                resp.read()
                 if resp.status == 200:
                     return True
-        except (urllib.error.URLError, OSError):
-            pass
-        time.sleep(0.2)
-    return False
+            except (http.client.HTTPException, OSError):
+                # Reconnects on the next request
+                conn.close()
+            time.sleep(delay)
+            delay = min(delay * 1.5, 0.1)
+        return False
+    finally:
+        conn.close()
+
+
+@functools.lru_cache(maxsize=1)
+def _ready_server_class():
+    """Return a uvicorn.Server subclass that sets ``ready`` once it listens or gives up.
+
+    Built on first use so that importing this module (``--help``, the port
+    and health helpers) does not import uvicorn.
+    """
+    import uvicorn
+
+    class _ReadyServer(uvicorn.Server):
+        def __init__(self, config: uvicorn.Config) -> None:
+            super().__init__(config)
+            self.ready = threading.Event()
+
+        async def startup(self, sockets=None) -> None:
+            await super().startup(sockets=sockets)
+            self.ready.set()
+
+        def run(self, sockets=None) -> None:
+            try:
+                super().run(sockets=sockets)
+            finally:
+                # Bind failures exit the thread before startup completes
+                self.ready.set()
+
+    return _ReadyServer
+
+
+def wait_until_started(server, timeout: float = 90.0) -> bool:
+    """Block until the in-process *server* is listening (True) or failed.
+
+    No polling: the server's ready event wakes the caller once, when
+    startup completes or the serving thread ends.
+    """
+    return server.ready.wait(timeout) and server.started
 
 
 def main() -> None:
@@ -76,63 +140,55 @@ def main() -> None:
     sidecar_mode = args.port is not None
     port = args.port if sidecar_mode else find_free_port()
 
-    health_url = f"http://127.0.0.1:{port}/health"
     app_url = f"http://127.0.0.1:{port}"
 
     print(f"Tablerreur — Démarrage du serveur sur le port {port}…")
 
-    # In a PyInstaller frozen bundle, sys.executable is the frozen binary itself,
-    # not a Python interpreter — run uvicorn directly in a thread.
-    frozen = getattr(sys, "frozen", False)
-    proc = None
+    # Heavy imports (uvicorn, then the app with pandas and the rules) only
+    # start once the port is chosen and the message above is on screen
+    try:
+        import uvicorn
 
-    if frozen:
-        if not _UVICORN_AVAILABLE:
-            print("Erreur : backend web indisponible dans le bundle.", file=sys.stderr)
-            if _IMPORT_ERROR is not None:
-                traceback.print_exception(_IMPORT_ERROR)
-            sys.exit(1)
+        from spreadsheet_qa.web.app import app as web_app
 
-        def _serve() -> None:
-            uvicorn.run(_web_app, host="127.0.0.1", port=port, log_level="warning")
+        server_class = _ready_server_class()
+    except Exception as exc:
+        print("Erreur : backend web indisponible (uvicorn ou l'application ne s'importe pas).", file=sys.stderr)
+        traceback.print_exception(exc)
+        sys.exit(1)
 
-        _thread = threading.Thread(target=_serve, daemon=True)
-        _thread.start()
-    else:
-        proc = subprocess.Popen(
-            [
-                sys.executable,
-                "-m",
-                "uvicorn",
-                "spreadsheet_qa.web.app:app",
-                "--port",
-                str(port),
-                "--host",
-                "127.0.0.1",
-            ],
-            stdout=DEVNULL,
-            # stderr laissé sur le terminal pour afficher les erreurs de démarrage
+    # No access log (never shown at "warning" anyway) and no WebSocket
+    # protocol: the app has no WebSocket route, so the websockets package
+    # need not be imported at startup
+    server = server_class(
+        uvicorn.Config(
+            web_app,
+            host="127.0.0.1",
+            port=port,
+            log_level="warning",
+            access_log=False,
+            ws="none",
         )
+    )
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
 
     def stop(signum=None, frame=None) -> None:
         print("\nArrêt du serveur Tablerreur…")
-        if proc is not None:
-            proc.terminate()
-        sys.exit(0)
+        server.should_exit = True
 
     signal.signal(signal.SIGINT, stop)
     signal.signal(signal.SIGTERM, stop)
 
     print("En attente de la disponibilité du serveur…")
-    ready = wait_for_health(health_url)
+    ready = wait_until_started(server)
 
     if not ready:
-        if proc is not None and proc.poll() is not None:
+        if not thread.is_alive():
             print("Erreur : le serveur s'est arrêté de manière inattendue.", file=sys.stderr)
         else:
             print("Erreur : le serveur n'a pas démarré dans les délais.", file=sys.stderr)
-            if proc is not None:
-                proc.terminate()
+            server.should_exit = True
         sys.exit(1)
 
     print(f"Serveur prêt -> {app_url}")
@@ -143,15 +199,12 @@ def main() -> None:
     else:
         print("Mode sidecar — navigateur géré par Tauri.")
 
-    if proc is not None:
-        proc.wait()
-    else:
-        # Frozen mode: block until a signal terminates the process
-        try:
-            while True:
-                time.sleep(1)
-        except (KeyboardInterrupt, SystemExit):
-            pass
+    # Block until the server thread ends (stop() sets should_exit). POSIX
+    # runs signal handlers during an untimed join; Windows does not
+    # interrupt lock waits for Ctrl+C, so wake up once a second there.
+    wake_every = 1.0 if os.name == "nt" else None
+    while thread.is_alive():
+        thread.join(wake_every)
 
 
 if __name__ == "__main__":
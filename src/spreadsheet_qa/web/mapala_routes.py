@@ -24,7 +24,7 @@ from fastapi import APIRouter, File, HTTPException, UploadFile
 from fastapi.responses import FileResponse
 
 from spreadsheet_qa.core.mapala import list_sheets, load_sheet, save_mapala_output
-from spreadsheet_qa.web.jobs import TTL_SECONDS, JobState, job_manager
+from spreadsheet_qa.web.jobs import TTL_SECONDS, JobState, job_manager, save_job_df
 
 def _max_upload_mb_and_bytes() -> tuple[int, int]:
     """Lit TABLERREUR_MAX_UPLOAD_MB (comme POST /api/jobs) avec repli si valeur invalide."""
@@ -222,10 +222,8 @@ async def mapala_preview(body: dict):
         raise HTTPException(status_code=400, detail=f"Erreur lecture source : {e}")
 
     def _rows(df: pd.DataFrame, n: int) -> list[list[str]]:
-        result = []
-        for _, row in df.head(n).iterrows():
-            result.append(["" if pd.isna(v) else str(v) for v in row])
-        return result
+        head = df.head(n)
+        return head.astype(str).where(head.notna(), "").to_numpy(dtype=object).tolist()
 
     return {
         "template_columns": list(df_template.columns),
@@ -386,9 +384,7 @@ async def mapala_validate(job_id: str):
     tablerreur_job.cols = len(df.columns)
     tablerreur_job.columns = list(df.columns)
 
-    df_path = tablerreur_job.work_dir / "df.pkl"
-    df.to_pickle(str(df_path))
-    tablerreur_job._df_path = df_path
+    tablerreur_job._df_path = save_job_df(df, tablerreur_job.work_dir)
     tablerreur_job.state = JobState.LOADING
 
     job_manager.update(tablerreur_job)
@@ -6,9 +6,13 @@ import pandas as pd
 import pytest
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def simple_df() -> pd.DataFrame:
-    """A small DataFrame with intentional issues for rule testing."""
+    """A small DataFrame with intentional issues for rule testing.
+
+    Built once per session and shared: tests that modify it must work on
+    ``simple_df.copy()``.
+    """
     return pd.DataFrame(
         {
             "Titre": [
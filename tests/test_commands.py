@@ -23,20 +23,29 @@ def _make_fix_command(df, row, col, old_val, new_val):
     )
 
 
+@pytest.fixture
+def df_a() -> pd.DataFrame:
+    """One-cell frame (A = "old") that commands may modify."""
+    return pd.DataFrame({"A": ["old"]})
+
+
+@pytest.fixture
+def history() -> CommandHistory:
+    return CommandHistory()
+
+
 class TestApplyCellFixCommand:
-    def test_execute_changes_df(self):
-        df = pd.DataFrame({"A": ["old"]})
-        cmd = _make_fix_command(df, 0, "A", "old", "new")
+    def test_execute_changes_df(self, df_a):
+        cmd = _make_fix_command(df_a, 0, "A", "old", "new")
         cmd.execute()
-        assert df.at[0, "A"] == "new"
+        assert df_a.at[0, "A"] == "new"
 
-    def test_undo_restores_df(self):
-        df = pd.DataFrame({"A": ["original"]})
-        cmd = _make_fix_command(df, 0, "A", "original", "changed")
+    def test_undo_restores_df(self, df_a):
+        cmd = _make_fix_command(df_a, 0, "A", "old", "changed")
         cmd.execute()
-        assert df.at[0, "A"] == "changed"
+        assert df_a.at[0, "A"] == "changed"
         cmd.undo()
-        assert df.at[0, "A"] == "original"
+        assert df_a.at[0, "A"] == "old"
 
     def test_description_is_informative(self):
         df = pd.DataFrame({"Col": ["a"]})
@@ -47,37 +56,30 @@ class TestApplyCellFixCommand:
 
 
 class TestCommandHistory:
-    def test_push_executes_command(self):
-        df = pd.DataFrame({"A": ["old"]})
-        history = CommandHistory()
-        cmd = _make_fix_command(df, 0, "A", "old", "new")
+    def test_push_executes_command(self, df_a, history):
+        cmd = _make_fix_command(df_a, 0, "A", "old", "new")
         history.push(cmd)
-        assert df.at[0, "A"] == "new"
+        assert df_a.at[0, "A"] == "new"
         assert history.can_undo
         assert not history.can_redo
 
-    def test_undo(self):
-        df = pd.DataFrame({"A": ["original"]})
-        history = CommandHistory()
-        cmd = _make_fix_command(df, 0, "A", "original", "modified")
+    def test_undo(self, df_a, history):
+        cmd = _make_fix_command(df_a, 0, "A", "old", "modified")
         history.push(cmd)
         history.undo()
-        assert df.at[0, "A"] == "original"
+        assert df_a.at[0, "A"] == "old"
         assert not history.can_undo
         assert history.can_redo
 
-    def test_redo(self):
-        df = pd.DataFrame({"A": ["start"]})
-        history = CommandHistory()
-        cmd = _make_fix_command(df, 0, "A", "start", "end")
+    def test_redo(self, df_a, history):
+        cmd = _make_fix_command(df_a, 0, "A", "old", "end")
         history.push(cmd)
         history.undo()
         history.redo()
-        assert df.at[0, "A"] == "end"
+        assert df_a.at[0, "A"] == "end"
 
-    def test_new_push_clears_redo_stack(self):
+    def test_new_push_clears_redo_stack(self, history):
         df = pd.DataFrame({"A": ["a", "b"]})
-        history = CommandHistory()
         cmd1 = _make_fix_command(df, 0, "A", "a", "x")
         cmd2 = _make_fix_command(df, 1, "A", "b", "y")
         history.push(cmd1)
@@ -86,8 +88,7 @@ class TestCommandHistory:
         history.push(cmd2)
         assert not history.can_redo
 
-    def test_undo_on_empty_history_returns_none(self):
-        history = CommandHistory()
+    def test_undo_on_empty_history_returns_none(self, history):
         result = history.undo()
         assert result is None
 
@@ -100,8 +101,7 @@ class TestCommandHistory:
         # Stack should cap at 10, not exceed
         assert history.undo_count <= 10
 
-    def test_df_identity_preserved(self):
+    def test_df_identity_preserved(self, df_a):
         """The command must hold a reference to the original df, not a copy."""
-        df = pd.DataFrame({"A": ["a"]})
-        cmd = _make_fix_command(df, 0, "A", "a", "b")
-        assert cmd._df is df
+        cmd = _make_fix_command(df_a, 0, "A", "old", "b")
+        assert cmd._df is df_a
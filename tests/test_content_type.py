@@ -104,6 +104,11 @@ class TestIsDate:
     def test_rejects_year_out_of_range(self):
         assert not _is_date("0099")
 
+    def test_rejects_invalid_iso_parts(self):
+        assert not _is_date("2024-13")
+        assert not _is_date("2024-01-32")
+        assert not _is_date("13/2024")
+
 
 class TestIsBoolean:
     def test_default_yes_no(self):
@@ -160,128 +165,81 @@ class TestIsUrl:
 # ---------------------------------------------------------------------------
 
 
-class TestContentTypeRuleInteger:
-    def test_valid_no_issue(self):
-        df = pd.DataFrame({"N": ["1", "42", "-7"]})
-        assert rule.check(df, "N", {"content_type": "integer"}) == []
-
-    def test_invalid_flagged(self):
-        df = pd.DataFrame({"N": ["1.5"]})
-        issues = rule.check(df, "N", {"content_type": "integer"})
+# One DataFrame per content type, holding every value that must pass
+_VALID_VALUES = [
+    ("integer", ["1", "42", "-7", " 42 "]),
+    ("decimal", ["3.14", "-0.5", "42", "3,14"]),
+    ("number", ["42", "3.14", "2,50"]),
+    (
+        "date",
+        [
+            "2024-01-15",
+            "2024-01",
+            "15/01/2024",
+            "2024",
+            "janvier 2024",
+            "février 2020",
+            "15 mars 2023",
+            "November 2019",
+            "marzo 2024",
+            "15 octubre 2023",
+        ],
+    ),
+    ("email", ["user@example.com"]),
+    ("boolean", ["oui", "false", "1", "0", "actif", "inactive"]),
+    ("text", ["hello", "à b c", "123"]),
+    ("url", ["https://example.com", "www.example.com"]),
+    (
+        "identifier",
+        ["10.1000/xyz123", "0000-0002-1825-0097", "978-1-23-456789-0", "20.500.12345/abc"],
+    ),
+    ("language", ["fr", "fr-FR", "eng"]),
+    ("country", ["FR", "de"]),
+    ("address", ["user@example.com", "https://example.org"]),
+]
+
+# (content type, invalid value, word expected in the message)
+_INVALID_VALUES = [
+    ("integer", "1.5", "entier"),
+    ("decimal", "abc", "décimal"),
+    ("number", "abc", "nombre"),
+    ("date", "not-a-date", "date"),
+    ("email", "pas-un-email", "e-mail"),
+    ("boolean", "peut-être", "Booléen"),
+    ("url", "pas une url", "URL"),
+    ("identifier", "identifiant libre", "identifiant"),
+    ("language", "français", "langue"),
+    ("country", "France", "pays"),
+    ("address", "pas une adresse", "adresse"),
+]
+
+
+@pytest.fixture(scope="module")
+def blank_series() -> pd.Series:
+    return pd.Series(["", None], name="X")
+
+
+class TestContentTypeRuleCheck:
+    @pytest.mark.parametrize("content_type,values", _VALID_VALUES, ids=[c for c, _ in _VALID_VALUES])
+    def test_valid_values_no_issue(self, content_type, values):
+        series = pd.Series(values, name="X")
+        assert rule.check_series(series, {"content_type": content_type}) == []
+
+    @pytest.mark.parametrize(
+        "content_type,value,word", _INVALID_VALUES, ids=[c for c, _, _ in _INVALID_VALUES]
+    )
+    def test_invalid_flagged(self, content_type, value, word):
+        issues = rule.check_series(pd.Series([value], name="X"), {"content_type": content_type})
         assert len(issues) == 1
+        assert issues[0].col == "X"
         assert issues[0].severity == Severity.ERROR
-        assert "entier" in issues[0].message
-
-    def test_strips_spaces(self):
-        df = pd.DataFrame({"N": [" 42 "]})
-        assert rule.check(df, "N", {"content_type": "integer"}) == []
-
-    def test_empty_ignored(self):
-        df = pd.DataFrame({"N": ["", None]})
-        assert rule.check(df, "N", {"content_type": "integer"}) == []
-
-
-class TestContentTypeRuleDecimal:
-    def test_valid_float_no_issue(self):
-        df = pd.DataFrame({"N": ["3.14", "-0.5", "42"]})
-        assert rule.check(df, "N", {"content_type": "decimal"}) == []
-
-    def test_french_comma_accepted(self):
-        df = pd.DataFrame({"N": ["3,14"]})
-        assert rule.check(df, "N", {"content_type": "decimal"}) == []
-
-    def test_invalid_flagged(self):
-        df = pd.DataFrame({"N": ["abc"]})
-        issues = rule.check(df, "N", {"content_type": "decimal"})
-        assert len(issues) == 1
-        assert "décimal" in issues[0].message
-
-    def test_empty_ignored(self):
-        df = pd.DataFrame({"N": [None, ""]})
-        assert rule.check(df, "N", {"content_type": "decimal"}) == []
-
+        assert word in issues[0].message
 
-class TestContentTypeRuleNumber:
-    def test_integer_and_decimal_valid(self):
-        df = pd.DataFrame({"N": ["42", "3.14", "2,50"]})
-        assert rule.check(df, "N", {"content_type": "number"}) == []
+    @pytest.mark.parametrize("content_type", [c for c, _ in _VALID_VALUES])
+    def test_empty_ignored(self, blank_series, content_type):
+        assert rule.check_series(blank_series, {"content_type": content_type}) == []
 
-    def test_invalid_flagged(self):
-        df = pd.DataFrame({"N": ["abc"]})
-        issues = rule.check(df, "N", {"content_type": "number"})
-        assert len(issues) == 1
-        assert "nombre" in issues[0].message.lower()
-
-
-class TestContentTypeRuleDate:
-    def test_iso_valid(self):
-        df = pd.DataFrame({"D": ["2024-01-15"]})
-        assert rule.check(df, "D", {"content_type": "date"}) == []
-
-    def test_iso_year_month_valid(self):
-        df = pd.DataFrame({"D": ["2024-01"]})
-        assert rule.check(df, "D", {"content_type": "date"}) == []
-
-    def test_fr_valid(self):
-        df = pd.DataFrame({"D": ["15/01/2024"]})
-        assert rule.check(df, "D", {"content_type": "date"}) == []
-
-    def test_year_valid(self):
-        df = pd.DataFrame({"D": ["2024"]})
-        assert rule.check(df, "D", {"content_type": "date"}) == []
-
-    def test_month_words_fr_en_es_valid(self):
-        df = pd.DataFrame(
-            {
-                "D": [
-                    "janvier 2024",
-                    "février 2020",
-                    "15 mars 2023",
-                    "November 2019",
-                    "marzo 2024",
-                    "15 octubre 2023",
-                ]
-            }
-        )
-        assert rule.check(df, "D", {"content_type": "date"}) == []
-
-    def test_invalid_flagged(self):
-        df = pd.DataFrame({"D": ["not-a-date"]})
-        issues = rule.check(df, "D", {"content_type": "date"})
-        assert len(issues) == 1
-        assert "date" in issues[0].message.lower()
-
-    def test_empty_ignored(self):
-        df = pd.DataFrame({"D": [None, ""]})
-        assert rule.check(df, "D", {"content_type": "date"}) == []
-
-
-class TestContentTypeRuleEmail:
-    def test_valid_no_issue(self):
-        df = pd.DataFrame({"E": ["user@example.com"]})
-        assert rule.check(df, "E", {"content_type": "email"}) == []
-
-    def test_invalid_flagged(self):
-        df = pd.DataFrame({"E": ["pas-un-email"]})
-        issues = rule.check(df, "E", {"content_type": "email"})
-        assert len(issues) == 1
-        assert "e-mail" in issues[0].message
-
-    def test_empty_ignored(self):
-        df = pd.DataFrame({"E": [None, ""]})
-        assert rule.check(df, "E", {"content_type": "email"}) == []
-
-
-class TestContentTypeRuleBoolean:
-    def test_default_yes_no_values(self):
-        df = pd.DataFrame({"B": ["oui", "false", "1", "0"]})
-        assert rule.check(df, "B", {"content_type": "boolean"}) == []
-
-    def test_default_active_inactive_values(self):
-        df = pd.DataFrame({"B": ["actif", "inactive"]})
-        assert rule.check(df, "B", {"content_type": "boolean"}) == []
-
-    def test_custom_mapping(self):
+    def test_boolean_custom_mapping(self):
         df = pd.DataFrame({"B": ["actif", "inactif"]})
         cfg = {
             "content_type": "boolean",
@@ -290,96 +248,15 @@ class TestContentTypeRuleBoolean:
         }
         assert rule.check(df, "B", cfg) == []
 
-    def test_invalid_flagged(self):
-        df = pd.DataFrame({"B": ["peut-être"]})
-        issues = rule.check(df, "B", {"content_type": "boolean"})
-        assert len(issues) == 1
-        assert "bool" in issues[0].message.lower()
-
-
-class TestContentTypeRuleText:
-    def test_any_non_empty_accepted(self):
-        df = pd.DataFrame({"T": ["hello", "à b c", "123"]})
-        assert rule.check(df, "T", {"content_type": "text"}) == []
-
-    def test_empty_cells_ignored(self):
-        df = pd.DataFrame({"T": ["", None]})
-        assert rule.check(df, "T", {"content_type": "text"}) == []
-
-
-class TestContentTypeRuleUrl:
-    def test_https_valid(self):
-        df = pd.DataFrame({"U": ["https://example.com"]})
-        assert rule.check(df, "U", {"content_type": "url"}) == []
-
-    def test_www_valid(self):
-        df = pd.DataFrame({"U": ["www.example.com"]})
-        assert rule.check(df, "U", {"content_type": "url"}) == []
-
-    def test_invalid_flagged(self):
-        df = pd.DataFrame({"U": ["pas une url"]})
-        issues = rule.check(df, "U", {"content_type": "url"})
-        assert len(issues) == 1
-        assert "URL" in issues[0].message
-
-    def test_empty_ignored(self):
-        df = pd.DataFrame({"U": [None, ""]})
-        assert rule.check(df, "U", {"content_type": "url"}) == []
-
-
-class TestContentTypeRuleIdentifier:
-    def test_recognized_identifiers_valid(self):
-        df = pd.DataFrame(
-            {"I": ["10.1000/xyz123", "0000-0002-1825-0097", "978-1-23-456789-0", "20.500.12345/abc"]}
-        )
-        assert rule.check(df, "I", {"content_type": "identifier"}) == []
-
-    def test_invalid_flagged(self):
-        df = pd.DataFrame({"I": ["identifiant libre"]})
-        issues = rule.check(df, "I", {"content_type": "identifier"})
-        assert len(issues) == 1
-        assert "identifiant" in issues[0].message.lower()
-
-
-class TestContentTypeRuleLanguage:
-    def test_iso_and_bcp47_valid(self):
-        df = pd.DataFrame({"L": ["fr", "fr-FR", "eng"]})
-        assert rule.check(df, "L", {"content_type": "language"}) == []
-
     def test_invalid_iso639_primary_flagged(self):
         df = pd.DataFrame({"L": ["qq", "xx", "zzz"]})
         issues = rule.check(df, "L", {"content_type": "language"})
         assert len(issues) == 3
 
-    def test_invalid_flagged(self):
-        df = pd.DataFrame({"L": ["français"]})
-        issues = rule.check(df, "L", {"content_type": "language"})
-        assert len(issues) == 1
-        assert "langue" in issues[0].message.lower()
-
-
-class TestContentTypeRuleCountry:
-    def test_alpha2_valid(self):
-        df = pd.DataFrame({"C": ["FR", "de"]})
-        assert rule.check(df, "C", {"content_type": "country"}) == []
-
-    def test_invalid_flagged(self):
-        df = pd.DataFrame({"C": ["France"]})
-        issues = rule.check(df, "C", {"content_type": "country"})
-        assert len(issues) == 1
-        assert "pays" in issues[0].message.lower()
-
-
-class TestContentTypeRuleAddress:
-    def test_email_and_url_valid(self):
-        df = pd.DataFrame({"A": ["user@example.com", "https://example.org"]})
-        assert rule.check(df, "A", {"content_type": "address"}) == []
-
-    def test_invalid_flagged(self):
-        df = pd.DataFrame({"A": ["pas une adresse"]})
-        issues = rule.check(df, "A", {"content_type": "address"})
-        assert len(issues) == 1
-        assert "adresse" in issues[0].message.lower()
+    def test_repeated_invalid_values_each_flagged(self):
+        df = pd.DataFrame({"N": ["x", "1", "x", "x"]}, index=[10, 11, 12, 13])
+        issues = rule.check(df, "N", {"content_type": "integer"})
+        assert [i.row for i in issues] == [10, 12, 13]
 
 
 # ---------------------------------------------------------------------------
@@ -19,6 +19,11 @@ class TestValidationEngine:
         assert all(isinstance(i, Issue) for i in issues)
         assert result.rule_failures == []
 
+    def test_validation_leaves_the_frame_untouched(self, simple_df):
+        before = simple_df.copy()
+        self.engine.validate(simple_df, config={})
+        pd.testing.assert_frame_equal(simple_df, before)
+
     def test_partial_validation_only_targets_columns(self, simple_df):
         all_issues = self.engine.validate(simple_df, config={}).issues
         partial_issues = self.engine.validate(simple_df, columns=["Titre"], config={}).issues
@@ -69,3 +74,24 @@ class TestValidationEngine:
     def test_empty_dataframe_returns_no_issues(self, empty_df):
         issues = self.engine.validate(empty_df, config={}).issues
         assert issues == []
+
+    def test_per_column_rules_share_non_blank_cells(self):
+        from spreadsheet_qa.core.rule_base import Rule, non_blank_cells
+
+        seen: list[pd.Series] = []
+
+        class _Probe(Rule):
+            rule_id = "test.probe"
+
+            def check(self, df, col, config):
+                seen.append(non_blank_cells(df, col, config))
+                return []
+
+        class _Registry:
+            def all_rules(self):
+                return [_Probe, _Probe]
+
+        df = pd.DataFrame({"A": [" x ", None, "  ", "y"]})
+        ValidationEngine(_Registry()).validate(df, config={})
+        assert seen[0] is seen[1]
+        assert seen[0].to_dict() == {0: "x", 3: "y"}
@@ -21,8 +21,7 @@ from spreadsheet_qa.core.exporters import (
 from spreadsheet_qa.core.models import Issue, IssueStatus, Severity
 
 
-@pytest.fixture
-def sample_df():
+def _sample_frame() -> pd.DataFrame:
     return pd.DataFrame(
         {
             "Titre": ["Introduction ; à la vie", '"Quoted"', "Normal"],
@@ -32,6 +31,34 @@ def sample_df():
     )
 
 
+@pytest.fixture
+def sample_df():
+    return _sample_frame()
+
+
+@pytest.fixture(scope="module")
+def csv_no_bom(tmp_path_factory) -> Path:
+    """The sample frame written once by CSVExporter with default options."""
+    path = tmp_path_factory.mktemp("csv") / "out.csv"
+    CSVExporter().export(_sample_frame(), path)
+    return path
+
+
+@pytest.fixture(scope="module")
+def csv_bom(tmp_path_factory) -> Path:
+    path = tmp_path_factory.mktemp("csv_bom") / "out.csv"
+    CSVExporter().export(_sample_frame(), path, bom=True)
+    return path
+
+
+@pytest.fixture(scope="module")
+def xlsx_path(tmp_path_factory) -> Path:
+    """The sample frame written once by XLSXExporter (openpyxl is slow)."""
+    path = tmp_path_factory.mktemp("xlsx") / "out.xlsx"
+    XLSXExporter().export(_sample_frame(), path)
+    return path
+
+
 @pytest.fixture
 def sample_issues():
     return [
@@ -47,55 +74,49 @@ def sample_issues():
     ]
 
 
+# Under pytest-xdist (--dist loadgroup) each group runs on one worker, so
+# the module-scoped export fixtures are still built only once
+@pytest.mark.xdist_group("csv_export")
 class TestCSVExporter:
-    def test_delimiter_is_semicolon(self, sample_df, tmp_path):
-        path = tmp_path / "out.csv"
-        CSVExporter().export(sample_df, path)
-        content = path.read_text(encoding="utf-8")
+    def test_delimiter_is_semicolon(self, csv_no_bom):
+        content = csv_no_bom.read_text(encoding="utf-8")
         # Parse with semicolon — should produce correct columns
         reader = csv.reader(io.StringIO(content), delimiter=";")
         rows = list(reader)
         assert rows[0] == ["Titre", "Auteur", "Date"]
 
-    def test_values_with_semicolon_are_quoted(self, sample_df, tmp_path):
-        path = tmp_path / "out.csv"
-        CSVExporter().export(sample_df, path)
-        content = path.read_text(encoding="utf-8")
+    def test_values_with_semicolon_are_quoted(self, csv_no_bom):
+        content = csv_no_bom.read_text(encoding="utf-8")
         # "Introduction ; à la vie" contains ; → must be quoted
         assert '"Introduction ; à la vie"' in content
 
-    def test_utf8_no_bom_by_default(self, sample_df, tmp_path):
-        path = tmp_path / "out.csv"
-        CSVExporter().export(sample_df, path, bom=False)
-        raw = path.read_bytes()
-        assert not raw.startswith(b"\xef\xbb\xbf")  # no BOM
-
-    def test_utf8_bom_when_requested(self, sample_df, tmp_path):
-        path = tmp_path / "out.csv"
-        CSVExporter().export(sample_df, path, bom=True)
-        raw = path.read_bytes()
-        assert raw.startswith(b"\xef\xbb\xbf")
-
-    def test_roundtrip(self, sample_df, tmp_path):
-        path = tmp_path / "out.csv"
-        CSVExporter().export(sample_df, path)
-        df2 = pd.read_csv(path, sep=";", dtype=str)
+    # No BOM by default, BOM when requested
+    @pytest.mark.parametrize("export, has_bom", [("csv_no_bom", False), ("csv_bom", True)])
+    def test_utf8_bom(self, request, export, has_bom):
+        path = request.getfixturevalue(export)
+        with path.open("rb") as f:
+            head = f.read(3)
+        assert (head == b"\xef\xbb\xbf") is has_bom
+
+    def test_roundtrip(self, sample_df, csv_no_bom):
+        df2 = pd.read_csv(csv_no_bom, sep=";", dtype=str)
         assert list(df2.columns) == list(sample_df.columns)
         assert len(df2) == len(sample_df)
 
 
+@pytest.mark.xdist_group("xlsx_export")
 class TestXLSXExporter:
-    def test_creates_xlsx_file(self, sample_df, tmp_path):
-        path = tmp_path / "out.xlsx"
-        XLSXExporter().export(sample_df, path)
-        assert path.exists()
-
-    def test_xlsx_has_correct_data(self, sample_df, tmp_path):
-        path = tmp_path / "out.xlsx"
-        XLSXExporter().export(sample_df, path)
-        df2 = pd.read_excel(path, dtype=str, engine="openpyxl")
-        assert list(df2.columns) == list(sample_df.columns)
-        assert len(df2) == len(sample_df)
+    def test_creates_xlsx_file(self, xlsx_path):
+        assert xlsx_path.exists()
+
+    def test_xlsx_has_correct_data(self, sample_df, xlsx_path):
+        wb = openpyxl.load_workbook(xlsx_path, read_only=True, data_only=True)
+        try:
+            rows = list(wb.active.iter_rows(values_only=True))
+        finally:
+            wb.close()
+        assert list(rows[0]) == list(sample_df.columns)
+        assert [list(r) for r in rows[1:]] == sample_df.values.tolist()
 
 
 class TestAnnotatedExports:
@@ -52,16 +52,58 @@ class TestDatasetLoader:
         df, meta = self.loader.load(csv_file, header_row=1)
         assert meta.delimiter == ";"
 
+    def test_detects_delimiter_on_large_quoted_file(self, tmp_path):
+        p = tmp_path / "quoted.csv"
+        row = '"Dupont, Jean";"Une description, avec des virgules";"2024"\n'
+        p.write_text("Auteur;Description;Annee\n" + row * 500, encoding="utf-8")
+        df, meta = self.loader.load(p, header_row=0)
+        assert meta.delimiter == ";"
+        assert list(df.columns) == ["Auteur", "Description", "Annee"]
+        assert len(df) == 500
+
+    def test_ragged_rows_are_padded(self, csv_file):
+        df, _ = self.loader.load(csv_file, header_row=0)
+        assert list(df.columns) == ["# metadata line", "Unnamed_1", "Unnamed_2"]
+        assert df.iloc[0].tolist() == ["Titre", "Auteur", "Date"]
+
+    def test_row_wider_than_the_head_sample(self, tmp_path):
+        p = tmp_path / "wide.csv"
+        p.write_text("A;B\n" + "1;2\n" * 20000 + "3;4;5\n", encoding="utf-8")
+        df, meta = self.loader.load(p, header_row=0)
+        assert list(df.columns) == ["A", "B", "Unnamed_2"]
+        assert df.iloc[-1].tolist() == ["3", "4", "5"]
+        assert df.iloc[0].tolist() == ["1", "2", ""]
+        assert meta.original_shape == (20001, 3)
+
     def test_detects_encoding(self, tmp_path):
         p = tmp_path / "utf8.csv"
         p.write_text("A;B\ncafé;naïve\n", encoding="utf-8")
         df, meta = self.loader.load(p, header_row=0)
         assert "café" in df["A"].values
 
+    def test_ascii_head_is_read_as_utf8(self, tmp_path):
+        p = tmp_path / "late_accent.csv"
+        p.write_text("A;B\n" + "x;y\n" * 10000 + "café;naïve\n", encoding="utf-8")
+        df, meta = self.loader.load(p, header_row=0)
+        assert meta.encoding == "utf-8"
+        assert df.iloc[-1].tolist() == ["café", "naïve"]
+
     def test_fingerprint_is_sha256_prefix(self, csv_file):
         _, meta = self.loader.load(csv_file, header_row=1)
         assert len(meta.fingerprint) == 64  # sha256 hex = 64 chars
 
+    def test_fingerprint_covers_first_64_kib_only(self, tmp_path):
+        import hashlib
+
+        p = tmp_path / "big.csv"
+        body = "A;B\n" + "valeur;autre\n" * 10000
+        p.write_text(body, encoding="utf-8")
+        df, meta = self.loader.load(p, header_row=0)
+        assert len(df) == 10000
+        raw = p.read_bytes()
+        assert len(raw) > 65536
+        assert meta.fingerprint == hashlib.sha256(raw[:65536]).hexdigest()
+
     def test_raises_on_invalid_header_row(self, tmp_path):
         p = tmp_path / "tiny.csv"
         p.write_text("A;B\n1;2\n", encoding="utf-8")
@@ -89,3 +131,7 @@ class TestPreviewHeaderRows:
     def test_first_row_is_metadata_line(self, csv_file):
         rows = preview_header_rows(csv_file, n=3)
         assert "metadata" in rows[0][0].lower() or "#" in rows[0][0]
+
+    def test_xlsx_preview_stops_after_n_rows(self, xlsx_file):
+        rows = preview_header_rows(xlsx_file, n=3)
+        assert rows == [["meta", "meta"], ["Titre", "Auteur"], ["A", "x"]]
@@ -0,0 +1,69 @@
+"""Tests for IssueStore lookups and the dense severity grid."""
+
+from __future__ import annotations
+
+from spreadsheet_qa.core.issue_store import SEVERITY_CODES, IssueStore
+from spreadsheet_qa.core.models import Issue, IssueStatus, Severity
+
+
+def _issue(rule_id, severity, row, col):
+    return Issue.create(rule_id, severity, row, col, None, f"{rule_id} message")
+
+
+class TestSeverityGrid:
+    def test_worst_open_severity_per_cell(self):
+        store = IssueStore()
+        store.replace_all(
+            [
+                _issue("r1", Severity.SUSPICION, 0, "A"),
+                _issue("r2", Severity.ERROR, 0, "A"),
+                _issue("r3", Severity.WARNING, 1, "B"),
+            ]
+        )
+        grid = store.severity_grid(2, ["A", "B"])
+        assert grid.dtype.name == "int8"
+        assert grid.tolist() == [
+            [SEVERITY_CODES[Severity.ERROR], -1],
+            [-1, SEVERITY_CODES[Severity.WARNING]],
+        ]
+
+    def test_ignores_closed_row_level_and_out_of_range_issues(self):
+        store = IssueStore()
+        fixed = _issue("r1", Severity.ERROR, 0, "A")
+        store.replace_all(
+            [
+                fixed,
+                _issue("r2", Severity.ERROR, 0, "__row__"),
+                _issue("r3", Severity.ERROR, 5, "A"),
+            ]
+        )
+        store.set_status(fixed.id, IssueStatus.FIXED)
+        assert store.severity_grid(1, ["A"]).tolist() == [[-1]]
+
+
+class TestHasIssueBits:
+    def test_bits_cover_all_statuses_and_wide_frames(self):
+        store = IssueStore()
+        ignored = _issue("r1", Severity.WARNING, 0, "C9")
+        store.replace_all([ignored, _issue("r2", Severity.ERROR, 1, "C0")])
+        store.set_status(ignored.id, IssueStatus.IGNORED)
+        columns = [f"C{i}" for i in range(10)]
+        bits = store.has_issue_bits(2, columns)
+        assert bits.shape == (2, 2)
+        flagged = {
+            (r, j) for r in range(2) for j in range(10) if IssueStore.cell_has_issue(bits, r, j)
+        }
+        assert flagged == {(0, 9), (1, 0)}
+
+
+class TestTooltipForCell:
+    def test_tooltip_is_cached_until_cell_issues_change(self):
+        store = IssueStore()
+        store.replace_all([_issue("r1", Severity.ERROR, 0, "A")])
+        first = store.tooltip_for_cell(0, "A")
+        assert first == "r1 message"
+        assert store.tooltip_for_cell(0, "A") is first
+        assert store.tooltip_for_cell(1, "A") is None
+
+        store.replace_for_columns(["A"], [_issue("r2", Severity.WARNING, 0, "A")])
+        assert store.tooltip_for_cell(0, "A") == "r2 message"
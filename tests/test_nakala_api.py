@@ -54,6 +54,20 @@ def _mock_client_cls(return_value):
     return mock_cls
 
 
+@pytest.fixture
+def client(tmp_path) -> NakalaClient:
+    """Client whose disk cache (not yet written) lives in tmp_path."""
+    return NakalaClient(cache_path=tmp_path / "cache.json")
+
+
+@pytest.fixture
+def mock_httpx():
+    """Replace httpx in nakala_api by a MagicMock, marked as available."""
+    with patch("spreadsheet_qa.core.nakala_api._HTTPX_AVAILABLE", True):
+        with patch("spreadsheet_qa.core.nakala_api.httpx") as mock:
+            yield mock
+
+
 def _patched_client(tmp_cache: Path, endpoint_data: dict) -> NakalaClient:
     """NakalaClient whose _fetch_sync returns pre-defined data per endpoint."""
     client = NakalaClient(cache_path=tmp_cache)
@@ -67,35 +81,28 @@ def _patched_client(tmp_cache: Path, endpoint_data: dict) -> NakalaClient:
 
 
 class TestFetchDepositTypes:
-    def test_parses_flat_string_list(self, tmp_path):
-        client = NakalaClient(cache_path=tmp_path / "cache.json")
+    def test_parses_flat_string_list(self, client):
         client._fetch_sync = lambda ep: COAR_URIS
         result = client.fetch_deposit_types()
         assert result == COAR_URIS
 
-    def test_ignores_dict_items(self, tmp_path):
+    def test_ignores_dict_items(self, client):
         """Old/wrong API format (dicts) must be filtered out."""
-        client = NakalaClient(cache_path=tmp_path / "cache.json")
         client._fetch_sync = lambda ep: [{"id": "not_a_uri"}, COAR_URIS[0]]
         result = client.fetch_deposit_types()
         assert result == [COAR_URIS[0]]
 
-    def test_uses_datatypes_endpoint(self, tmp_path):
+    def test_uses_datatypes_endpoint(self, client):
         called = []
-        client = NakalaClient(cache_path=tmp_path / "cache.json")
         client._fetch_sync = lambda ep: called.append(ep) or []
         client.fetch_deposit_types()
         assert any("datatypes" in ep for ep in called)
 
-    def test_returns_empty_on_network_error(self, tmp_path):
-        client = NakalaClient(cache_path=tmp_path / "cache.json")
-        with patch("spreadsheet_qa.core.nakala_api._HTTPX_AVAILABLE", True):
-            with patch("spreadsheet_qa.core.nakala_api.httpx") as mock_httpx:
-                mock_httpx.Client.return_value.__enter__.return_value.get.side_effect = (
-                    OSError("network error")
-                )
-                result = client.fetch_deposit_types()
-        assert result == []
+    def test_returns_empty_on_network_error(self, client, mock_httpx):
+        mock_httpx.Client.return_value.__enter__.return_value.get.side_effect = (
+            OSError("network error")
+        )
+        assert client.fetch_deposit_types() == []
 
 
 # ---------------------------------------------------------------------------
@@ -104,14 +111,12 @@ class TestFetchDepositTypes:
 
 
 class TestFetchLicenses:
-    def test_extracts_code_field(self, tmp_path):
-        client = NakalaClient(cache_path=tmp_path / "cache.json")
+    def test_extracts_code_field(self, client):
         client._fetch_sync = lambda ep: SPDX_LICENSES_RAW
         result = client.fetch_licenses()
         assert result == ["CC-BY-4.0", "CC0-1.0", "MIT"]
 
-    def test_ignores_items_without_code(self, tmp_path):
-        client = NakalaClient(cache_path=tmp_path / "cache.json")
+    def test_ignores_items_without_code(self, client):
         client._fetch_sync = lambda ep: [
             {"name": "No code here"},
             {"code": "Apache-2.0", "name": "Apache"},
@@ -119,8 +124,7 @@ class TestFetchLicenses:
         result = client.fetch_licenses()
         assert result == ["Apache-2.0"]
 
-    def test_returns_empty_list_for_empty_response(self, tmp_path):
-        client = NakalaClient(cache_path=tmp_path / "cache.json")
+    def test_returns_empty_list_for_empty_response(self, client):
         client._fetch_sync = lambda ep: []
         result = client.fetch_licenses()
         assert result == []
@@ -132,14 +136,12 @@ class TestFetchLicenses:
 
 
 class TestFetchLanguages:
-    def test_extracts_id_field(self, tmp_path):
-        client = NakalaClient(cache_path=tmp_path / "cache.json")
+    def test_extracts_id_field(self, client):
         client._fetch_sync = lambda ep: LANGUAGES_RAW
         result = client.fetch_languages()
         assert result == ["fra", "eng", "deu"]
 
-    def test_ignores_items_without_id(self, tmp_path):
-        client = NakalaClient(cache_path=tmp_path / "cache.json")
+    def test_ignores_items_without_id(self, client):
         client._fetch_sync = lambda ep: [
             {"label": "no id"},
             {"id": "ita", "label": "Italian"},
@@ -154,15 +156,10 @@ class TestFetchLanguages:
 
 
 class TestCache:
-    def test_cache_written_after_http_fetch(self, tmp_path):
+    def test_cache_written_after_http_fetch(self, tmp_path, client, mock_httpx):
         cache_path = tmp_path / "cache.json"
-        client = NakalaClient(cache_path=cache_path)
-
-        with patch("spreadsheet_qa.core.nakala_api._HTTPX_AVAILABLE", True):
-            mock_cls = _mock_client_cls(COAR_URIS)
-            with patch("spreadsheet_qa.core.nakala_api.httpx") as mock_httpx:
-                mock_httpx.Client = mock_cls
-                client.fetch_deposit_types()
+        mock_httpx.Client = _mock_client_cls(COAR_URIS)
+        client.fetch_deposit_types()
 
         assert cache_path.exists()
         data = json.loads(cache_path.read_text(encoding="utf-8"))
@@ -183,6 +180,56 @@ class TestCache:
         result = client2.fetch_deposit_types()
         assert result == COAR_URIS
 
+    def test_parsed_vocabulary_is_memoized(self, client):
+        calls = []
+        client._fetch_sync = lambda ep: calls.append(ep) or SPDX_LICENSES_RAW
+        first = client.fetch_licenses()
+        assert client.fetch_licenses() is first
+        assert len(calls) == 1
+
+    def test_empty_result_is_not_memoized(self, client):
+        responses = [[], LANGUAGES_RAW]
+        client._fetch_sync = lambda ep: responses.pop(0)
+        assert client.fetch_languages() == []
+        assert client.fetch_languages() == ["fra", "eng", "deu"]
+
+    def test_fetch_all_shares_one_http_client(self, tmp_path, client, mock_httpx):
+        import threading
+
+        responses = {
+            "/vocabularies/datatypes": COAR_URIS,
+            "/vocabularies/licenses": SPDX_LICENSES_RAW,
+            "/vocabularies/languages?limit=10000": LANGUAGES_RAW,
+        }
+
+        def get(url):
+            resp = MagicMock()
+            resp.json.return_value = responses[url.removeprefix("https://api.nakala.fr")]
+            return resp
+
+        mock_cls = _mock_client_cls(None)
+        mock_cls.return_value.__enter__.return_value.get.side_effect = get
+        mock_httpx.Client = mock_cls
+        done = threading.Event()
+        client.fetch_all_async(on_done=done.set)
+        assert done.wait(5)
+
+        assert mock_cls.call_count == 1
+        assert client.fetch_languages() == ["fra", "eng", "deu"]
+        assert set(json.loads((tmp_path / "cache.json").read_text(encoding="utf-8"))) == set(responses)
+
+    def test_cache_readable_with_and_without_orjson(self, tmp_path):
+        pytest.importorskip("orjson")
+        cache_path = tmp_path / "cache.json"
+        client = NakalaClient(cache_path=cache_path)
+        client._cache["/vocabularies/licenses"] = [{"code": "CC-BY-4.0", "name": "Attribution é"}]
+
+        for writer_orjson, reader_orjson in ((False, True), (True, False)):
+            with patch("spreadsheet_qa.core.nakala_api._ORJSON_AVAILABLE", writer_orjson):
+                client._save_cache()
+            with patch("spreadsheet_qa.core.nakala_api._ORJSON_AVAILABLE", reader_orjson):
+                assert NakalaClient(cache_path=cache_path)._cache == client._cache
+
     def test_corrupt_cache_ignored(self, tmp_path):
         cache_path = tmp_path / "cache.json"
         cache_path.write_text("not valid json", encoding="utf-8")
@@ -196,24 +243,20 @@ class TestCache:
 
 
 class TestFailOpen:
-    def test_is_valid_deposit_type_true_when_no_vocab(self, tmp_path):
-        client = NakalaClient(cache_path=tmp_path / "cache.json")
+    def test_is_valid_deposit_type_true_when_no_vocab(self, client):
         client._fetch_sync = lambda ep: []
         # Empty vocab → fail-open → True for any value
         assert client.is_valid_deposit_type("anything") is True
 
-    def test_is_valid_license_true_when_no_vocab(self, tmp_path):
-        client = NakalaClient(cache_path=tmp_path / "cache.json")
+    def test_is_valid_license_true_when_no_vocab(self, client):
         client._fetch_sync = lambda ep: []
         assert client.is_valid_license("anything") is True
 
-    def test_is_valid_language_true_when_no_vocab(self, tmp_path):
-        client = NakalaClient(cache_path=tmp_path / "cache.json")
+    def test_is_valid_language_true_when_no_vocab(self, client):
         client._fetch_sync = lambda ep: []
         assert client.is_valid_language("anything") is True
 
-    def test_is_valid_deposit_type_false_for_unknown(self, tmp_path):
-        client = NakalaClient(cache_path=tmp_path / "cache.json")
+    def test_is_valid_deposit_type_false_for_unknown(self, client):
         client._fetch_sync = lambda ep: COAR_URIS
         assert client.is_valid_deposit_type("http://purl.org/coar/resource_type/c_ddb1") is True
         assert client.is_valid_deposit_type("not_a_valid_uri") is False
@@ -261,6 +304,11 @@ class TestNakalaCreatedFormatRule:
         df = pd.DataFrame({"other": ["2024"]})
         assert self.rule.check(df, "nakala:created", {}) == []
 
+    def test_only_invalid_rows_reported_with_stripped_value(self):
+        df = pd.DataFrame({"nakala:created": [" 2024 ", "s.d.", None, "hier ", "2024-1"]})
+        issues = self.rule.check(df, "nakala:created", {"special_values": ["S.D."]})
+        assert [(i.row, i.original) for i in issues] == [(3, "hier"), (4, "2024-1")]
+
 
 # ---------------------------------------------------------------------------
 # Nakala rules — NakalaDepositTypeRule (requires client)
@@ -338,6 +386,12 @@ class TestNakalaLicenseRule:
         issues = self.rule.check(df, "nakala:license", {"_nakala_client": client})
         assert len(issues) == 1
 
+    def test_only_unknown_rows_reported_with_stripped_value(self):
+        client = _MockNakalaClient(licenses=["CC-BY-4.0", "MIT"])
+        df = pd.DataFrame({"nakala:license": [" MIT ", None, "", "GPL ", "CC-BY-4.0"]})
+        issues = self.rule.check(df, "nakala:license", {"_nakala_client": client})
+        assert [(i.row, i.original) for i in issues] == [(3, "GPL")]
+
     def test_no_client_skips(self):
         df = pd.DataFrame({"nakala:license": ["anything"]})
         assert self.rule.check(df, "nakala:license", {}) == []
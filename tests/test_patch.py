@@ -71,6 +71,45 @@ class TestPatchWriter:
         assert restored.old_value == "original text"
         assert restored.new_value == "fixed"
 
+    def test_reads_patch_files_written_by_stdlib_json(self, tmp_path):
+        import math
+
+        pw = PatchWriter(tmp_path / "patches")
+        data = _make_patch("legacy", old_val=float("nan"), new_val="é").to_dict()
+        (tmp_path / "patches" / "legacy.json").write_text(json.dumps(data, indent=2), encoding="utf-8")
+        restored = pw.read("legacy")
+        assert math.isnan(restored.old_value)
+        assert restored.new_value == "é"
+
+    def test_nan_old_value_roundtrip(self, tmp_path):
+        import math
+
+        pw = PatchWriter(tmp_path / "patches")
+        pw.write(_make_patch("empty_cell", old_val=float("nan"), new_val="rempli"))
+        restored = pw.read("empty_cell")
+        assert math.isnan(restored.old_value)
+        assert restored.new_value == "rempli"
+
+    def test_numpy_scalar_values_are_written(self, tmp_path):
+        import numpy as np
+
+        pw = PatchWriter(tmp_path / "patches")
+        pw.write(_make_patch("numpy", old_val=np.float64(1.5), new_val=np.int64(2)))
+        restored = pw.read("numpy")
+        assert restored.old_value == 1.5
+        assert restored.new_value == 2
+
+    def test_nan_with_numpy_scalar_is_written(self, tmp_path):
+        import math
+
+        import numpy as np
+
+        pw = PatchWriter(tmp_path / "patches")
+        pw.write(_make_patch("mixed", old_val=np.float64("nan"), new_val=np.int64(3)))
+        restored = pw.read("mixed")
+        assert math.isnan(restored.old_value)
+        assert restored.new_value == 3
+
 
 class TestNullPatchWriter:
     def test_write_returns_none(self):
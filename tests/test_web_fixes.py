@@ -0,0 +1,192 @@
+"""Tests for the hygiene fix pack endpoints.
+
+Covers:
+  - Parité de _apply_fixes / _apply_fixes_series avec l'application pas à pas
+  - POST /api/jobs/{job_id}/fixes (application + annulation)
+"""
+
+from __future__ import annotations
+
+import io
+import itertools
+import re
+import unicodedata
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from spreadsheet_qa.core.text_utils import INVISIBLE_RE, UNICODE_SUSPECTS  # noqa: E402
+from spreadsheet_qa.web.app import _apply_fixes, _apply_fixes_series, app  # noqa: E402
+
+client = TestClient(app)
+
+_FIX_KEYS = (
+    "trim",
+    "collapse_spaces",
+    "replace_nbsp",
+    "strip_invisible",
+    "normalize_unicode",
+    "normalize_newlines",
+)
+
+_SAMPLES = [
+    "  a  b ",
+    "a \u00a0 b\u00a0\u00a0",
+    "x y",
+    "​z­",
+    "’q—“",
+    "r\r\ns\rt",
+    "é",
+    "\x1c ok \x1c",
+    "",
+    "plain",
+]
+
+
+def _upload(rows: list[list[str]]) -> str:
+    lines = ["titre;auteur"] + [";".join(r) for r in rows]
+    resp = client.post(
+        "/api/jobs",
+        files={"file": ("data.csv", io.BytesIO("\n".join(lines).encode("utf-8")), "text/csv")},
+        data={"header_row": "1"},
+    )
+    assert resp.status_code == 200
+    return resp.json()["job_id"]
+
+
+def _reference_fix(value: str, opts: dict[str, bool]) -> str:
+    """The fix pack applied step by step, as documented."""
+    if opts.get("trim"):
+        value = value.strip()
+    if opts.get("collapse_spaces"):
+        value = re.sub(r"  +", " ", value).strip()
+    if opts.get("replace_nbsp"):
+        value = value.replace("\u00a0", " ")
+    if opts.get("strip_invisible"):
+        value = INVISIBLE_RE.sub("", value)
+    if opts.get("normalize_unicode"):
+        for ch, rep in UNICODE_SUSPECTS.items():
+            value = value.replace(ch, rep)
+        value = unicodedata.normalize("NFC", value)
+    if opts.get("normalize_newlines"):
+        value = value.replace("\r\n", "\n").replace("\r", "\n")
+    return value
+
+
+class TestApplyFixes:
+    @pytest.mark.parametrize("bits", list(itertools.product([False, True], repeat=len(_FIX_KEYS))))
+    def test_matches_reference(self, bits):
+        opts = dict(zip(_FIX_KEYS, bits))
+        expected = [_reference_fix(v, opts) for v in _SAMPLES]
+        assert [_apply_fixes(v, opts) for v in _SAMPLES] == expected
+        series = pd.Series(_SAMPLES, dtype=object)
+        assert list(_apply_fixes_series(series, opts)) == expected
+
+
+class TestApplyFixesEndpoint:
+    def test_apply_and_undo(self):
+        job_id = _upload([["  Titre  un ", "Auteur"], ["Propre", "  B"]])
+
+        resp = client.post(
+            f"/api/jobs/{job_id}/fixes",
+            data={"trim": "true", "collapse_spaces": "true"},
+        )
+        assert resp.status_code == 200
+        assert resp.json()["cells_fixed"] == 2
+
+        preview = client.get(f"/api/jobs/{job_id}/preview").json()
+        assert preview["rows"][0][0] == "Titre un"
+        assert preview["rows"][1][1] == "B"
+
+        resp = client.post(f"/api/jobs/{job_id}/undo")
+        assert resp.status_code == 200
+        preview = client.get(f"/api/jobs/{job_id}/preview").json()
+        assert preview["rows"][0][0] == "  Titre  un "
+
+
+class TestPreviewFixesEndpoint:
+    def test_total_counts_beyond_limit(self):
+        job_id = _upload([[f" t{i} ", f"a{i} "] for i in range(5)])
+
+        resp = client.post(
+            f"/api/jobs/{job_id}/fixes/preview",
+            data={"trim": "true", "limit": "3"},
+        )
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["total"] == 10
+        assert [(p["colonne"], p["ligne"]) for p in body["aperçu"]] == [
+            ("titre", 1), ("titre", 2), ("titre", 3),
+        ]
+        assert body["aperçu"][0]["avant"] == " t0 "
+        assert body["aperçu"][0]["après"] == "t0"
+
+
+class TestWhitespaceKernel:
+    @pytest.mark.parametrize("bits", list(itertools.product([False, True], repeat=4)))
+    def test_matches_scalar(self, bits):
+        pytest.importorskip("numba")
+        from spreadsheet_qa.core._fix_kernels import apply_whitespace_fixes
+
+        opts = dict(zip(("trim", "collapse_spaces", "replace_nbsp", "normalize_newlines"), bits))
+        expected = [_apply_fixes(v, opts) for v in _SAMPLES]
+        assert apply_whitespace_fixes(list(_SAMPLES), opts) == expected
+
+
+class TestFixTargetColumns:
+    def test_numeric_and_bool_columns_are_skipped(self):
+        from spreadsheet_qa.web.app import _fix_target_columns
+
+        df = pd.DataFrame({
+            "t": [" a "],
+            "n": [1.5],
+            "i": pd.array([2], dtype="Int64"),
+            "b": [True],
+            "c": pd.Categorical([" x "]),
+        })
+        assert _fix_target_columns(df, "") == ["t", "c"]
+        assert _fix_target_columns(df, "n, t,absent") == ["t"]
+
+
+class TestArrowFixes:
+    @pytest.mark.parametrize("bits", list(itertools.product([False, True], repeat=5)))
+    def test_matches_scalar(self, bits):
+        from spreadsheet_qa.web.app import _column_fix_changes
+
+        keys = ("trim", "collapse_spaces", "replace_nbsp", "strip_invisible", "normalize_newlines")
+        opts = dict(zip(keys, bits))
+        series = pd.Series(_SAMPLES + [None], dtype="str")
+        if not isinstance(series.array, pd.arrays.ArrowStringArray):
+            pytest.skip("pas de chaînes Arrow")
+        before, after = _column_fix_changes(series, opts)
+        expected = {
+            i: _apply_fixes(v, opts) for i, v in enumerate(_SAMPLES) if _apply_fixes(v, opts) != v
+        }
+        assert dict(zip(before.index, after)) == expected
+        assert list(before) == [_SAMPLES[i] for i in expected]
+
+
+class TestFixCommandCache:
+    def test_edits_refresh_cache_without_touching_shared_frame(self):
+        from spreadsheet_qa.web.app import _df_stamp, _load_df
+        from spreadsheet_qa.web.jobs import job_manager
+
+        job_id = _upload([["  Titre ", "A"]])
+        job = job_manager.get(job_id)
+        before = _load_df(job)
+
+        resp = client.post(f"/api/jobs/{job_id}/fixes", data={"trim": "true"})
+        assert resp.json()["cells_fixed"] == 1
+
+        cached = job_manager.get_cached_df(job_id, _df_stamp(job._df_path))
+        assert cached is not None
+        assert cached.at[0, "titre"] == "Titre"
+        assert before.at[0, "titre"] == "  Titre "
+
+        client.post(f"/api/jobs/{job_id}/undo")
+        assert _load_df(job).at[0, "titre"] == "  Titre "
@@ -0,0 +1,327 @@
+"""Tests for the in-memory JobManager (web/jobs.py)."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from spreadsheet_qa.web.jobs import DF_CACHE_SIZE, JobManager  # noqa: E402
+
+
+class TestDataFrameCache:
+    def test_stamp_must_match(self):
+        mgr = JobManager()
+        df = object()
+        mgr.cache_df("a", (1, 10), df)
+        assert mgr.get_cached_df("a", (1, 10)) is df
+        assert mgr.get_cached_df("a", (2, 10)) is None
+
+    def test_least_recently_used_is_evicted(self):
+        mgr = JobManager()
+        for i in range(DF_CACHE_SIZE):
+            mgr.cache_df(str(i), 0, i)
+        mgr.get_cached_df("0", 0)  # refresh job 0
+        mgr.cache_df("new", 0, "new")
+        assert mgr.get_cached_df("0", 0) == 0
+        assert mgr.get_cached_df("1", 0) is None
+
+    def test_delete_drops_cached_df(self):
+        mgr = JobManager()
+        job = mgr.create()
+        mgr.cache_df(job.id, 0, "df")
+        mgr.delete(job.id)
+        assert mgr.get_cached_df(job.id, 0) is None
+
+
+class TestJobDataFramePersistence:
+    def test_roundtrip_keeps_values_and_missing(self, tmp_path):
+        import pandas as pd
+
+        from spreadsheet_qa.web.jobs import read_job_df, save_job_df, write_job_df
+
+        df = pd.DataFrame({"a": ["x", None, "z"], "b": ["1", "2", None]}, dtype=str)
+        path = save_job_df(df, tmp_path)
+        loaded = read_job_df(path)
+        assert loaded["a"].tolist()[::2] == ["x", "z"]
+        assert loaded.isna().sum().tolist() == [1, 1]
+
+        loaded.at[1, "a"] = "y"
+        write_job_df(loaded, path)
+        assert read_job_df(path).at[1, "a"] == "y"
+
+    def test_falls_back_to_pickle_for_non_arrow_frames(self, tmp_path):
+        import pandas as pd
+
+        from spreadsheet_qa.web.jobs import read_job_df, save_job_df
+
+        df = pd.DataFrame({0: ["x"], "b": [object()]})
+        path = save_job_df(df, tmp_path)
+        assert path.suffix == ".pkl"
+        assert list(read_job_df(path).columns) == [0, "b"]
+
+
+def _problem(row: int, column: str, severity: str = "WARNING", **kw):
+    from spreadsheet_qa.web.jobs import ProblemRow
+
+    return ProblemRow(
+        severity=severity,
+        status=kw.pop("status", "OPEN"),
+        column=column,
+        row=row,
+        message=kw.pop("message", f"{column}{row}"),
+        suggestion="",
+        **kw,
+    )
+
+
+class TestPreviewIssuesEndpoint:
+    def test_first_issue_per_cell_sorted_and_bounded(self):
+        from fastapi.testclient import TestClient
+
+        from spreadsheet_qa.web.app import app
+        from spreadsheet_qa.web.jobs import job_manager
+
+        job = job_manager.create()
+        job.problems = [
+            _problem(3, "b", "ERROR", message="first"),
+            _problem(1, "b"),
+            _problem(3, "b", message="second"),
+            _problem(1, "a", "SUSPICION"),
+            _problem(40, "a"),
+        ]
+        try:
+            body = TestClient(app).get(f"/api/jobs/{job.id}/preview-issues?rows=30").json()
+        finally:
+            job_manager.delete(job.id)
+
+        assert body["cell_issues"] == [
+            {"row": 0, "col": "a", "severity": "suspicion", "message": "a1"},
+            {"row": 0, "col": "b", "severity": "warning", "message": "b1"},
+            {"row": 2, "col": "b", "severity": "error", "message": "first"},
+        ]
+
+    def test_index_follows_reassigned_problems(self):
+        from spreadsheet_qa.web.jobs import Job
+
+        job = Job(id="x")
+        job.problems = [_problem(1, "a")]
+        assert job.problem_index().rows0.tolist() == [0]
+        job.problems = [_problem(5, "a"), _problem(2, "b")]
+        assert job.problem_index().rows0.tolist() == [4, 1]
+
+
+class TestProblemIndex:
+    def test_effective_statuses_apply_overrides_to_counts(self):
+        from spreadsheet_qa.web.jobs import ProblemIndex
+
+        index = ProblemIndex([
+            _problem(1, "a", issue_id="i1"),
+            _problem(2, "a", issue_id="i2"),
+            _problem(3, "b", status="FIXED", issue_id="i3"),
+        ])
+        statuses, counts = index.effective_statuses({"i2": "IGNORED", "unknown": "EXCEPTED"})
+        assert statuses.tolist() == ["OPEN", "IGNORED", "FIXED"]
+        assert counts == {"OPEN": 1, "IGNORED": 1, "FIXED": 1}
+        assert index.statuses.tolist() == ["OPEN", "OPEN", "FIXED"]
+
+    def test_groups_by_severity_and_column(self):
+        from spreadsheet_qa.web.jobs import ProblemIndex
+
+        index = ProblemIndex([
+            _problem(1, "a", "ERROR"),
+            _problem(2, "b", "WARNING"),
+            _problem(3, "a", "WARNING"),
+        ])
+        assert index.by_severity["WARNING"].tolist() == [1, 2]
+        assert index.by_column["a"].tolist() == [0, 2]
+
+
+class TestProblemsEndpoint:
+    def test_cached_page_follows_status_overrides(self):
+        from fastapi.testclient import TestClient
+
+        from spreadsheet_qa.web.app import app
+        from spreadsheet_qa.web.jobs import job_manager
+
+        client = TestClient(app)
+        job = job_manager.create()
+        job.problems = [_problem(1, "a", issue_id="i1"), _problem(2, "a", issue_id="i2")]
+        try:
+            first = client.get(f"/api/jobs/{job.id}/problems").json()
+            assert client.get(f"/api/jobs/{job.id}/problems").json() == first
+            client.put(f"/api/jobs/{job.id}/issues/i2/status", json={"status": "IGNORED"})
+            body = client.get(f"/api/jobs/{job.id}/problems").json()
+        finally:
+            job_manager.delete(job.id)
+
+        assert first["statuts"]["OPEN"] == 2
+        assert body["statuts"] == {"OPEN": 1, "IGNORED": 1, "EXCEPTED": 0, "FIXED": 0}
+        assert [p["statut"] for p in body["problèmes"]] == ["OPEN", "IGNORED"]
+
+    def test_pages_of_a_filtered_view(self):
+        from fastapi.testclient import TestClient
+
+        from spreadsheet_qa.web.app import app
+        from spreadsheet_qa.web.jobs import job_manager
+
+        client = TestClient(app)
+        job = job_manager.create()
+        job.problems = [
+            _problem(i, "a" if i % 2 else "b", "ERROR" if i % 3 else "WARNING", issue_id=f"i{i}")
+            for i in range(1, 13)
+        ]
+        try:
+            url = f"/api/jobs/{job.id}/problems?severity=ERROR&column=a&per_page=2"
+            pages = [client.get(f"{url}&page={n}").json() for n in (1, 2, 3)]
+        finally:
+            job_manager.delete(job.id)
+
+        assert [p["total"] for p in pages] == [4, 4, 4]
+        assert [[row["ligne"] for row in p["problèmes"]] for p in pages] == [[1, 5], [7, 11], []]
+
+
+class TestPreviewSidecar:
+    def test_preview_served_from_sidecar_follows_rewrites(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        import pandas as pd
+
+        from spreadsheet_qa.web.jobs import (
+            PREVIEW_ROWS,
+            read_job_preview,
+            save_job_df,
+            write_job_df,
+        )
+
+        df = pd.DataFrame({"a": [f"v{i}" for i in range(PREVIEW_ROWS + 50)]}, dtype=str)
+        path = save_job_df(df, tmp_path)
+        head, total = read_job_preview(tmp_path)
+        assert total == PREVIEW_ROWS + 50
+        assert head["a"].tolist() == df["a"].head(PREVIEW_ROWS).tolist()
+
+        df.loc[0, "a"] = "changed"
+        write_job_df(df, path)
+        head, _ = read_job_preview(tmp_path)
+        assert head.loc[0, "a"] == "changed"
+
+    def test_preview_endpoint_blanks_missing_cells(self):
+        import io
+
+        from fastapi.testclient import TestClient
+
+        from spreadsheet_qa.web.app import app
+
+        client = TestClient(app)
+        content = "a;b\n1;\n;y\n3;z\n".encode("utf-8")
+        job_id = client.post(
+            "/api/jobs",
+            files={"file": ("d.csv", io.BytesIO(content), "text/csv")},
+            data={"header_row": "1"},
+        ).json()["job_id"]
+        body = client.get(f"/api/jobs/{job_id}/preview?rows=2").json()
+        assert body["columns"] == ["a", "b"]
+        assert body["rows"] == [["1", ""], ["", "y"]]
+        assert body["total_rows"] == 3
+
+
+class TestConditionalGet:
+    def test_unchanged_resources_answer_304(self):
+        import io
+
+        from fastapi.testclient import TestClient
+
+        from spreadsheet_qa.web.app import app
+
+        client = TestClient(app)
+        job_id = client.post(
+            "/api/jobs",
+            files={"file": ("d.csv", io.BytesIO("a;b\n x ;y\n".encode("utf-8")), "text/csv")},
+            data={"header_row": "1"},
+        ).json()["job_id"]
+
+        for path in ("", "/preview", "/column-config"):
+            first = client.get(f"/api/jobs/{job_id}{path}")
+            etag = first.headers["etag"]
+            again = client.get(f"/api/jobs/{job_id}{path}", headers={"If-None-Match": etag})
+            assert again.status_code == 304, path
+            assert again.content == b""
+
+        etag = client.get(f"/api/jobs/{job_id}/column-config").headers["etag"]
+        client.put(f"/api/jobs/{job_id}/column-config", json={"columns": {"b": {"required": True}}})
+        resp = client.get(f"/api/jobs/{job_id}/column-config", headers={"If-None-Match": etag})
+        assert resp.status_code == 200
+        assert resp.json()["columns"]["b"]["required"] is True
+
+        etag = client.get(f"/api/jobs/{job_id}/preview").headers["etag"]
+        client.post(f"/api/jobs/{job_id}/fixes", data={"trim": "true"})
+        resp = client.get(f"/api/jobs/{job_id}/preview", headers={"If-None-Match": etag})
+        assert resp.status_code == 200
+        assert resp.json()["rows"] == [["x", "y"]]
+
+    def test_column_config_etag_follows_template_file(self, tmp_path, monkeypatch):
+        import io
+
+        from fastapi.testclient import TestClient
+
+        from spreadsheet_qa.core.template_manager import TemplateManager
+        from spreadsheet_qa.web.app import app
+        from spreadsheet_qa.web.jobs import job_manager
+
+        monkeypatch.setattr(TemplateManager, "get_user_templates_dir", lambda self: tmp_path)
+        client = TestClient(app)
+        job_id = client.post(
+            "/api/jobs",
+            files={"file": ("d.csv", io.BytesIO("a;b\nx;y\n".encode("utf-8")), "text/csv")},
+            data={"header_row": "1"},
+        ).json()["job_id"]
+        url = f"/api/jobs/{job_id}/column-config"
+        etag = client.get(url).headers["etag"]
+        assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+        # A user template shadowing the job's template changes the defaults
+        template_id = job_manager.get(job_id).template_id
+        (tmp_path / f"{template_id}.yml").write_text(
+            "columns:\n  b:\n    required: true\n", encoding="utf-8"
+        )
+        resp = client.get(url, headers={"If-None-Match": etag})
+        assert resp.status_code == 200
+        assert resp.json()["columns"]["b"]["required"] is True
+
+
+class TestJobDeletion:
+    def test_work_dir_is_removed_in_background(self):
+        import time
+
+        manager = JobManager()
+        job = manager.create()
+        (job.work_dir / "df.feather").write_bytes(b"x")
+        manager.delete(job.id)
+
+        assert manager.get(job.id) is None
+        deadline = time.monotonic() + 5
+        while job.work_dir.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert not job.work_dir.exists()
+
+    def test_jobs_dir_setting(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("spreadsheet_qa.web.jobs.JOBS_DIR", str(tmp_path / "jobs"))
+        job = JobManager().create()
+        assert job.work_dir.parent == tmp_path / "jobs"
+
+
+class TestJobExpiry:
+    def test_only_idle_jobs_expire(self, monkeypatch):
+        from spreadsheet_qa.web import jobs
+
+        manager = JobManager()
+        idle = manager.create()
+        active = manager.create()
+        later = idle.created_at + jobs.TTL_SECONDS + 1
+        active.last_access_at = later - 10
+        monkeypatch.setattr(jobs.time, "time", lambda: later)
+
+        wait = manager._cleanup_expired()
+
+        assert manager.get(idle.id) is None
+        assert manager.get(active.id) is active
+        assert 0 < wait <= jobs.TTL_SECONDS
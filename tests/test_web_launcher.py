@@ -0,0 +1,149 @@
+"""Tests for the standalone web launcher helpers (web/launcher.py)."""
+
+from __future__ import annotations
+
+import os
+import socket
+
+import pytest
+
+from spreadsheet_qa.web.launcher import find_free_port, wait_for_health, wait_until_started
+
+
+def _listening_socket(reuse_addr: bool = False) -> socket.socket:
+    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    if reuse_addr:
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    s.bind(("127.0.0.1", 0))
+    s.listen()
+    return s
+
+
+class TestFindFreePort:
+    def test_prefers_the_start_of_the_range(self):
+        with _listening_socket() as busy:
+            port = busy.getsockname()[1]
+        assert find_free_port(port, port + 1) == port
+
+    def test_falls_back_to_an_ephemeral_port_when_range_is_taken(self):
+        with _listening_socket() as busy:
+            port = busy.getsockname()[1]
+            free = find_free_port(port, port + 1)
+        assert free != port
+        assert free > 0
+
+    @pytest.mark.skipif(os.name == "nt", reason="SO_REUSEADDR n'est pas posé sous Windows")
+    def test_port_left_in_time_wait_is_reported_free(self):
+        # Like uvicorn's listener, which binds with SO_REUSEADDR on POSIX
+        with _listening_socket(reuse_addr=True) as server:
+            port = server.getsockname()[1]
+            client = socket.create_connection(("127.0.0.1", port))
+            conn, _ = server.accept()
+            # Closing the server side first leaves it in TIME_WAIT
+            conn.close()
+            client.close()
+        assert find_free_port(port, port + 1) == port
+
+
+class TestWaitForHealth:
+    def test_returns_once_the_server_answers(self):
+        import threading
+        from http.server import BaseHTTPRequestHandler, HTTPServer
+
+        class _Health(BaseHTTPRequestHandler):
+            def do_HEAD(self):
+                self.send_response(200)
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(("127.0.0.1", 0), _Health)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            assert wait_for_health(f"http://127.0.0.1:{server.server_port}/health", timeout=5)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_times_out_without_listener(self):
+        with _listening_socket() as busy:
+            port = busy.getsockname()[1]
+        assert not wait_for_health(f"http://127.0.0.1:{port}/health", timeout=0.2)
+
+    def test_probes_share_one_connection(self):
+        import threading
+        from http.server import BaseHTTPRequestHandler, HTTPServer
+
+        peers = []
+
+        class _Starting(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_HEAD(self):
+                peers.append(self.client_address)
+                self.send_response(200 if len(peers) >= 3 else 503)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(("127.0.0.1", 0), _Starting)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            assert wait_for_health(f"http://127.0.0.1:{server.server_port}/health", timeout=5)
+        finally:
+            server.shutdown()
+            server.server_close()
+        assert len(peers) == 3
+        assert len(set(peers)) == 1
+
+
+class TestWaitUntilStarted:
+    # uvicorn exits the serving thread with SystemExit when the bind fails
+    @pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+    def test_ready_once_listening_and_not_after_bind_failure(self):
+        pytest.importorskip("uvicorn")
+        import threading
+
+        import uvicorn
+
+        from spreadsheet_qa.web.launcher import _ready_server_class
+
+        async def _app(scope, receive, send):
+            pass
+
+        def _start(port):
+            config = uvicorn.Config(_app, host="127.0.0.1", port=port, lifespan="off", log_level="critical")
+            server = _ready_server_class()(config)
+            thread = threading.Thread(target=server.run, daemon=True)
+            thread.start()
+            return server, thread
+
+        port = find_free_port()
+        server, thread = _start(port)
+        try:
+            assert wait_until_started(server, timeout=10)
+            # Same port again: the bind fails and the thread ends
+            clash, clash_thread = _start(port)
+            assert not wait_until_started(clash, timeout=10)
+            clash_thread.join(5)
+            assert not clash_thread.is_alive()
+        finally:
+            server.should_exit = True
+            thread.join(5)
+
+
+def test_health_answers_head_without_body():
+    pytest.importorskip("fastapi")
+    pytest.importorskip("httpx")
+    from fastapi.testclient import TestClient
+
+    from spreadsheet_qa.web.app import app
+
+    resp = TestClient(app).head("/health")
+    assert resp.status_code == 200
+    assert resp.content == b""
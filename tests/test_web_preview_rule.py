@@ -114,3 +114,27 @@ def test_preview_rule_supports_new_presets(column_name, rows, config, valid_valu
 
     assert any(value == valid_value for value in data["sample_ok"])
     assert any(item["value"] == invalid_value for item in data["sample_fail"])
+
+
+def test_preview_rule_fail_samples_are_distinct_and_in_row_order():
+    rows = [["bad1"]] * 5 + [["bad2"], ["ok"], ["bad3"], ["bad4"]]
+    csv_bytes = _make_csv(["code"], rows)
+    resp = client.post(
+        "/api/jobs",
+        files={"file": ("data.csv", io.BytesIO(csv_bytes), "text/csv")},
+        data={"header_row": "1", "template_id": "generic_default", "overlay_id": ""},
+    )
+    assert resp.status_code == 200
+    job_id = resp.json()["job_id"]
+
+    preview = client.post(
+        f"/api/jobs/{job_id}/preview-rule",
+        json={"column": "code", "config": {"allowed_values": ["ok"]}},
+    )
+    assert preview.status_code == 200, preview.text
+    data = preview.json()
+
+    assert [item["value"] for item in data["sample_fail"]] == ["bad1", "bad2", "bad3"]
+    assert data["total_fail"] == 8
+    assert data["total_ok"] == 1
+    assert data["sample_ok"] == ["ok"]
@@ -279,3 +279,104 @@ class TestTemplateRoundTrip:
         assert resp.status_code == 200
         parsed = yaml.safe_load(resp.text)
         assert isinstance(parsed, dict)
+
+
+class TestSharedTemplateConfig:
+    def test_read_only_endpoints_leave_cached_config_intact(self):
+        from copy import deepcopy
+
+        from spreadsheet_qa.web.app import _shared_template_config
+        from spreadsheet_qa.web.jobs import job_manager
+
+        client = TestClient(app)
+        job_id = _upload_csv(client, _make_csv(["titre", "date"], [["Un titre", "2024"]]))
+        job = job_manager.get(job_id)
+        key = (job.template_id, job.overlay_id, ("titre", "date"))
+        shared = _shared_template_config(*key)
+        snapshot = deepcopy(shared)
+
+        assert client.get(f"/api/jobs/{job_id}/column-config").status_code == 200
+        assert client.get(f"/api/jobs/{job_id}/export-template").status_code == 200
+        assert client.post(f"/api/jobs/{job_id}/validate").status_code == 200
+
+        assert _shared_template_config(*key) is shared
+        assert shared == snapshot
+
+    def test_user_template_edited_on_disk_is_recompiled(self, tmp_path, monkeypatch):
+        from spreadsheet_qa.core.template_manager import TemplateManager
+        from spreadsheet_qa.web.app import _shared_template_config
+
+        monkeypatch.setattr(TemplateManager, "get_user_templates_dir", lambda self: tmp_path)
+        path = tmp_path / "edited_user_tpl.yml"
+        path.write_text("columns:\n  titre:\n    required: false\n", encoding="utf-8")
+        key = ("edited_user_tpl", None, ("titre",))
+        first = _shared_template_config(*key)
+        assert first["columns"]["titre"]["required"] is False
+        assert _shared_template_config(*key) is first
+
+        path.write_text(
+            "columns:\n  titre:\n    required: true\n    unique: true\n", encoding="utf-8"
+        )
+        edited = _shared_template_config(*key)
+        assert edited["columns"]["titre"]["required"] is True
+        assert edited["columns"]["titre"]["unique"] is True
+
+
+class TestTemplateYaml:
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "plain", "deux mots", "Accentué", "yes", "No", "null", "~", "", " lead", "trail ",
+            "a: b", "# c", "- d", "[e]", "{f}", "'g'", '"h"', "1", "1.5", "0x10", "2024-01-01",
+            "^\\d{4}$", "a\nb", "tab\there", "ctl\x7f\x85", "sep\u2028\u2029", "bom\ufeff",
+            "@x", "%y", "*z", "&w", "!v", "|u", ">t", "a.b/c-d_e",
+        ],
+    )
+    def test_string_values_round_trip(self, value):
+        from spreadsheet_qa.web.app import _template_yaml
+
+        template = {"k": value, value or "empty": [value], "n": {"v": value}}
+        assert yaml.safe_load(_template_yaml(template)) == template
+
+    def test_nested_structures_round_trip(self):
+        from spreadsheet_qa.web.app import _template_yaml
+
+        template = {
+            "name": "Mon modèle",
+            "rules": {"generic.required": {"enabled": True, "severity": "ERROR"}},
+            "columns": {
+                "titre": {"min_length": 3, "ratio": 0.5, "allowed_values": ["fra", "eng"]},
+                "vide": {"liste": [], "dict": {}, "none": None, "false": False},
+            },
+            "items": [{"a": 1, "b": [1, [2, 3]]}, [4, {"c": "d"}], {}, []],
+        }
+        assert yaml.safe_load(_template_yaml(template)) == template
+
+    def test_unhandled_values_fall_back_to_pyyaml(self):
+        from spreadsheet_qa.web.app import _template_yaml
+
+        template = {"big": 1e300, "tuple": ("a", "b")}
+        assert yaml.safe_load(_template_yaml(template)) == {"big": 1e300, "tuple": ["a", "b"]}
+
+
+class TestFilterColumnDefaults:
+    def test_defaults_and_empty_values_are_dropped_in_order(self):
+        from spreadsheet_qa.web.app import _filter_column_defaults
+
+        cfg = {
+            "unique": False,
+            "required": True,
+            "list_no_empty": True,
+            "allowed_values": [],
+            "regex": "",
+            "content_type": None,
+            "rare_threshold": 3,
+            "forbidden_chars": ["|"],
+            "similar_threshold": 85,
+        }
+        filtered = _filter_column_defaults(cfg)
+        assert list(filtered.items()) == [
+            ("required", True),
+            ("rare_threshold", 3),
+            ("forbidden_chars", ["|"]),
+        ]
@@ -0,0 +1,48 @@
+"""Limite de taille des uploads POST /api/jobs (écriture par blocs)."""
+
+from io import BytesIO
+
+import pytest
+from fastapi.testclient import TestClient
+
+from spreadsheet_qa.web.app import app
+from spreadsheet_qa.web.jobs import job_manager
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+def test_job_upload_over_limit_leaves_no_job(client, monkeypatch):
+    monkeypatch.setattr("spreadsheet_qa.web.app._MAX_UPLOAD_MB", 1)
+    monkeypatch.setattr("spreadsheet_qa.web.app._MAX_UPLOAD_BYTES", 1024 * 1024)
+    monkeypatch.setattr("spreadsheet_qa.web.app._UPLOAD_CHUNK_BYTES", 64 * 1024)
+
+    before = set(job_manager._jobs)
+    big = BytesIO(b"a;b\n" + b"x;y\n" * (400 * 1024))
+    r = client.post("/api/jobs", files={"file": ("big.csv", big, "text/csv")})
+    assert r.status_code == 413
+    assert "Mo" in r.json()["detail"]
+    assert set(job_manager._jobs) == before
+
+
+def test_job_upload_under_limit_is_loaded(client):
+    data = BytesIO(b"a;b\n" + b"x;y\n" * 3000)
+    r = client.post("/api/jobs", files={"file": ("ok.csv", data, "text/csv")})
+    assert r.status_code == 200
+    assert r.json()["rows"] == 3000
+
+
+def test_template_import_over_limit_is_rejected(client, monkeypatch):
+    monkeypatch.setattr("spreadsheet_qa.web.app._UPLOAD_CHUNK_BYTES", 1024)
+    data = BytesIO(b"a;b\nx;y\n")
+    job_id = client.post("/api/jobs", files={"file": ("ok.csv", data, "text/csv")}).json()["job_id"]
+
+    big = BytesIO(b"# " + b"x" * (1024 * 1024 + 10))
+    r = client.post(
+        f"/api/jobs/{job_id}/import-template",
+        files={"file": ("t.yml", big, "application/x-yaml")},
+    )
+    assert r.status_code == 413
+    assert "1 Mo" in r.json()["detail"]
@@ -124,3 +124,47 @@ def test_issues_report_applies_status_overrides_and_only_open_filter():
     assert export_open_resp.status_code == 200
     rows_open = list(csv.DictReader(io.StringIO(export_open_resp.content.decode("utf-8")), delimiter=";"))
     assert all(row["statut"] == "OPEN" for row in rows_open)
+
+
+def test_validate_reports_failed_exports_in_fixed_order(monkeypatch):
+    def _boom(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("spreadsheet_qa.web.app.TXTReporter.export", _boom)
+    monkeypatch.setattr("spreadsheet_qa.web.app.XLSXExporter.export", _boom)
+
+    job_id = _upload_csv(["langue"], [["fra"], ["eng"]])
+    resp = client.post(f"/api/jobs/{job_id}/validate")
+    assert resp.status_code == 200
+    assert resp.json()["avertissements_export"] == [
+        "Export Excel (nettoyé.xlsx) indisponible.",
+        "Export du rapport texte indisponible.",
+    ]
+    # The other two exports were still produced
+    assert client.get(f"/api/jobs/{job_id}/download/nettoye.csv").status_code == 200
+    assert client.get(f"/api/jobs/{job_id}/download/problemes.csv").status_code == 200
+
+
+def test_downloaded_issues_csv_follows_status_overrides():
+    job_id = _upload_and_validate()
+    issue_id = _get_first_issue_id(job_id)
+    if not issue_id:
+        pytest.skip("Aucun problème détecté dans le jeu de test")
+
+    client.put(f"/api/jobs/{job_id}/issues/{issue_id}/status", json={"status": "IGNORED"})
+    resp = client.get(f"/api/jobs/{job_id}/download/problemes.csv")
+    assert resp.status_code == 200
+    lines = [line for line in resp.content.decode("utf-8-sig").splitlines() if issue_id in line]
+    assert lines and ";IGNORED;" in lines[0]
+
+
+def test_download_supports_range_requests():
+    job_id = _upload_and_validate()
+    full = client.get(f"/api/jobs/{job_id}/download/nettoye.csv")
+    assert full.status_code == 200
+    assert full.headers["content-length"] == str(len(full.content))
+    assert full.headers["accept-ranges"] == "bytes"
+
+    partial = client.get(f"/api/jobs/{job_id}/download/nettoye.csv", headers={"Range": "bytes=0-9"})
+    assert partial.status_code == 206
+    assert partial.content == full.content[:10]